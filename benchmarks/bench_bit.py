@@ -0,0 +1,71 @@
+"""
+Microbenchmark for the `Bit` logic operations.
+
+This counts how many memory blocks are allocated from `Computer/Bit/bit.py` per
+operation (using `tracemalloc`) and times the operations with `timeit`. Since the
+logic operations hand back the canonical `Bit.ON`/`Bit.OFF` instances, the number of
+allocations per gate evaluation should be zero.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_bit.py
+"""
+
+import timeit
+import tracemalloc
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+N = 100_000
+# Number of operations per measurement.
+
+
+def allocations_per_call(func, number: int = N) -> float:
+    """Count the blocks allocated inside `bit.py` per call to `func`."""
+
+    func()  # warm up any lazily created caches
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(number):
+        func()
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    bit_file = [tracemalloc.Filter(True, "*Computer/Bit/bit.py")]
+    stats = after.filter_traces(bit_file).compare_to(
+        before.filter_traces(bit_file), "filename"
+    )
+    return sum(stat.count_diff for stat in stats) / number
+
+
+def main() -> None:
+    on, off = Bit(1), Bit(0)
+    gate = LogicGate(type=LogicType.AND, name="bench")
+    gate.set_input_pin(value=on, pin=0)
+    gate.set_input_pin(value=off, pin=1)
+
+    cases = {
+        "Bit.and_op": lambda: on.and_op(off),
+        "Bit.or_op": lambda: on.or_op(off),
+        "Bit.not_op": lambda: on.not_op(),
+        "Bit.trusted": lambda: Bit.trusted(1),
+        "LogicGate.get_output_pin": gate.get_output_pin,
+    }
+
+    results = {
+        name: (
+            allocations_per_call(func),
+            min(timeit.repeat(func, number=N, repeat=3)) / N * 1e9,
+        )
+        for name, func in cases.items()
+    }
+
+    print(f"{'operation':<28}{'bit allocs/call':>16}{'ns/call':>12}")
+    for name, (allocs, ns) in results.items():
+        print(f"{name:<28}{allocs:>16.3f}{ns:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
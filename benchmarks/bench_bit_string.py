@@ -0,0 +1,84 @@
+"""
+Benchmark for pushing and popping bits on a `BitString`.
+
+This pushes `N` bits onto one end of a bit string and then pops them all back off,
+for each combination of ends, and reports the time per operation. With the ring
+buffer storage every push and pop is O(1), so the time per operation should not
+depend on `N`.
+
+It then shifts `N` bits through a full 32-bit register, once with a pop and a push
+per bit and once in shift-register mode, where a single push evicts the oldest bit.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_bit_string.py [N]
+"""
+
+import sys
+import time
+
+from Computer.Bit import Bit, BitString, PackedBitString
+
+N = 1_000_000
+# Number of bits pushed and popped per run.
+
+
+def run(push: str, pop: str, number: int) -> float:
+    """Push `number` bits with `push`, pop them with `pop`, return the elapsed time."""
+
+    bits = BitString(max_length=number)
+    push_bit = getattr(bits, push)
+    pop_bit = getattr(bits, pop)
+    values = (Bit.OFF, Bit.ON)
+
+    start = time.perf_counter()
+    for i in range(number):
+        push_bit(values[i & 1])
+
+    for _ in range(number):
+        pop_bit()
+
+    return time.perf_counter() - start
+
+
+def shift(cls, shift_register: bool, number: int) -> float:
+    """Shift `number` bits through a full 32-bit register, return the elapsed time."""
+
+    bits = cls(max_length=32, shift_register=shift_register)
+    bits.extend_right(BitString.from_int(0, 32))
+    values = (Bit.OFF, Bit.ON)
+
+    start = time.perf_counter()
+    if shift_register:
+        for i in range(number):
+            bits.push_right(values[i & 1])
+    else:
+        for i in range(number):
+            bits.pop_left()
+            bits.push_right(values[i & 1])
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else N
+
+    print(f"{'push':<12}{'pop':<12}{'total (s)':>12}{'ns/op':>10}")
+    for push in ("push_left", "push_right"):
+        for pop in ("pop_left", "pop_right"):
+            elapsed = run(push, pop, number)
+            per_op = elapsed / (2 * number) * 1e9
+            print(f"{push:<12}{pop:<12}{elapsed:>12.3f}{per_op:>10.1f}")
+
+    print()
+    print(f"{'register':<18}{'mode':<16}{'total (s)':>12}{'ns/shift':>10}")
+    for cls in (BitString, PackedBitString):
+        for shift_register in (False, True):
+            elapsed = shift(cls, shift_register, number)
+            mode = "shift register" if shift_register else "pop + push"
+            per_shift = elapsed / number * 1e9
+            print(f"{cls.__name__:<18}{mode:<16}{elapsed:>12.3f}{per_shift:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Benchmark for the simulation engines against evaluating through the gates themselves.
+
+This builds a carry-save adder (a row of independent full adders, a few thousand
+primitive gates in all) and evaluates it with `Circuit.evaluate`, with and without
+`Memo`, with the compiled `Program`, and with the straight-line function generated from
+it. It then:
+
+- evaluates a chain of `NOT` gates wired through `Branch`es recursively
+  (`get_output_pin`) and with the explicit-stack `evaluate_iterative`;
+- evaluates a batch of vectors one at a time, with `evaluate_many` on a list (the
+  bit-parallel engine, compiling the circuit each time and reusing the compiled
+  `Program`) and on a NumPy array (the vectorized engine), and with one
+  bit-parallel pass over vectors that are already packed;
+- flips one input at a time, re-running the `Program` each time and propagating only
+  the change with the `EventSimulator`;
+- builds the truth table of a 16-input circuit row by row, and with the Gray-code walk
+  of `truth_table`.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_engine.py
+"""
+
+import random
+import timeit
+
+import numpy as np
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit import Circuit, CompoundGate, CompoundType, Memo
+from Computer.LogicCircuit.Connection import Branch, Connection
+from Computer.LogicCircuit.Engine import (EventSimulator, compile_circuit,
+                                          compile_function, disagreements,
+                                          evaluate_iterative, evaluate_many, pack,
+                                          run_parallel, truth_table)
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+WIDTH = 256
+# Number of full adders.
+
+DEPTH = 150
+# Number of gates in the chain (the recursive evaluation must stay under the recursion
+# limit).
+
+N = 20
+# Number of evaluations per measurement.
+
+BATCH = 64
+# Number of vectors in a batch.
+
+ARRAY = 100_000
+# Number of vectors in a batch for the vectorized engine.
+
+PACKED = 4_096
+# Number of vectors in one bit-parallel pass.
+
+WAYS, FAN_DEPTH = 16, 20
+# Number of inputs and length of their chains in the truth-table circuit.
+
+
+def wire(source, target, pin=0):
+    conn = Connection()
+    conn.set_input_connection(device=source)
+    conn.set_output_connection(device=target, index=pin)
+
+
+def build_adder(width: int) -> Circuit:
+    """Build a carry-save adder of three `width`-bit numbers."""
+
+    circuit = Circuit()
+    for i in range(width):
+        xor_0 = CompoundGate(type=CompoundType.XOR)
+        xor_1 = CompoundGate(type=CompoundType.XOR)
+        and_0 = LogicGate(type=LogicType.AND)
+        and_1 = LogicGate(type=LogicType.AND)
+        or_0 = LogicGate(type=LogicType.OR)
+        branch = Branch()
+        wire(xor_0, branch)
+        wire(branch, xor_1, pin=0)
+        wire(branch, and_1, pin=0)
+        branch.set_mapping(mapping={0: 0, 1: 0})
+        wire(and_0, or_0, pin=0)
+        wire(and_1, or_0, pin=1)
+
+        circuit.add_input((xor_0, 0), (and_0, 0), name=f"a{i}")
+        circuit.add_input((xor_0, 1), (and_0, 1), name=f"b{i}")
+        circuit.add_input((xor_1, 1), (and_1, 1), name=f"c{i}")
+        circuit.add_output(xor_1, name=f"sum{i}")
+        circuit.add_output(or_0, name=f"carry{i}")
+
+    return circuit
+
+
+def build_chain(depth: int) -> LogicGate:
+    """Build a chain of `NOT` gates joined by branches and return the last one."""
+
+    gate = LogicGate(type=LogicType.NOT)
+    gate.set_input_pin(value=Bit(0), pin=0)
+    for _ in range(depth - 1):
+        branch = Branch()
+        wire(gate, branch)
+        gate = LogicGate(type=LogicType.NOT)
+        wire(branch, gate)
+        branch.set_mapping(mapping={0: 0})
+
+    return gate
+
+
+def build_fans(ways: int, depth: int) -> Circuit:
+    """Build `ways` chains of `depth` `NOT` gates, one per input, ANDed together."""
+
+    circuit = Circuit()
+    level = []
+    for i in range(ways):
+        gate = LogicGate(type=LogicType.NOT)
+        circuit.add_input((gate, 0), name=f"x{i}")
+        for _ in range(depth - 1):
+            upper = LogicGate(type=LogicType.NOT)
+            wire(gate, upper)
+            gate = upper
+
+        level.append(gate)
+
+    while len(level) > 1:
+        upper = [LogicGate(type=LogicType.AND) for _ in range(len(level) // 2)]
+        for i, gate in enumerate(level):
+            wire(gate, upper[i // 2], pin=i % 2)
+
+        level = upper
+
+    circuit.add_output(level[0])
+    return circuit
+
+
+def main() -> None:
+    circuit = build_adder(WIDTH)
+    program = compile_circuit(circuit)
+    rng = random.Random(0)
+    vector = [rng.getrandbits(1) for _ in range(len(circuit.input_names))]
+    function = compile_function(program)
+    assert not disagreements(circuit, program.run, [vector] * 4)
+    assert not disagreements(circuit, lambda v: function(*v), [vector] * 4)
+
+    timings = {}
+    timings["gates"] = min(
+        timeit.repeat(lambda: circuit.evaluate(vector), number=N, repeat=3)
+    )
+    Memo.enable()
+    timings["gates+memo"] = min(
+        timeit.repeat(lambda: circuit.evaluate(vector), number=N, repeat=3)
+    )
+    Memo.disable()
+    timings["compiled"] = min(
+        timeit.repeat(lambda: program.run(vector), number=N, repeat=3)
+    )
+
+    timings["generated"] = min(
+        timeit.repeat(lambda: function(*vector), number=N, repeat=3)
+    )
+
+    print(f"{len(circuit)} devices, {len(program)} instructions")
+    print(f"{'engine':>12}{'per evaluation (us)':>22}{'speedup':>10}")
+    for name, timing in timings.items():
+        speedup = timings["gates"] / timing
+        print(f"{name:>12}{timing / N * 1e6:>22.1f}{speedup:>10.1f}")
+
+    gate = build_chain(DEPTH)
+    recursive = min(timeit.repeat(gate.get_output_pin, number=N, repeat=3))
+    iterative = min(
+        timeit.repeat(lambda: evaluate_iterative(gate), number=N, repeat=3)
+    )
+    print(f"\n{DEPTH}-gate chain")
+    print(f"{'recursive':>12}{recursive / N * 1e6:>22.1f}")
+    print(f"{'iterative':>12}{iterative / N * 1e6:>22.1f}")
+
+    vectors = [
+        [rng.getrandbits(1) for _ in range(len(circuit.input_names))]
+        for _ in range(BATCH)
+    ]
+    one_by_one = min(
+        timeit.repeat(
+            lambda: [circuit.evaluate(v) for v in vectors], number=1, repeat=3
+        )
+    )
+    batched = min(
+        timeit.repeat(lambda: evaluate_many(circuit, vectors), number=1, repeat=3)
+    )
+    precompiled = min(
+        timeit.repeat(lambda: evaluate_many(program, vectors), number=1, repeat=3)
+    )
+    print("\nbatches (per vector)")
+    print(f"{'one by one':>12}{one_by_one / BATCH * 1e6:>22.1f}")
+    array = np.random.default_rng(0).integers(0, 2, size=(ARRAY, len(vectors[0])))
+    vectorized = min(
+        timeit.repeat(lambda: evaluate_many(circuit, array), number=1, repeat=3)
+    )
+    print(f"{'batched':>12}{batched / BATCH * 1e6:>22.1f}")
+    print(f"{'precompiled':>12}{precompiled / BATCH * 1e6:>22.1f}")
+    print(f"{'vectorized':>12}{vectorized / ARRAY * 1e6:>22.3f}  ({ARRAY} vectors)")
+
+    words = pack(array[:PACKED].tolist(), array.shape[1])
+    parallel = min(
+        timeit.repeat(
+            lambda: run_parallel(program, words, PACKED), number=1, repeat=3
+        )
+    )
+    print(f"{'packed':>12}{parallel / PACKED * 1e6:>22.3f}  ({PACKED} vectors)")
+
+    simulator = EventSimulator(program, vector)
+    flips = [rng.randrange(len(vector)) for _ in range(N)]
+
+    def rerun():
+        for index in flips:
+            vector[index] ^= 1
+            program.run(vector)
+
+    def propagate():
+        for index in flips:
+            simulator.toggle(index)
+
+    rerun_time = min(timeit.repeat(rerun, number=1, repeat=3))
+    propagate_time = min(timeit.repeat(propagate, number=1, repeat=3))
+    print("\none input flipped per step")
+    print(f"{'compiled':>12}{rerun_time / N * 1e6:>22.1f}")
+    print(f"{'event':>12}{propagate_time / N * 1e6:>22.1f}")
+
+    small = compile_circuit(build_fans(WAYS, FAN_DEPTH))
+    width = len(small.input_slots)
+    count = 1 << width
+    patterns = [[k >> (width - 1 - i) & 1 for i in range(width)] for k in range(count)]
+    rows = min(
+        timeit.repeat(lambda: [small.run(p) for p in patterns], number=1, repeat=3)
+    )
+    gray = min(timeit.repeat(lambda: truth_table(small), number=1, repeat=3))
+    print(f"\n{count}-row truth table (per row)")
+    print(f"{'compiled':>12}{rows / count * 1e6:>22.2f}")
+    print(f"{'gray code':>12}{gray / count * 1e6:>22.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark for the cost of logging while evaluating a circuit.
+
+This evaluates a chain of `NOT` gates wired together with `Connection`s with logging
+switched off (the default), printing synchronously to a file, and handed off to the
+background `AsyncSink` writing to the same kind of file, and with the binary
+`TraceRecorder` recording instead of logging.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_logger.py
+"""
+
+import os
+import tempfile
+import timeit
+
+from Computer.Bit import Bit
+from Computer.Logger import OUT, TraceRecorder
+from Computer.LogicCircuit.Connection import Connection
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+DEPTH = 50
+# Number of gates in the chain.
+
+N = 200
+# Number of evaluations per measurement.
+
+
+def build_chain(depth: int) -> LogicGate:
+    """Build a chain of `NOT` gates and return the last one."""
+
+    gate = LogicGate(type=LogicType.NOT)
+    gate.set_input_pin(value=Bit(0), pin=0)
+    for _ in range(depth - 1):
+        conn = Connection()
+        conn.set_input_connection(device=gate)
+        gate = LogicGate(type=LogicType.NOT)
+        conn.set_output_connection(device=gate, index=0)
+
+    return gate
+
+
+def main() -> None:
+    gate = build_chain(DEPTH)
+    timings = {}
+
+    timings["off"] = min(timeit.repeat(gate.get_output_pin, number=N, repeat=3))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "sync.log"), "w") as f:
+            OUT.configure(stream=f)
+            timings["sync"] = min(
+                timeit.repeat(gate.get_output_pin, number=N, repeat=3)
+            )
+
+        sink = OUT.configure_async(os.path.join(tmp, "async.log"), max_size=100_000)
+        timings["async"] = min(timeit.repeat(gate.get_output_pin, number=N, repeat=3))
+        OUT.disable()
+        sink.close()
+
+    with TraceRecorder(capacity=1 << 16):
+        timings["trace"] = min(timeit.repeat(gate.get_output_pin, number=N, repeat=3))
+
+    print(f"{'logging':>8}{'per evaluation (us)':>22}")
+    for name, timing in timings.items():
+        print(f"{name:>8}{timing / N * 1e6:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark for whole-string logic on packed bit strings.
+
+This compares `and`-ing two 32- and 64-bit strings one `Bit.and_op` at a time with a
+single `PackedBitString.and_op`.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_packed_bit_string.py
+"""
+
+import random
+import timeit
+
+from Computer.Bit import Bit, BitString, PackedBitString
+
+N = 20_000
+# Number of whole-string operations per measurement.
+
+
+def build(cls, width: int, seed: int):
+    """Build a random bit string of the given class and width."""
+
+    rng = random.Random(seed)
+    bits = cls(max_length=width)
+    for _ in range(width):
+        bits.push_right(Bit.trusted(rng.getrandbits(1)))
+
+    return bits
+
+
+def per_bit_and(left: BitString, right: BitString) -> BitString:
+    """And two bit strings together one bit at a time."""
+
+    out = BitString(max_length=left.max_length)
+    for a, b in zip(left, right):
+        out.push_right(a.and_op(b))
+
+    return out
+
+
+def main() -> None:
+    print(f"{'width':>6}{'per-bit (us)':>16}{'packed (us)':>14}{'speedup':>10}")
+    for width in (32, 64):
+        left, right = build(BitString, width, 0), build(BitString, width, 1)
+        packed_left = build(PackedBitString, width, 0)
+        packed_right = build(PackedBitString, width, 1)
+
+        slow = min(timeit.repeat(lambda: per_bit_and(left, right), number=N, repeat=3))
+        fast = min(
+            timeit.repeat(
+                lambda: packed_left.and_op(packed_right), number=N, repeat=3
+            )
+        )
+        print(
+            f"{width:>6}{slow / N * 1e6:>16.2f}{fast / N * 1e6:>14.2f}"
+            f"{slow / fast:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark for spreading batch evaluation over worker processes.
+
+This runs a batch of random vectors through the 256-bit carry-save adder of
+`bench_engine.py`, and every input pattern of a 7-bit one, with the bit-parallel engine
+in this process and with a `ShardedRunner` using 1, 2, 4, ... worker processes up to
+the number of CPUs.
+
+Run it from the repository root with:
+
+    PYTHONPATH=src python benchmarks/bench_pool.py
+"""
+
+import os
+import random
+import time
+
+from bench_engine import build_adder
+
+from Computer.LogicCircuit.Engine import (ShardedRunner, compile_circuit, pack,
+                                          run_exhaustive, run_parallel, unpack)
+
+VECTORS = 16_384
+# Number of random vectors.
+
+SHARD_SIZE = 1 << 11
+# Number of vectors (or patterns) in each shard.
+
+
+def timed(function):
+    start = time.perf_counter()
+    ret = function()
+    return ret, time.perf_counter() - start
+
+
+def measure(program, serial, sharded) -> None:
+    expected, timing = timed(lambda: serial(program))
+    timings = {"serial": timing}
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ShardedRunner(program, workers=workers, shard_size=SHARD_SIZE) as runner:
+            # Start the workers before timing.
+            runner.run([[0] * len(program.input_slots)] * workers)
+            ret, timings[f"{workers} workers"] = timed(lambda: sharded(runner))
+            assert ret == expected
+
+        workers *= 2
+
+    print(f"{'engine':>12}{'time (ms)':>12}{'speedup':>10}")
+    for name, timing in timings.items():
+        speedup = timings["serial"] / timing
+        print(f"{name:>12}{timing * 1e3:>12.1f}{speedup:>10.1f}")
+
+
+def main() -> None:
+    program = compile_circuit(build_adder(256))
+    rng = random.Random(0)
+    width = len(program.input_slots)
+    vectors = [[rng.getrandbits(1) for _ in range(width)] for _ in range(VECTORS)]
+    print(f"{VECTORS} random vectors, {len(program)} instructions")
+    measure(
+        program,
+        lambda p: unpack(run_parallel(p, pack(vectors, width), VECTORS), VECTORS),
+        lambda runner: runner.run(vectors),
+    )
+
+    program = compile_circuit(build_adder(7))
+    print(f"\n{1 << len(program.input_slots)} patterns, {len(program)} instructions")
+    measure(program, run_exhaustive, lambda runner: runner.run_exhaustive())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,10 @@
 from .bit import Bit  # noqa: F401
-from .bit_string import BitString  # noqa: F401
+from .bit_string import BitString, BitStringView, FrozenBitString  # noqa: F401
+from .packed_bit_string import PackedBitString  # noqa: F401
+from .mapped_bit_string import MappedBitString  # noqa: F401
+
+try:
+    from .bit_matrix import BitMatrix  # noqa: F401
+except ImportError:
+    # NumPy is an optional dependency: only `BitMatrix` needs it.
+    pass
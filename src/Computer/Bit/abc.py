@@ -14,6 +14,8 @@ class IBit(metaclass=abc.ABCMeta):
     This implements a single bit to be passed around.
     """
 
+    __slots__ = ()
+
     @abc.abstractclassmethod
     def __init__(self, value: E):
         """Constructor..."""
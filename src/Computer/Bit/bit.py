@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import enum
-from typing import Union
+from typing import Dict, Tuple, Union
 
 from Computer.Bit.abc import IBit
 
@@ -33,27 +33,69 @@ class Bit(IBit):
     This implements a bit class. This ensures that the user doesn't send bad data
     along the circuitry. It simply holds the intended value the user wants to send.
 
+    There are only ever two instances of this class: `Bit.OFF` and `Bit.ON`. The
+    constructor validates the value and hands back the matching shared instance, and
+    the logic operations return those instances directly, so evaluating a gate never
+    allocates a new bit. Because the instances are shared, bits are immutable and
+    hashable.
+
     Attributes:
         value: the value of the bit (private)
+        OFF:   the canonical off/0/false bit (class attribute)
+        ON:    the canonical on/1/true bit (class attribute)
     """
 
-    def __init__(self, value: BitValueType):
+    __slots__ = ("_value",)
+
+    OFF: Bit
+    ON: Bit
+
+    _interned: Dict[BitValue, Bit] = {}
+    """
+    The canonical instances, keyed by their value.
+
+    Type:
+        Dict[BitValue, Bit]
+    """
+
+    def __new__(cls, value: BitValueType) -> Bit:
         """
-        Constructor...
+        Validate the value and return the matching canonical instance.
 
         Args:
             value:
                 The value of the bit.
         """
 
-        self._value: BitValue = self._convert_to_bit_value(value)
+        return cls._interned[cls._convert_to_bit_value(value)]
+
+    def __init__(self, value: BitValueType):
         """
-        The value of the bit.
+        Constructor... the value has already been validated and assigned in
+        `__new__`, so there is nothing left to do here.
 
-        Type:
-            BitValue
+        Args:
+            value:
+                The value of the bit.
         """
 
+        ...
+
+    def __copy__(self) -> Bit:
+        """Bits are immutable, so a copy is the bit itself."""
+
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Bit:
+        """Bits are immutable, so a copy is the bit itself."""
+
+        return self
+
+    def __delattr__(self, name: str) -> None:
+        """Bits are immutable: refuse to delete any attribute."""
+
+        raise BitError("Bits are immutable!")
+
     def __eq__(self, other: Bit) -> bool:
         """
         Overrides Python's `'=='` operator: checks if two bits are the same.
@@ -67,8 +109,26 @@ class Bit(IBit):
                 ...
         """
 
+        if not isinstance(other, Bit):
+            return NotImplemented
+
         return self._value == other._value
 
+    def __hash__(self) -> int:
+        """Overrides Python's built-in `hash` function: equal bits hash equally."""
+
+        return hash(self._value.value)
+
+    def __reduce__(self) -> Tuple[type, Tuple[int]]:
+        """Pickle the bit by value so that unpickling gives the canonical instance."""
+
+        return (Bit, (self._value.value,))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Bits are immutable: refuse to set any attribute."""
+
+        raise BitError("Bits are immutable!")
+
     def __str__(self) -> str:
         """A string representation of the bit."""
 
@@ -77,7 +137,30 @@ class Bit(IBit):
         elif self._value == BitValue.ON:
             return "Bit(ON)"
 
-    def _convert_to_bit_value(self, value: BitValueType) -> BitValue:
+    @classmethod
+    def _intern(cls, value: BitValue) -> Bit:
+        """
+        This builds the canonical instance for `value`. It is only called once per
+        value, when the module is imported.
+
+        This is a private method.
+
+        Args:
+            value:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        bit: Bit = object.__new__(cls)
+        object.__setattr__(bit, "_value", value)
+        cls._interned[value] = bit
+        return bit
+
+    @staticmethod
+    def _convert_to_bit_value(value: BitValueType) -> BitValue:
         """
         This will try to convert the value inputted by the user into a `BitValue` enum
         type. Valid `value` types include integers, strings, or other Boolean values.
@@ -110,6 +193,24 @@ class Bit(IBit):
         except (ValueError, TypeError):
             raise BitError("Entered something that cannot be handled!")
 
+    @staticmethod
+    def trusted(value: int) -> Bit:
+        """
+        This is the fast constructor: it returns the canonical bit for `value` without
+        any validation. It is meant for internal callers that already know they are
+        holding a `0`/`1` (or `False`/`True`); anything else gives undefined results.
+
+        Args:
+            value:
+                Either `0` or `1`.
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return _BITS[value]
+
     def and_op(self, other: Bit) -> Bit:
         """
         This implements a custom `'and'` operation: returns an `'ON'` bit only if both
@@ -124,7 +225,7 @@ class Bit(IBit):
                 ...
         """
 
-        return Bit(self._value.value and other._value.value)
+        return other if self._value is BitValue.ON else self
 
     def not_op(self) -> Bit:
         """
@@ -135,7 +236,7 @@ class Bit(IBit):
                 ...
         """
 
-        return Bit(not self._value.value)
+        return Bit.OFF if self._value is BitValue.ON else Bit.ON
 
     def or_op(self, other: Bit) -> Bit:
         """
@@ -151,4 +252,12 @@ class Bit(IBit):
                 ...
         """
 
-        return Bit(self._value.value or other._value.value)
+        return self if self._value is BitValue.ON else other
+
+
+Bit.OFF = Bit._intern(BitValue.OFF)
+Bit.ON = Bit._intern(BitValue.ON)
+
+_BITS = (Bit.OFF, Bit.ON)
+# Lookup table used by `Bit.trusted`: indexing a tuple is the cheapest way to go from
+# a trusted integer to the canonical bit.
@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from Computer.Bit.abc import IBitString
+
+from .bit import BitError
+from .bit_string import BitString
+from .packed_bit_string import pack_bits
+
+
+class BitMatrix:
+
+    """
+    This implements a batch of equal-length bit vectors, stored as a NumPy `uint8`
+    array with one row per vector. Each row is packed eight bits to a byte, most
+    significant bit first, exactly like `BitString.to_bytes` (but padded with `'OFF'`
+    bits on the right rather than the left). The padding bits are always kept `'OFF'`.
+
+    Whole-matrix `and`, `or`, `xor` and `not` are single vectorized NumPy operations,
+    so they cost the same number of Python calls no matter how many rows there are.
+
+    Attributes:
+        width:  the number of bits in each row (private)
+        data:   the packed bits, one row per vector (private)
+    """
+
+    def __init__(self, rows: int, width: int):
+        """
+        Constructor... builds a matrix of `'OFF'` bits.
+
+        Args:
+            rows:
+                The number of bit vectors.
+            width:
+                The number of bits in each vector.
+        """
+
+        self._width: int = width
+        """
+        The number of bits in each row.
+
+        Type:
+            int
+        """
+
+        self._data: np.ndarray = np.zeros((rows, (width + 7) // 8), dtype=np.uint8)
+        """
+        The packed bits, one row per vector.
+
+        Type:
+            np.ndarray
+        """
+
+    def __eq__(self, other: BitMatrix) -> bool:
+        """
+        Overrides Python's `'=='` operator: two matrices are the same if they hold the
+        same bits.
+        """
+
+        if not isinstance(other, BitMatrix):
+            return NotImplemented
+
+        return self._width == other._width and np.array_equal(self._data, other._data)
+
+    __hash__ = None
+    # Matrices are mutable, so they can't be hashed.
+
+    def __getitem__(self, index: int) -> BitString:
+        """This returns a copy of one row as a `BitString`."""
+
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[BitString]:
+        """This allows one to iterate over the rows as `BitString` instances."""
+
+        return iter(self.to_bit_strings())
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of rows.
+        """
+
+        return self._data.shape[0]
+
+    def __str__(self) -> str:
+        """
+        This overrides Python's built-in `str` function: it returns one line of
+        bit-text per row.
+        """
+
+        return "\n".join(row.to_text() for row in self)
+
+    @property
+    def data(self) -> np.ndarray:
+        """Get the packed `uint8` array backing the matrix (not a copy)."""
+
+        return self._data
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Get the number of rows and the number of bits in each row."""
+
+        return len(self), self._width
+
+    @property
+    def width(self) -> int:
+        """Get the number of bits in each row."""
+
+        return self._width
+
+    @property
+    def _padding(self) -> int:
+        """Get the number of padding bits at the end of each packed row."""
+
+        return 8 * self._data.shape[1] - self._width
+
+    def _check_shape(self, other: BitMatrix) -> None:
+        """
+        This makes sure another matrix has the same shape as this one.
+
+        This is a private method.
+
+        Raises:
+            BitError:
+                The bit matrices have different shapes!
+        """
+
+        if self.shape != other.shape:
+            raise BitError("The bit matrices have different shapes!")
+
+    def _new(self, data: np.ndarray) -> BitMatrix:
+        """
+        This wraps a packed array with the same width as this matrix.
+
+        This is a private method.
+        """
+
+        matrix: BitMatrix = BitMatrix(0, self._width)
+        matrix._data = data
+        return matrix
+
+    def _row_bytes(self, bits: IBitString) -> bytes:
+        """
+        This packs a bit string into the bytes of one row.
+
+        This is a private method.
+
+        Raises:
+            BitError:
+                The bit string has {length} bits, but the rows have {width}!
+        """
+
+        if len(bits) != self._width:
+            raise BitError(
+                f"The bit string has {len(bits)} bits, but the rows have "
+                f"{self._width}!"
+            )
+
+        return (pack_bits(bits) << self._padding).to_bytes(self._data.shape[1], "big")
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> BitMatrix:
+        """
+        This builds a matrix from a 2D array of zeros and ones (or Booleans), one row
+        per bit vector.
+
+        Args:
+            array:
+                ...
+
+        Returns:
+            matrix:
+                ...
+        """
+
+        array = np.asarray(array)
+        if array.ndim != 2:
+            raise BitError("Bit matrices can only be built from 2D arrays!")
+
+        matrix: BitMatrix = cls(0, array.shape[1])
+        matrix._data = np.packbits(array.astype(bool), axis=1)
+        return matrix
+
+    @classmethod
+    def from_bit_strings(
+        cls, bit_strings: Iterable[IBitString], *, width: Optional[int] = None
+    ) -> BitMatrix:
+        """
+        This builds a matrix with one row per bit string.
+
+        Args:
+            bit_strings:
+                The bit vectors, which all need to be the same length.
+            width:
+                The number of bits in each row. Defaults to the length of the first bit
+                string, and needs to be given if there are no bit strings.
+
+        Returns:
+            matrix:
+                ...
+        """
+
+        bit_strings = list(bit_strings)
+        if width is None:
+            if not bit_strings:
+                raise BitError("The width is needed to build an empty bit matrix!")
+
+            width = len(bit_strings[0])
+
+        for bits in bit_strings:
+            if len(bits) != width:
+                raise BitError(
+                    f"The bit string has {len(bits)} bits, but the rows have {width}!"
+                )
+
+        return cls.from_ints([pack_bits(bits) for bits in bit_strings], width)
+
+    @classmethod
+    def from_ints(cls, values: Sequence[int], width: int) -> BitMatrix:
+        """
+        This builds a matrix with one row per integer, most significant bit on the
+        left (like `BitString.from_int`).
+
+        Args:
+            values:
+                Non-negative integers that each fit into `width` bits.
+            width:
+                The number of bits in each row.
+
+        Returns:
+            matrix:
+                ...
+        """
+
+        matrix: BitMatrix = cls(0, width)
+        row_bytes: int = matrix._data.shape[1]
+        padding: int = matrix._padding
+        for value in values:
+            if value < 0 or value >> width:
+                raise BitError(f"{value} does not fit into {width} bits!")
+
+        data: bytes = b"".join(
+            (value << padding).to_bytes(row_bytes, "big") for value in values
+        )
+        matrix._data = (
+            np.frombuffer(data, dtype=np.uint8).reshape(len(values), row_bytes).copy()
+        )
+        return matrix
+
+    def and_op(self, other: BitMatrix) -> BitMatrix:
+        """
+        This implements a bitwise `'and'` of two matrices of the same shape.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        self._check_shape(other)
+        return self._new(np.bitwise_and(self._data, other._data))
+
+    def column(self, index: int) -> np.ndarray:
+        """
+        This gets one bit position across every row, as a `uint8` array of zeros and
+        ones.
+
+        Args:
+            index:
+                ...
+
+        Returns:
+            column:
+                ...
+        """
+
+        if not 0 <= index < self._width:
+            raise BitError(f"Index {index} lies outside the bit matrix width!")
+
+        return (self._data[:, index >> 3] >> (7 - (index & 7))) & 1
+
+    def not_op(self) -> BitMatrix:
+        """
+        This implements a bitwise `'not'`: every bit in the matrix is reversed (the
+        padding bits stay `'OFF'`).
+
+        Returns:
+            ret:
+                ...
+        """
+
+        data: np.ndarray = np.invert(self._data)
+        if self._padding and data.shape[1]:
+            data[:, -1] &= np.uint8((0xFF << self._padding) & 0xFF)
+
+        return self._new(data)
+
+    def or_op(self, other: BitMatrix) -> BitMatrix:
+        """
+        This implements a bitwise `'or'` of two matrices of the same shape.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        self._check_shape(other)
+        return self._new(np.bitwise_or(self._data, other._data))
+
+    def row(self, index: int) -> BitString:
+        """
+        This gets a copy of one row as a `BitString`.
+
+        Args:
+            index:
+                ...
+
+        Returns:
+            bits:
+                ...
+        """
+
+        if not 0 <= index < len(self):
+            raise BitError(f"Index {index} lies outside the bit matrix length!")
+
+        value: int = int.from_bytes(self._data[index].tobytes(), "big")
+        return BitString.from_int(value >> self._padding, self._width)
+
+    def set_column(self, index: int, values: Sequence[int]) -> None:
+        """
+        This overwrites one bit position across every row.
+
+        Args:
+            index:
+                ...
+            values:
+                One zero or one (or Boolean) per row.
+        """
+
+        if not 0 <= index < self._width:
+            raise BitError(f"Index {index} lies outside the bit matrix width!")
+
+        mask: np.uint8 = np.uint8(0x80 >> (index & 7))
+        values = np.asarray(values).astype(bool)
+        column: np.ndarray = self._data[:, index >> 3]
+        self._data[:, index >> 3] = np.where(values, column | mask, column & ~mask)
+
+    def set_row(self, index: int, bits: IBitString) -> None:
+        """
+        This overwrites one row with a bit string of the same width.
+
+        Args:
+            index:
+                ...
+            bits:
+                ...
+        """
+
+        if not 0 <= index < len(self):
+            raise BitError(f"Index {index} lies outside the bit matrix length!")
+
+        self._data[index] = np.frombuffer(self._row_bytes(bits), dtype=np.uint8)
+
+    def to_array(self) -> np.ndarray:
+        """
+        This unpacks the matrix into a 2D `uint8` array of zeros and ones, one row per
+        bit vector.
+
+        Returns:
+            array:
+                ...
+        """
+
+        return np.unpackbits(self._data, axis=1, count=self._width)
+
+    def to_bit_strings(self) -> List[BitString]:
+        """
+        This unpacks the matrix into one `BitString` per row.
+
+        Returns:
+            bit_strings:
+                ...
+        """
+
+        return [self.row(index) for index in range(len(self))]
+
+    def to_ints(self) -> List[int]:
+        """
+        This unpacks the matrix into one integer per row, most significant bit on the
+        left.
+
+        Returns:
+            values:
+                ...
+        """
+
+        width: int = self._data.shape[1]
+        if width == 0:
+            return [0] * len(self)
+
+        data: bytes = self._data.tobytes()
+        return [
+            int.from_bytes(data[start : start + width], "big") >> self._padding
+            for start in range(0, len(data), width)
+        ]
+
+    def xor_op(self, other: BitMatrix) -> BitMatrix:
+        """
+        This implements a bitwise `'xor'` of two matrices of the same shape.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        self._check_shape(other)
+        return self._new(np.bitwise_xor(self._data, other._data))
@@ -1,30 +1,406 @@
 from __future__ import annotations
 
-from typing import List
+import itertools
+import operator
+from typing import (Callable, Iterable, Iterator, List, Optional, Tuple, Type,
+                    TypeVar, Union)
 
 from Computer.Bit.abc import IBitString
 
 from .bit import Bit, BitError
 
+S = TypeVar("S", bound="BitConversions")
+# This is to represent whichever bit string class a bulk constructor is called on.
 
-class BitString(IBitString):
+CHARS = {"0": Bit.OFF, "1": Bit.ON}
+# Maps the characters produced by `format(value, "b")` back onto the canonical bits.
+
+_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+# Translates the `False`/`True` bytes produced by `_is_on` into `0`/`1` characters.
+
+
+def _is_on(bits: Iterable[Bit]) -> bytes:
+    """
+    This turns a run of bits into one byte per bit (`0` or `1`). It only uses C-level
+    iteration (`map` over `operator.is_`), so it never runs a Python loop per bit.
+
+    This is a private function.
+
+    Args:
+        bits:
+            ...
+
+    Returns:
+        flags:
+            ...
+    """
+
+    return bytes(map(operator.is_, bits, itertools.repeat(Bit.ON)))
+
+
+def slice_window(index: slice, length: int) -> Tuple[int, int]:
+    """
+    This turns a slice into the `(start, length)` window it covers in a bit string of
+    the given length. Only contiguous slices (a step of one) can be shared as a view.
+
+    NOTE:
+        This function is marked public so that every bit string class can share it,
+        though it is not meant to be called by the user.
+
+    Args:
+        index:
+            The slice given to `__getitem__`.
+        length:
+            The length of the bit string being sliced.
+
+    Returns:
+        window:
+            The offset of the first bit and the number of bits in the slice.
+
+    Raises:
+        BitError:
+            Only contiguous slices of a bit string can be taken!
+    """
+
+    start, stop, step = index.indices(length)
+    if step != 1:
+        raise BitError("Only contiguous slices of a bit string can be taken!")
+
+    return start, max(stop - start, 0)
+
+
+class BitConversions:
+
+    """
+    This adds the bulk conversions shared by every bit string class: to and from a
+    Python integer, `bytes` and compact bit-text such as `"1011"`. The left-most bit is
+    always the most significant bit. Everything is done with `int`, `format` and
+    `bytes` built-ins instead of one Python operation per bit.
+
+    Classes using this need to provide `from_int` and `_range_to_int`.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_bytes(cls: Type[S], data: bytes, *, max_length: Optional[int] = None) -> S:
+        """
+        This builds a bit string holding every bit of `data`, first byte on the left
+        and the most significant bit of each byte first.
+
+        Args:
+            data:
+                ...
+            max_length:
+                The maximum number of bits the result can hold. Defaults to the number
+                of bits in `data`.
+
+        Returns:
+            bits:
+                ...
+        """
+
+        return cls.from_int(
+            int.from_bytes(data, "big"), 8 * len(data), max_length=max_length
+        )
+
+    @classmethod
+    def from_text(cls: Type[S], text: str, *, max_length: Optional[int] = None) -> S:
+        """
+        This builds a bit string from compact bit-text, e.g. `"1011"`.
+
+        Args:
+            text:
+                A string made up of only `0` and `1` characters.
+            max_length:
+                The maximum number of bits the result can hold. Defaults to the length
+                of `text`.
+
+        Returns:
+            bits:
+                ...
+
+        Raises:
+            BitError:
+                {text} is not made up of only 0s and 1s!
+        """
+
+        if text.strip("01"):
+            raise BitError(f"{text} is not made up of only 0s and 1s!")
+
+        return cls.from_int(int(text or "0", 2), len(text), max_length=max_length)
+
+    def to_bytes(self) -> bytes:
+        """
+        This packs the bits into `bytes`. If the length is not a whole number of bytes,
+        the first byte is padded with `'OFF'` bits on the left.
+
+        Returns:
+            data:
+                ...
+        """
+
+        return self.to_int().to_bytes((len(self) + 7) // 8, "big")
+
+    def to_int(self) -> int:
+        """
+        This packs the bits into a non-negative integer.
+
+        Returns:
+            value:
+                ...
+        """
+
+        return self._range_to_int(0, len(self))
+
+    def to_text(self) -> str:
+        """
+        This renders the bits as compact bit-text, e.g. `"1011"`.
+
+        Returns:
+            text:
+                ...
+        """
+
+        if len(self) == 0:
+            return ""
+
+        return format(self.to_int(), f"0{len(self)}b")
+
+
+def _unpack(value: int, width: int) -> List[Bit]:
+    """
+    This unpacks the lowest `width` bits of a non-negative integer into a list of
+    canonical bits, most significant bit first.
+
+    This is a private function.
+
+    Args:
+        value:
+            ...
+        width:
+            ...
+
+    Returns:
+        bits:
+            ...
+
+    Raises:
+        BitError:
+            {value} does not fit into {width} bits!
+    """
+
+    if value < 0 or value >> width:
+        raise BitError(f"{value} does not fit into {width} bits!")
+
+    if width == 0:
+        return []
+
+    return list(map(CHARS.__getitem__, format(value, f"0{width}b")))
+
+
+class BitStringView(BitConversions):
+
+    """
+    This implements a window onto a contiguous run of bits in another bit string. It
+    does not copy anything: reading a bit reads it from the parent and writing a bit
+    writes it to the parent (if the parent can be written to). Slicing a view gives
+    another view onto the same parent.
+
+    The window is defined by position, so if bits are pushed or popped on the left of
+    the parent, the view sees the bits that moved into its window.
+
+    Attributes:
+        parent: the bit string being viewed (private)
+        start:  the position of the first bit of the view in the parent (private)
+        length: the number of bits in the view (private)
+    """
+
+    __slots__ = ("_parent", "_start", "_length")
+
+    def __init__(self, parent, start: int, length: int):
+        """
+        Constructor...
+
+        Args:
+            parent:
+                The bit string being viewed.
+            start:
+                The position of the first bit of the view in the parent.
+            length:
+                The number of bits in the view.
+        """
+
+        self._parent = parent
+        """
+        The bit string being viewed.
+
+        Type:
+            BitString | PackedBitString | FrozenBitString
+        """
+
+        self._start: int = start
+        """
+        The position of the first bit of the view in the parent.
+
+        Type:
+            int
+        """
+
+        self._length: int = length
+        """
+        The number of bits in the view.
+
+        Type:
+            int
+        """
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bit, BitStringView]:
+        """This allows the user to access bits (or a narrower view) from the view."""
+
+        if isinstance(index, slice):
+            start, length = slice_window(index, self._length)
+            return BitStringView(self._parent, self._start + start, length)
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        return self._parent[self._start + index]
+
+    def __iter__(self) -> Iterator[Bit]:
+        """This allows one to iterate over the bits in the view."""
+
+        return self._parent._iter_range(self._start, self._stop())
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of bits.
+        """
+
+        return self._length
+
+    def __setitem__(self, index: int, bit: Bit) -> None:
+        """This writes a bit through to the parent bit string."""
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        self._parent[self._start + index] = bit
+
+    def __str__(self) -> str:
+        """
+        This overrides Python's built-in `str` function: it returns a string
+        representation of the bits in the view.
+        """
+
+        return " ".join(str(bit) for bit in self)
+
+    @property
+    def parent(self):
+        """Get the bit string being viewed."""
+
+        return self._parent
+
+    def _range_to_int(self, start: int, stop: int) -> int:
+        """
+        This packs the bits at positions `start` up to (but not including) `stop` of
+        the view into an integer, by asking the parent for the matching window.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        self._stop()
+        return self._parent._range_to_int(self._start + start, self._start + stop)
+
+    @property
+    def start(self) -> int:
+        """Get the position of the first bit of the view in the parent."""
+
+        return self._start
+
+    def _stop(self) -> int:
+        """
+        This returns the position just past the last bit of the view in the parent,
+        after checking the view still fits inside the parent (which may have shrunk
+        since the view was taken), just like reading a single bit does.
+
+        This is a private method.
+
+        Returns:
+            stop:
+                ...
+
+        Raises:
+            BitError:
+                Index {index} lies outside the bit string length!
+        """
+
+        stop: int = self._start + self._length
+        if stop > len(self._parent):
+            raise BitError(f"Index {stop - 1} lies outside the bit string length!")
+
+        return stop
+
+    def freeze(self) -> FrozenBitString:
+        """
+        This takes an immutable, hashable snapshot of the bits in the view.
+
+        This is a public method.
+
+        Returns:
+            frozen:
+                ...
+        """
+
+        return FrozenBitString(self)
+
+
+class BitString(BitConversions, IBitString):
 
     """
     This will implement a string of bits. This will make it easier to manipulate and
     work with multiple bits going forward.
 
+    The bits are kept in a ring buffer: `head` points at the left-most bit and the
+    string wraps around the end of the storage. Pushing and popping at either end only
+    moves `head` or `length`, and indexing is a single offset, so all of these are
+    O(1). The storage grows by doubling (up to `max_length`) when it fills up.
+
+    In shift-register mode, pushing into a full bit string does not raise: the bit at
+    the other end is evicted and returned instead. On a full ring buffer that is just
+    an overwrite and a move of `head`, so it stays O(1).
+
     Attributes:
-        max_length: the maximum number of bits this can hold (private)
-        bits:       the collection of bits (private)
+        max_length:     the maximum number of bits this can hold (private)
+        shift_register: whether pushing into a full bit string evicts a bit (private)
+        bits:           the ring buffer holding the bits (private)
+        head:           the position of the left-most bit in the ring buffer (private)
+        length:         the number of bits currently held (private)
     """
 
-    def __init__(self, *, max_length: int):
+    _MIN_CAPACITY: int = 8
+    # The storage starts out empty and jumps straight to this many slots on first use.
+
+    def __init__(self, *, max_length: int, shift_register: bool = False):
         """
         Constructor...
 
         Args:
             max_length:
                 The maximum number of bits this can hold.
+            shift_register:
+                Whether pushing into a full bit string evicts the bit at the other end
+                instead of raising an error.
         """
 
         self._max_length: int = max_length
@@ -35,34 +411,71 @@ class BitString(IBitString):
             Optional[int]
         """
 
-        self._bits: List[Bit] = []
+        self._shift_register: bool = shift_register
+        """
+        Whether pushing into a full bit string evicts the bit at the other end.
+
+        Type:
+            bool
+        """
+
+        self._bits: List[Optional[Bit]] = []
+        """
+        The ring buffer holding the bits.
+
+        Type:
+            List[Optional[Bit]]
+        """
+
+        self._head: int = 0
+        """
+        The position of the left-most bit in the ring buffer.
+
+        Type:
+            int
+        """
+
+        self._length: int = 0
         """
-        The collection of bits.
+        The number of bits currently held.
 
         Type:
-            List[Bit]
+            int
+        """
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bit, BitStringView]:
+        """
+        This allows the user to access bits from the bit string. Slicing returns a
+        `BitStringView` sharing this bit string's storage instead of a copy.
         """
 
-    def __getitem__(self, index: int) -> Bit:
-        """This allows the user to access bits from the bit string."""
+        if isinstance(index, slice):
+            return BitStringView(self, *slice_window(index, self._length))
 
-        if index not in list(range(len(self._bits))):
+        if not 0 <= index < self._length:
             raise BitError(f"Index {index} lies outside the bit string length!")
-        
-        return self._bits[index]
 
-    def __iter__(self) -> Bit:
+        return self._bits[(self._head + index) % len(self._bits)]
+
+    def __iter__(self) -> Iterator[Bit]:
         """This allows one to iterate over the bits in the collection."""
 
-        for bit in self._bits:
-            yield bit
+        return self._iter_range(0, self._length)
 
     def __len__(self) -> int:
         """
         This overrides Python's built-in `len` function: it returns the number of bits.
         """
 
-        return len(self._bits)
+        return self._length
+
+    def __setitem__(self, index: int, bit: Bit) -> None:
+        """This allows the user to overwrite bits in the bit string."""
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        self._bits[(self._head + index) % len(self._bits)] = bit
 
     def __str__(self) -> str:
         """
@@ -70,15 +483,133 @@ class BitString(IBitString):
         representation of the collection of bits.
         """
 
-        return " ".join(str(bit) for bit in self._bits)
+        return " ".join(str(bit) for bit in self)
 
     @property
     def max_length(self) -> int:
         """Get the maximum number of bits this can hold."""
 
         return self._max_length
-    
-    def extend_left(self, bits: BitString) -> None:
+
+    @property
+    def shift_register(self) -> bool:
+        """Get whether pushing into a full bit string evicts a bit."""
+
+        return self._shift_register
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Bit]:
+        """
+        This iterates over the bits at positions `start` up to (but not including)
+        `stop`, reading them straight out of the ring buffer.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            bits:
+                ...
+        """
+
+        if stop <= start:
+            return iter(())
+
+        # The window is at most two contiguous runs of the ring buffer: up to the end
+        # of the storage, then wrapping around to the beginning.
+        capacity: int = len(self._bits)
+        first: int = (self._head + start) % capacity
+        first_stop: int = min(first + stop - start, capacity)
+        return itertools.chain(
+            itertools.islice(self._bits, first, first_stop),
+            itertools.islice(self._bits, 0, stop - start - (first_stop - first)),
+        )
+
+    def _range_to_int(self, start: int, stop: int) -> int:
+        """
+        This packs the bits at positions `start` up to (but not including) `stop` into
+        an integer.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        return int(_is_on(self._iter_range(start, stop)).translate(_ASCII) or b"0", 2)
+
+    @classmethod
+    def from_int(
+        cls, value: int, width: int, *, max_length: Optional[int] = None
+    ) -> BitString:
+        """
+        This builds a bit string holding the lowest `width` bits of `value`, most
+        significant bit on the left.
+
+        Args:
+            value:
+                A non-negative integer that fits into `width` bits.
+            width:
+                The number of bits in the result.
+            max_length:
+                The maximum number of bits the result can hold. Defaults to `width`.
+
+        Returns:
+            bits:
+                ...
+
+        Raises:
+            BitError:
+                (1) {value} does not fit into {width} bits!
+                (2) There are more bits than the max length allows!
+        """
+
+        if max_length is None:
+            max_length = width
+        elif width > max_length:
+            raise BitError("There are more bits than the max length allows!")
+
+        bits: BitString = cls(max_length=max_length)
+        bits._bits = _unpack(value, width)
+        bits._length = width
+        return bits
+
+    def _grow(self, needed: int) -> None:
+        """
+        This makes sure the ring buffer has room for at least `needed` bits. If it
+        doesn't, the storage is reallocated (doubling, but never past `max_length`) and
+        the bits are laid out again starting from position zero.
+
+        This is a private method.
+
+        Args:
+            needed:
+                ...
+        """
+
+        capacity: int = len(self._bits)
+        if needed <= capacity:
+            return
+
+        new_capacity: int = max(capacity * 2, needed, self._MIN_CAPACITY)
+        new_capacity = min(new_capacity, self._max_length)
+
+        storage: List[Optional[Bit]] = list(self)
+        storage.extend([None] * (new_capacity - self._length))
+        self._bits = storage
+        self._head = 0
+
+    def extend_left(self, bits: IBitString) -> None:
         """
         This will add another bit string to the left of this current bit string.
 
@@ -88,16 +619,22 @@ class BitString(IBitString):
             bits:
                 ...
         """
-        
-        if len(self._bits) + len(bits) > self._max_length:
+
+        if self._length + len(bits) > self._max_length:
             raise BitError(
-                f"Adding {len(self._bits)} more bits to the bit string will exceed the "
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
                 "max length!"
             )
-        
-        self._bits = [b for b in bits] + self._bits
 
-    def extend_right(self, bits: BitString) -> None:
+        if bits is self or (isinstance(bits, BitStringView) and bits.parent is self):
+            # Pushing bits moves (and may overwrite) what is being read.
+            bits = FrozenBitString(bits)
+
+        self._grow(self._length + len(bits))
+        for index in range(len(bits) - 1, -1, -1):
+            self.push_left(bits[index])
+
+    def extend_right(self, bits: IBitString) -> None:
         """
         This will add another bit string to the right of this current bit string.
 
@@ -108,13 +645,33 @@ class BitString(IBitString):
                 ...
         """
 
-        if len(self._bits) + len(bits) > self._max_length:
+        if self._length + len(bits) > self._max_length:
             raise BitError(
-                f"Adding {len(self._bits)} more bits to the bit string will exceed the "
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
                 "max length!"
             )
-            
-        self._bits += [b for b in bits]
+
+        if bits is self or (isinstance(bits, BitStringView) and bits.parent is self):
+            # Pushing bits moves (and may overwrite) what is being read.
+            bits = FrozenBitString(bits)
+
+        self._grow(self._length + len(bits))
+        for bit in bits:
+            self.push_right(bit)
+
+    def freeze(self) -> FrozenBitString:
+        """
+        This takes an immutable, hashable snapshot of the bit string. Later changes to
+        this bit string do not affect the snapshot.
+
+        This is a public method.
+
+        Returns:
+            frozen:
+                ...
+        """
+
+        return FrozenBitString(self, max_length=self._max_length)
 
     def pop_left(self) -> Bit:
         """
@@ -132,11 +689,12 @@ class BitString(IBitString):
                 This bit string is empty.
         """
 
-        if len(self) == 0:
+        if self._length == 0:
             raise BitError("This bit string is empty!")
 
-        ret: Bit = self._bits[0]
-        self._bits = self._bits[1:]
+        ret: Bit = self._bits[self._head]
+        self._head = (self._head + 1) % len(self._bits)
+        self._length -= 1
         return ret
 
     def pop_right(self) -> Bit:
@@ -155,51 +713,317 @@ class BitString(IBitString):
                 This bit string is empty.
         """
 
-        if len(self) == 0:
+        if self._length == 0:
             raise BitError("This bit string is empty!")
 
-        ret: Bit = self._bits[-1]
-        self._bits = self._bits[:-1]
-        return ret
+        self._length -= 1
+        return self._bits[(self._head + self._length) % len(self._bits)]
 
-    def push_left(self, bit: Bit) -> None:
+    def push_left(self, bit: Bit) -> Optional[Bit]:
         """
         This method will push a bit into the collection on the left. If the collection
-        is full, then it will raise an error.
+        is full, then it will raise an error, unless this is a shift register, in
+        which case the right-most bit is evicted.
 
         This is a public method.
 
         Returns:
             bit:
-                ...
+                The evicted bit, or `None` if nothing had to be evicted.
 
         Raises:
             BitError:
                 This bit string has the maximum number of bits allowed!
         """
 
-        if len(self) == self._max_length:
-            raise BitError("This bit string has the maximum number of bits allowed!")
+        if self._length == self._max_length:
+            if not self._shift_register:
+                raise BitError(
+                    "This bit string has the maximum number of bits allowed!"
+                )
+
+            if self._max_length == 0:
+                return bit
 
-        self._bits = [bit] + self._bits
+            # The ring buffer is full, so the slot left of `head` holds the right-most
+            # bit: overwrite it and make it the new left-most bit.
+            self._head = (self._head - 1) % self._max_length
+            ret: Bit = self._bits[self._head]
+            self._bits[self._head] = bit
+            return ret
 
-    def push_right(self, bit: Bit) -> None:
+        if self._length == len(self._bits):
+            self._grow(self._length + 1)
+
+        self._head = (self._head - 1) % len(self._bits)
+        self._bits[self._head] = bit
+        self._length += 1
+        return None
+
+    def push_right(self, bit: Bit) -> Optional[Bit]:
         """
         This method will push a bit into the collection on the right. If the collection
-        is full, then it will raise an error.
+        is full, then it will raise an error, unless this is a shift register, in
+        which case the left-most bit is evicted.
 
         This is a public method.
 
         Returns:
             bit:
-                ...
+                The evicted bit, or `None` if nothing had to be evicted.
 
         Raises:
             BitError:
                 This bit string has the maximum number of bits allowed!
         """
 
-        if len(self) == self._max_length:
-            raise BitError("This bit string has the maximum number of bits allowed!")
+        if self._length == self._max_length:
+            if not self._shift_register:
+                raise BitError(
+                    "This bit string has the maximum number of bits allowed!"
+                )
+
+            if self._max_length == 0:
+                return bit
+
+            # The ring buffer is full: overwrite the left-most bit, which then becomes
+            # the right-most one.
+            ret: Bit = self._bits[self._head]
+            self._bits[self._head] = bit
+            self._head = (self._head + 1) % self._max_length
+            return ret
+
+        if self._length == len(self._bits):
+            self._grow(self._length + 1)
+
+        self._bits[(self._head + self._length) % len(self._bits)] = bit
+        self._length += 1
+        return None
+
+
+class FrozenBitString(BitConversions):
+
+    """
+    This implements an immutable string of bits. Unlike `BitString`, it can be used as
+    a dictionary key or stored in a set, e.g. to cache the outputs of a circuit keyed
+    on its inputs. The hash is computed once, when the instance is built.
+
+    Attributes:
+        max_length: the maximum number of bits the thawed bit string can hold (private)
+        bits:       the collection of bits (private)
+        hash:       the cached hash of the bits (private)
+    """
+
+    __slots__ = ("_max_length", "_bits", "_hash")
+
+    def __init__(self, bits: Iterable[Bit] = (), *, max_length: Optional[int] = None):
+        """
+        Constructor...
+
+        Args:
+            bits:
+                The bits to hold, from left to right. Anything that isn't a `Bit` is
+                converted to one.
+            max_length:
+                The maximum number of bits a thawed copy can hold. Defaults to the
+                number of bits given.
+
+        Raises:
+            BitError:
+                (1) There are more bits than the max length allows!
+                (2) Entered an unknown value: {value}!
+                (3) Entered something that cannot be handled!
+        """
+
+        frozen: Tuple[Bit, ...] = tuple(
+            bit if isinstance(bit, Bit) else Bit(bit) for bit in bits
+        )
+        if max_length is None:
+            max_length = len(frozen)
+        elif len(frozen) > max_length:
+            raise BitError("There are more bits than the max length allows!")
+
+        object.__setattr__(self, "_max_length", max_length)
+        object.__setattr__(self, "_bits", frozen)
+        object.__setattr__(self, "_hash", hash(frozen))
+
+    def __delattr__(self, name: str) -> None:
+        """Frozen bit strings are immutable: refuse to delete any attribute."""
+
+        raise BitError("Frozen bit strings are immutable!")
+
+    def __eq__(self, other: FrozenBitString) -> bool:
+        """
+        Overrides Python's `'=='` operator: two frozen bit strings are the same if they
+        hold the same bits in the same order.
+        """
+
+        if not isinstance(other, FrozenBitString):
+            return NotImplemented
+
+        return self._hash == other._hash and self._bits == other._bits
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bit, BitStringView]:
+        """
+        This allows the user to access bits from the bit string. Slicing returns a
+        read-only `BitStringView` instead of a copy.
+        """
+
+        if isinstance(index, slice):
+            return BitStringView(self, *slice_window(index, len(self._bits)))
+
+        if not 0 <= index < len(self._bits):
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        return self._bits[index]
+
+    def __hash__(self) -> int:
+        """Overrides Python's built-in `hash` function: returns the cached hash."""
+
+        return self._hash
+
+    def __iter__(self) -> Iterator[Bit]:
+        """This allows one to iterate over the bits in the collection."""
+
+        return iter(self._bits)
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of bits.
+        """
+
+        return len(self._bits)
+
+    def __reduce__(self) -> Tuple[Callable[..., FrozenBitString], Tuple[str, int]]:
+        """
+        Pickle (and copy) the bit string through its text, rather than by restoring
+        its slots, which `__setattr__` refuses.
+        """
+
+        return (_frozen_from_text, (self.to_text(), self._max_length))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Frozen bit strings are immutable: refuse to set any attribute."""
+
+        raise BitError("Frozen bit strings are immutable!")
+
+    def __setitem__(self, index: int, bit: Bit) -> None:
+        """Frozen bit strings are immutable: refuse to overwrite any bit."""
+
+        raise BitError("Frozen bit strings are immutable!")
+
+    def __str__(self) -> str:
+        """
+        This overrides Python's built-in `str` function: it returns a string
+        representation of the collection of bits.
+        """
+
+        return " ".join(str(bit) for bit in self._bits)
+
+    @property
+    def max_length(self) -> int:
+        """Get the maximum number of bits a thawed copy can hold."""
+
+        return self._max_length
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Bit]:
+        """
+        This iterates over the bits at positions `start` up to (but not including)
+        `stop`.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            bits:
+                ...
+        """
+
+        return itertools.islice(self._bits, start, stop)
+
+    def _range_to_int(self, start: int, stop: int) -> int:
+        """
+        This packs the bits at positions `start` up to (but not including) `stop` into
+        an integer.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        return int(_is_on(self._iter_range(start, stop)).translate(_ASCII) or b"0", 2)
+
+    @classmethod
+    def from_int(
+        cls, value: int, width: int, *, max_length: Optional[int] = None
+    ) -> FrozenBitString:
+        """
+        This builds a frozen bit string holding the lowest `width` bits of `value`,
+        most significant bit on the left.
+
+        Args:
+            value:
+                A non-negative integer that fits into `width` bits.
+            width:
+                The number of bits in the result.
+            max_length:
+                The maximum number of bits a thawed copy can hold. Defaults to `width`.
+
+        Returns:
+            bits:
+                ...
+
+        Raises:
+            BitError:
+                {value} does not fit into {width} bits!
+        """
+
+        return cls(_unpack(value, width), max_length=max_length)
+
+    def thaw(self) -> BitString:
+        """
+        This builds a mutable `BitString` holding the same bits.
+
+        This is a public method.
+
+        Returns:
+            bits:
+                ...
+        """
+
+        bits: BitString = BitString(max_length=self._max_length)
+        bits.extend_right(self)
+        return bits
+
+
+def _frozen_from_text(text: str, max_length: int) -> FrozenBitString:
+    """
+    This rebuilds a pickled frozen bit string (see `FrozenBitString.__reduce__`).
+
+    This is a private function.
+
+    Args:
+        text:
+            ...
+        max_length:
+            ...
+
+    Returns:
+        bits:
+            ...
+    """
 
-        self._bits += [bit]
+    return FrozenBitString.from_text(text, max_length=max_length)
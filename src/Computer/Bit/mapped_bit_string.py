@@ -0,0 +1,633 @@
+from __future__ import annotations
+
+import mmap
+import os
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
+
+from Computer.Bit.abc import IBitString
+
+from .bit import Bit, BitError
+from .bit_string import CHARS, BitConversions, BitStringView, slice_window
+
+PATH = Union[str, os.PathLike]
+# This represents anything `open` accepts as a file name.
+
+
+class MappedBitString(BitConversions, IBitString):
+
+    """
+    This implements a string of bits that lives in a memory-mapped file instead of in
+    Python objects. Every bit of the file is a slot (the most significant bit of each
+    byte first), so the maximum length is eight times the file size. Bits are read from
+    and written to the mapping directly; only the pages that are touched are ever
+    loaded, which makes it possible to work with files much larger than memory.
+
+    Like `BitString`, the slots are used as a ring buffer: popping a bit frees its slot
+    and pushing a bit fills a free slot, both in O(1). Opening an existing file gives a
+    full bit string holding the whole file, which is handy for reading stimulus by
+    popping from the left. `create` makes an empty one, which is handy for capturing
+    output by pushing on the right.
+
+    Since a mapped bit string always comes from a file, the bulk constructors
+    (`from_int`, `from_bytes` and `from_text`) are not supported and raise a `BitError`;
+    the conversions the other way (`to_int`, `to_bytes` and `to_text`) work as usual.
+
+    Attributes:
+        file:       the open file backing the mapping (private)
+        map:        the memory mapping of the file (private)
+        writable:   whether bits can be written to the file (private)
+        max_length: the maximum number of bits this can hold (private)
+        head:       the slot holding the left-most bit (private)
+        length:     the number of bits currently held (private)
+    """
+
+    _CHUNK: int = 1 << 16
+    # Number of bytes decoded at a time while iterating, so iterating over a large file
+    # never builds one giant string.
+
+    def __init__(
+        self, path: PATH, *, writable: bool = False, length: Optional[int] = None
+    ):
+        """
+        Constructor...
+
+        Args:
+            path:
+                The file to map. It needs to hold at least one byte.
+            writable:
+                Whether bits can be written back to the file.
+            length:
+                The number of bits the string starts out holding, from the start of the
+                file. Defaults to every bit in the file.
+
+        Raises:
+            BitError:
+                (1) Cannot map the empty file {path}!
+                (2) There are more bits than the max length allows!
+        """
+
+        self._file: BinaryIO = open(path, "r+b" if writable else "rb")
+        """
+        The open file backing the mapping.
+
+        Type:
+            BinaryIO
+        """
+
+        size: int = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            self._file.close()
+            raise BitError(f"Cannot map the empty file {path}!")
+
+        self._map: mmap.mmap = mmap.mmap(
+            self._file.fileno(),
+            0,
+            access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ,
+        )
+        """
+        The memory mapping of the file.
+
+        Type:
+            mmap.mmap
+        """
+
+        self._writable: bool = writable
+        """
+        Whether bits can be written to the file.
+
+        Type:
+            bool
+        """
+
+        self._max_length: int = 8 * size
+        """
+        The maximum number of bits this can hold.
+
+        Type:
+            int
+        """
+
+        self._head: int = 0
+        """
+        The slot holding the left-most bit.
+
+        Type:
+            int
+        """
+
+        if length is None:
+            length = self._max_length
+        elif length > self._max_length:
+            self.close()
+            raise BitError("There are more bits than the max length allows!")
+
+        self._length: int = length
+        """
+        The number of bits currently held.
+
+        Type:
+            int
+        """
+
+    def __enter__(self) -> MappedBitString:
+        """This allows the bit string to be used as a context manager."""
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """This closes the mapping when leaving the `with` block."""
+
+        self.close()
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bit, BitStringView]:
+        """
+        This allows the user to access bits from the bit string. Slicing returns a
+        `BitStringView` onto the mapping instead of a copy.
+        """
+
+        if isinstance(index, slice):
+            return BitStringView(self, *slice_window(index, self._length))
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        return self._read(self._slot(index))
+
+    def __iter__(self) -> Iterator[Bit]:
+        """This allows one to iterate over the bits in the collection."""
+
+        return self._iter_range(0, self._length)
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of bits.
+        """
+
+        return self._length
+
+    def __setitem__(self, index: int, bit: Bit) -> None:
+        """This allows the user to overwrite bits in the bit string (and the file)."""
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        self._write(self._slot(index), bit)
+
+    def __str__(self) -> str:
+        """
+        This overrides Python's built-in `str` function: it returns a string
+        representation of the collection of bits.
+        """
+
+        return " ".join(str(bit) for bit in self)
+
+    @property
+    def max_length(self) -> int:
+        """Get the maximum number of bits this can hold (eight per byte of the file)."""
+
+        return self._max_length
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Bit]:
+        """
+        This iterates over the bits at positions `start` up to (but not including)
+        `stop`, decoding the file a chunk of bytes at a time.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            bits:
+                ...
+        """
+
+        step: int = 8 * self._CHUNK
+        for first, last in self._segments(start, stop):
+            for chunk in range(first, last, step):
+                chunk_stop: int = min(chunk + step, last)
+                window: int = self._read_int(chunk, chunk_stop)
+                yield from map(
+                    CHARS.__getitem__, format(window, f"0{chunk_stop - chunk}b")
+                )
+
+    def _range_to_int(self, start: int, stop: int) -> int:
+        """
+        This packs the bits at positions `start` up to (but not including) `stop` into
+        an integer, straight from the bytes of the mapping.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        value: int = 0
+        for first, last in self._segments(start, stop):
+            value = (value << (last - first)) | self._read_int(first, last)
+
+        return value
+
+    def _read(self, slot: int) -> Bit:
+        """
+        This reads the bit held in a slot of the file.
+
+        This is a private method.
+
+        Args:
+            slot:
+                ...
+
+        Returns:
+            bit:
+                ...
+        """
+
+        return Bit.trusted((self._map[slot >> 3] >> (7 - (slot & 7))) & 1)
+
+    def _read_int(self, first: int, last: int) -> int:
+        """
+        This packs the slots `first` up to (but not including) `last` into an integer.
+        The slots must not wrap around the end of the file.
+
+        This is a private method.
+
+        Args:
+            first:
+                ...
+            last:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        end: int = (last + 7) >> 3
+        value: int = int.from_bytes(self._map[first >> 3 : end], "big")
+        return (value >> (8 * end - last)) & ((1 << (last - first)) - 1)
+
+    def _segments(self, start: int, stop: int) -> List[Tuple[int, int]]:
+        """
+        This translates positions `start` up to (but not including) `stop` into the
+        runs of slots holding them: at most two, since the ring buffer may wrap around
+        the end of the file.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            segments:
+                A list of `(first, last)` slot ranges.
+        """
+
+        if stop <= start:
+            return []
+
+        first: int = self._slot(start)
+        last: int = first + stop - start
+        if last <= self._max_length:
+            return [(first, last)]
+
+        return [(first, self._max_length), (0, last - self._max_length)]
+
+    def _slot(self, index: int) -> int:
+        """
+        This translates a position in the bit string into a slot of the file.
+
+        This is a private method.
+
+        Args:
+            index:
+                ...
+
+        Returns:
+            slot:
+                ...
+        """
+
+        return (self._head + index) % self._max_length
+
+    def _write(self, slot: int, bit: Bit) -> None:
+        """
+        This writes a bit into a slot of the file.
+
+        This is a private method.
+
+        Args:
+            slot:
+                ...
+            bit:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is read-only!
+        """
+
+        if not self._writable:
+            raise BitError("This bit string is read-only!")
+
+        mask: int = 0x80 >> (slot & 7)
+        if bit is Bit.ON:
+            self._map[slot >> 3] |= mask
+        else:
+            self._map[slot >> 3] &= ~mask & 0xFF
+
+    def _write_int(self, first: int, last: int, value: int) -> None:
+        """
+        This writes the bits of an integer into the slots `first` up to (but not
+        including) `last`, a whole run of bytes at a time. The slots must not wrap
+        around the end of the file.
+
+        This is a private method.
+
+        Args:
+            first:
+                ...
+            last:
+                ...
+            value:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is read-only!
+        """
+
+        if not self._writable:
+            raise BitError("This bit string is read-only!")
+
+        start: int = first >> 3
+        end: int = (last + 7) >> 3
+        shift: int = 8 * end - last
+        mask: int = ((1 << (last - first)) - 1) << shift
+        current: int = int.from_bytes(self._map[start:end], "big")
+        current = (current & ~mask) | (value << shift)
+        self._map[start:end] = current.to_bytes(end - start, "big")
+
+    def _copy_in(
+        self, bits: IBitString, source: int, target: int, count: int
+    ) -> None:
+        """
+        This copies `count` bits, starting at position `source` of `bits`, into the
+        positions starting at `target`, a chunk at a time, so nothing the size of the
+        whole source is ever built. Chunks are read as integers when the source can
+        pack them (every bit string class here can), and bit by bit otherwise.
+
+        This is a private method.
+
+        Args:
+            bits:
+                ...
+            source:
+                ...
+            target:
+                ...
+            count:
+                ...
+        """
+
+        step: int = 8 * self._CHUNK
+        for offset in range(0, count, step):
+            size: int = min(step, count - offset)
+            first: int = source + offset
+            if hasattr(bits, "_range_to_int"):
+                value: int = bits._range_to_int(first, first + size)
+            else:
+                value = 0
+                for index in range(first, first + size):
+                    value = (value << 1) | (bits[index] is Bit.ON)
+
+            # The target may wrap around the end of the file: split the chunk.
+            position: int = target + offset
+            for slot_first, slot_last in self._segments(position, position + size):
+                width: int = slot_last - slot_first
+                size -= width
+                self._write_int(
+                    slot_first, slot_last, (value >> size) & ((1 << width) - 1)
+                )
+
+    @classmethod
+    def create(cls, path: PATH, *, max_length: int) -> MappedBitString:
+        """
+        This creates (or truncates) a file big enough for `max_length` bits, filled
+        with `'OFF'` bits, and maps it as an empty, writable bit string. The file size
+        is rounded up to a whole number of bytes, so the resulting max length is a
+        multiple of eight.
+
+        Args:
+            path:
+                ...
+            max_length:
+                The minimum number of bits the file needs to hold.
+
+        Returns:
+            bits:
+                ...
+        """
+
+        with open(path, "wb") as f:
+            f.truncate(max((max_length + 7) // 8, 1))
+
+        return cls(path, writable=True, length=0)
+
+    @classmethod
+    def from_int(
+        cls, value: int, width: int, *, max_length: Optional[int] = None
+    ) -> MappedBitString:
+        """
+        Mapped bit strings always come from a file: use `create` and `extend_right`
+        instead.
+
+        Raises:
+            BitError:
+                Mapped bit strings have to be opened from a file!
+        """
+
+        raise BitError("Mapped bit strings have to be opened from a file!")
+
+    def close(self) -> None:
+        """
+        This flushes any pending writes and closes the mapping and the file.
+
+        This is a public method.
+        """
+
+        if self._map.closed:
+            return
+
+        if self._writable:
+            self._map.flush()
+
+        self._map.close()
+        self._file.close()
+
+    def extend_left(self, bits: IBitString) -> None:
+        """
+        This will add another bit string to the left of this current bit string.
+
+        This is a public method.
+
+        Args:
+            bits:
+                ...
+        """
+
+        if self._length + len(bits) > self._max_length:
+            raise BitError(
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
+                "max length!"
+            )
+
+        if not self._writable:
+            raise BitError("This bit string is read-only!")
+
+        count: int = len(bits)
+        # The new bits only go into the free slots left of the head (positions `-count`
+        # up to `0`), so reading this bit string (or a view of it) while writing is
+        # safe. The head only moves once the copy has succeeded.
+        if isinstance(bits, BitStringView) and bits.parent is self:
+            bits, source = self, bits.start
+        else:
+            source = 0
+
+        self._copy_in(bits, source, -count, count)
+        self._head = (self._head - count) % self._max_length
+        self._length += count
+
+    def extend_right(self, bits: IBitString) -> None:
+        """
+        This will add another bit string to the right of this current bit string.
+
+        This is a public method.
+
+        Args:
+            bits:
+                ...
+        """
+
+        if self._length + len(bits) > self._max_length:
+            raise BitError(
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
+                "max length!"
+            )
+
+        if not self._writable:
+            raise BitError("This bit string is read-only!")
+
+        # The new bits only go into free slots, so reading this bit string (or a view
+        # of it) while writing is safe.
+        count: int = len(bits)
+        self._copy_in(bits, 0, self._length, count)
+        self._length += count
+
+    def flush(self) -> None:
+        """
+        This makes sure every bit written so far has reached the file.
+
+        This is a public method.
+        """
+
+        if self._writable:
+            self._map.flush()
+
+    def pop_left(self) -> Bit:
+        """
+        This method will pop the left-most element in the collection. If there are no
+        elements in the collection, then it will raise an error. The bit is left in the
+        file; its slot is simply marked as free.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is empty.
+        """
+
+        if self._length == 0:
+            raise BitError("This bit string is empty!")
+
+        ret: Bit = self._read(self._head)
+        self._head = (self._head + 1) % self._max_length
+        self._length -= 1
+        return ret
+
+    def pop_right(self) -> Bit:
+        """
+        This method will pop the right-most element in the collection. If there are no
+        elements in the collection, then it will raise an error. The bit is left in the
+        file; its slot is simply marked as free.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is empty.
+        """
+
+        if self._length == 0:
+            raise BitError("This bit string is empty!")
+
+        self._length -= 1
+        return self._read(self._slot(self._length))
+
+    def push_left(self, bit: Bit) -> None:
+        """
+        This method will push a bit into the collection on the left, writing it into
+        the file. If the collection is full, then it will raise an error.
+
+        This is a public method.
+
+        Raises:
+            BitError:
+                This bit string has the maximum number of bits allowed!
+        """
+
+        if self._length == self._max_length:
+            raise BitError("This bit string has the maximum number of bits allowed!")
+
+        self._write((self._head - 1) % self._max_length, bit)
+        self._head = (self._head - 1) % self._max_length
+        self._length += 1
+
+    def push_right(self, bit: Bit) -> None:
+        """
+        This method will push a bit into the collection on the right, writing it into
+        the file. If the collection is full, then it will raise an error.
+
+        This is a public method.
+
+        Raises:
+            BitError:
+                This bit string has the maximum number of bits allowed!
+        """
+
+        if self._length == self._max_length:
+            raise BitError("This bit string has the maximum number of bits allowed!")
+
+        self._write(self._slot(self._length), bit)
+        self._length += 1
@@ -0,0 +1,618 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Optional, Union
+
+from Computer.Bit.abc import IBitString
+
+from .bit import Bit, BitError
+from .bit_string import (CHARS, BitConversions, BitStringView, FrozenBitString,
+                         slice_window)
+
+
+class PackedBitString(BitConversions, IBitString):
+
+    """
+    This implements a string of bits packed into a single Python integer. The left-most
+    bit is the most significant bit of the integer, so a bit string reading `1011` from
+    left to right holds the value `0b1011`.
+
+    Whole-string logic (`and`, `or`, `not`, `xor`), shifts, rotates and population
+    counts are single integer operations instead of one `Bit` operation per position.
+    Indexing and iteration still hand back `Bit` instances, decoded from the integer on
+    the fly.
+
+    In shift-register mode, pushing into a full bit string evicts and returns the bit
+    at the other end, which is a shift and a mask of the integer.
+
+    Attributes:
+        max_length:     the maximum number of bits this can hold (private)
+        shift_register: whether pushing into a full bit string evicts a bit (private)
+        value:          the bits, packed into an integer (private)
+        length:         the number of bits currently held (private)
+    """
+
+    def __init__(self, *, max_length: int, shift_register: bool = False):
+        """
+        Constructor...
+
+        Args:
+            max_length:
+                The maximum number of bits this can hold.
+            shift_register:
+                Whether pushing into a full bit string evicts the bit at the other end
+                instead of raising an error.
+        """
+
+        self._max_length: int = max_length
+        """
+        The maximum number of bits this can hold.
+
+        Type:
+            int
+        """
+
+        self._shift_register: bool = shift_register
+        """
+        Whether pushing into a full bit string evicts the bit at the other end.
+
+        Type:
+            bool
+        """
+
+        self._value: int = 0
+        """
+        The bits, packed into an integer.
+
+        Type:
+            int
+        """
+
+        self._length: int = 0
+        """
+        The number of bits currently held.
+
+        Type:
+            int
+        """
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Bit, BitStringView]:
+        """
+        This allows the user to access bits from the bit string. Slicing returns a
+        `BitStringView` sharing this bit string's storage instead of a copy.
+        """
+
+        if isinstance(index, slice):
+            return BitStringView(self, *slice_window(index, self._length))
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        return Bit.trusted((self._value >> (self._length - 1 - index)) & 1)
+
+    def __iter__(self) -> Iterator[Bit]:
+        """This allows one to iterate over the bits in the collection."""
+
+        return self._iter_range(0, self._length)
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of bits.
+        """
+
+        return self._length
+
+    def __setitem__(self, index: int, bit: Bit) -> None:
+        """This allows the user to overwrite bits in the bit string."""
+
+        if not 0 <= index < self._length:
+            raise BitError(f"Index {index} lies outside the bit string length!")
+
+        position: int = 1 << (self._length - 1 - index)
+        if bit is Bit.ON:
+            self._value |= position
+        else:
+            self._value &= ~position
+
+    def __str__(self) -> str:
+        """
+        This overrides Python's built-in `str` function: it returns a string
+        representation of the collection of bits.
+        """
+
+        return " ".join(str(bit) for bit in self)
+
+    @property
+    def max_length(self) -> int:
+        """Get the maximum number of bits this can hold."""
+
+        return self._max_length
+
+    @property
+    def shift_register(self) -> bool:
+        """Get whether pushing into a full bit string evicts a bit."""
+
+        return self._shift_register
+
+    @property
+    def mask(self) -> int:
+        """Get an integer with the lowest `len(self)` bits set."""
+
+        return (1 << self._length) - 1
+
+    def _iter_range(self, start: int, stop: int) -> Iterator[Bit]:
+        """
+        This iterates over the bits at positions `start` up to (but not including)
+        `stop`, decoding them from the packed integer in one go.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            bits:
+                ...
+        """
+
+        if stop <= start:
+            return iter(())
+
+        window: int = self._range_to_int(start, stop)
+        return map(CHARS.__getitem__, format(window, f"0{stop - start}b"))
+
+    def _range_to_int(self, start: int, stop: int) -> int:
+        """
+        This extracts the bits at positions `start` up to (but not including) `stop`
+        as an integer with a single shift and mask.
+
+        This is a private method.
+
+        Args:
+            start:
+                ...
+            stop:
+                ...
+
+        Returns:
+            value:
+                ...
+        """
+
+        if stop <= start:
+            return 0
+
+        return (self._value >> (self._length - stop)) & ((1 << (stop - start)) - 1)
+
+    @classmethod
+    def from_int(
+        cls, value: int, width: int, *, max_length: Optional[int] = None
+    ) -> PackedBitString:
+        """
+        This builds a packed bit string holding the lowest `width` bits of `value`,
+        most significant bit on the left.
+
+        Args:
+            value:
+                A non-negative integer that fits into `width` bits.
+            width:
+                The number of bits in the result.
+            max_length:
+                The maximum number of bits the result can hold. Defaults to `width`.
+
+        Returns:
+            bits:
+                ...
+
+        Raises:
+            BitError:
+                (1) {value} does not fit into {width} bits!
+                (2) There are more bits than the max length allows!
+        """
+
+        if value < 0 or value >> width:
+            raise BitError(f"{value} does not fit into {width} bits!")
+
+        if max_length is None:
+            max_length = width
+        elif width > max_length:
+            raise BitError("There are more bits than the max length allows!")
+
+        bits: PackedBitString = cls(max_length=max_length)
+        bits._value = value
+        bits._length = width
+        return bits
+
+    def _new(self, value: int) -> PackedBitString:
+        """
+        This builds a bit string with the same length and max length as this one,
+        holding `value`.
+
+        This is a private method.
+
+        Args:
+            value:
+                The packed bits. It is assumed to fit into `len(self)` bits.
+
+        Returns:
+            bits:
+                ...
+        """
+
+        bits: PackedBitString = PackedBitString(
+            max_length=self._max_length, shift_register=self._shift_register
+        )
+        bits._value = value
+        bits._length = self._length
+        return bits
+
+    def _other_value(self, other: IBitString) -> int:
+        """
+        This gets the packed value of `other`, making sure it is as long as this bit
+        string.
+
+        This is a private method.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            value:
+                ...
+
+        Raises:
+            BitError:
+                The bit strings have different lengths!
+        """
+
+        if len(other) != self._length:
+            raise BitError("The bit strings have different lengths!")
+
+        return pack_bits(other)
+
+    def and_op(self, other: IBitString) -> PackedBitString:
+        """
+        This implements a bitwise `'and'` of two bit strings of the same length.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new(self._value & self._other_value(other))
+
+    def extend_left(self, bits: IBitString) -> None:
+        """
+        This will add another bit string to the left of this current bit string.
+
+        This is a public method.
+
+        Args:
+            bits:
+                ...
+        """
+
+        if self._length + len(bits) > self._max_length:
+            raise BitError(
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
+                "max length!"
+            )
+
+        self._value |= pack_bits(bits) << self._length
+        self._length += len(bits)
+
+    def extend_right(self, bits: IBitString) -> None:
+        """
+        This will add another bit string to the right of this current bit string.
+
+        This is a public method.
+
+        Args:
+            bits:
+                ...
+        """
+
+        if self._length + len(bits) > self._max_length:
+            raise BitError(
+                f"Adding {len(bits)} more bits to the bit string will exceed the "
+                "max length!"
+            )
+
+        self._value = (self._value << len(bits)) | pack_bits(bits)
+        self._length += len(bits)
+
+    def freeze(self) -> FrozenBitString:
+        """
+        This takes an immutable, hashable snapshot of the bit string.
+
+        This is a public method.
+
+        Returns:
+            frozen:
+                ...
+        """
+
+        return FrozenBitString(self, max_length=self._max_length)
+
+    def not_op(self) -> PackedBitString:
+        """
+        This implements a bitwise `'not'`: every bit in the string is reversed.
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new(self._value ^ self.mask)
+
+    def or_op(self, other: IBitString) -> PackedBitString:
+        """
+        This implements a bitwise `'or'` of two bit strings of the same length.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new(self._value | self._other_value(other))
+
+    def pop_left(self) -> Bit:
+        """
+        This method will pop the left-most element in the collection. If there are no
+        elements in the collection, then it will raise an error.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is empty.
+        """
+
+        if self._length == 0:
+            raise BitError("This bit string is empty!")
+
+        self._length -= 1
+        ret: int = self._value >> self._length
+        self._value &= (1 << self._length) - 1
+        return Bit.trusted(ret)
+
+    def pop_right(self) -> Bit:
+        """
+        This method will pop the right-most element in the collection. If there are no
+        elements in the collection, then it will raise an error.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                ...
+
+        Raises:
+            BitError:
+                This bit string is empty.
+        """
+
+        if self._length == 0:
+            raise BitError("This bit string is empty!")
+
+        ret: int = self._value & 1
+        self._value >>= 1
+        self._length -= 1
+        return Bit.trusted(ret)
+
+    def popcount(self) -> int:
+        """
+        This counts the number of `'ON'` bits in the string.
+
+        Returns:
+            count:
+                ...
+        """
+
+        return bin(self._value).count("1")
+
+    def push_left(self, bit: Bit) -> Optional[Bit]:
+        """
+        This method will push a bit into the collection on the left. If the collection
+        is full, then it will raise an error, unless this is a shift register, in
+        which case the right-most bit is evicted.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                The evicted bit, or `None` if nothing had to be evicted.
+
+        Raises:
+            BitError:
+                This bit string has the maximum number of bits allowed!
+        """
+
+        if self._length == self._max_length:
+            if not self._shift_register:
+                raise BitError(
+                    "This bit string has the maximum number of bits allowed!"
+                )
+
+            if self._length == 0:
+                return bit
+
+            ret: int = self._value & 1
+            self._value >>= 1
+            if bit is Bit.ON:
+                self._value |= 1 << (self._length - 1)
+
+            return Bit.trusted(ret)
+
+        if bit is Bit.ON:
+            self._value |= 1 << self._length
+
+        self._length += 1
+        return None
+
+    def push_right(self, bit: Bit) -> Optional[Bit]:
+        """
+        This method will push a bit into the collection on the right. If the collection
+        is full, then it will raise an error, unless this is a shift register, in
+        which case the left-most bit is evicted.
+
+        This is a public method.
+
+        Returns:
+            bit:
+                The evicted bit, or `None` if nothing had to be evicted.
+
+        Raises:
+            BitError:
+                This bit string has the maximum number of bits allowed!
+        """
+
+        if self._length == self._max_length:
+            if not self._shift_register:
+                raise BitError(
+                    "This bit string has the maximum number of bits allowed!"
+                )
+
+            if self._length == 0:
+                return bit
+
+            ret: int = self._value >> (self._length - 1)
+            self._value = ((self._value << 1) | (bit is Bit.ON)) & self.mask
+            return Bit.trusted(ret)
+
+        self._value = (self._value << 1) | (bit is Bit.ON)
+        self._length += 1
+        return None
+
+    def rotate_left(self, amount: int) -> PackedBitString:
+        """
+        This rotates the bits `amount` places to the left: bits falling off the left
+        end come back in on the right.
+
+        Args:
+            amount:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        if self._length == 0:
+            return self._new(0)
+
+        amount %= self._length
+        value: int = (self._value << amount) | (self._value >> (self._length - amount))
+        return self._new(value & self.mask)
+
+    def rotate_right(self, amount: int) -> PackedBitString:
+        """
+        This rotates the bits `amount` places to the right: bits falling off the right
+        end come back in on the left.
+
+        Args:
+            amount:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        if self._length == 0:
+            return self._new(0)
+
+        return self.rotate_left(self._length - amount % self._length)
+
+    def shift_left(self, amount: int) -> PackedBitString:
+        """
+        This shifts the bits `amount` places to the left, filling in `'OFF'` bits on
+        the right. The length of the string stays the same.
+
+        Args:
+            amount:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new((self._value << amount) & self.mask)
+
+    def shift_right(self, amount: int) -> PackedBitString:
+        """
+        This shifts the bits `amount` places to the right, filling in `'OFF'` bits on
+        the left. The length of the string stays the same.
+
+        Args:
+            amount:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new(self._value >> amount)
+
+    def xor_op(self, other: IBitString) -> PackedBitString:
+        """
+        This implements a bitwise `'xor'` of two bit strings of the same length.
+
+        Args:
+            other:
+                ...
+
+        Returns:
+            ret:
+                ...
+        """
+
+        return self._new(self._value ^ self._other_value(other))
+
+
+def pack_bits(bits: Iterable[Bit]) -> int:
+    """
+    This packs an arbitrary collection of bits into an integer, left-most bit first.
+    Bit strings (and views) hand over their integer through `to_int`.
+
+    NOTE:
+        This function is marked public so that other bit containers can share it,
+        though it is not meant to be called by the user.
+
+    Args:
+        bits:
+            ...
+
+    Returns:
+        value:
+            ...
+    """
+
+    if isinstance(bits, PackedBitString):
+        return bits._value
+
+    if isinstance(bits, BitConversions):
+        return bits.to_int()
+
+    value: int = 0
+    for bit in bits:
+        value = (value << 1) | (bit is Bit.ON)
+
+    return value
@@ -1 +1,3 @@
 from .logger import Logger as OUT  # noqa: F401
+from .sink import AsyncSink, Overflow  # noqa: F401
+from .trace import EventKind, TraceRecorder, decode, load  # noqa: F401
@@ -1,5 +1,9 @@
+import logging
+import sys
 import time
-from typing import Optional
+from typing import Any, Dict, Optional, TextIO, Union
+
+from .sink import PATH, AsyncSink, Overflow
 
 MAPPING = {
     0: "LogicGate",
@@ -11,33 +15,457 @@ MAPPING = {
     6: "Loop",
 }
 # This makes it so we don't have to continously type in where the message is being
-# printed from. Later on, this will be replaced with a more robust logging level.
+# printed from. These are the "levels" passed to `Logger.info`: really, component ids.
+
+COMPONENT = Union[int, str]
+# A component can be given by its id or by its name in `MAPPING`.
+
+FORMAT = "[%(asctime)s] %(component)s :: %(message)s"
+# This is the same layout the messages have always been printed with.
+
+DATE_FORMAT = "%H:%M:%S"
+# Messages are only stamped with the time of day.
+
+_LOGGER: logging.Logger = logging.getLogger("Computer")
+# Every message ends up going through this (standard library) logger.
+
+
+class _Component:
+
+    """
+    This holds the logging state of one component: its child logger (such as
+    `Computer.Switch`), whether it is muted, and its sampling and rate limit settings.
+
+    Attributes:
+        logger:     the child logger the component's messages go through
+        enabled:    whether the component's messages are emitted at all
+        muted:      whether the component has been disabled by the user
+        every:      only one message in this many is emitted
+        seen:       the number of messages seen while sampling
+        rate:       the number of tokens added to the bucket every second
+        burst:      the most tokens the bucket holds
+        tokens:     the tokens currently in the bucket
+        refilled:   when the bucket was last refilled
+    """
+
+    def __init__(self, name: str):
+        """
+        Constructor...
+
+        Args:
+            name:
+                The name of the component in `MAPPING`.
+        """
+
+        self.logger: logging.Logger = _LOGGER.getChild(name.replace(" ", ""))
+        self.enabled: bool = False
+        self.muted: bool = False
+        self.every: int = 1
+        self.seen: int = 0
+        self.rate: Optional[float] = None
+        self.burst: float = 0.0
+        self.tokens: float = 0.0
+        self.refilled: float = 0.0
+
+    def admit(self) -> bool:
+        """
+        This applies the sampling and the rate limit to one message: it returns whether
+        the message should be emitted.
+
+        Returns:
+            result:
+                ...
+        """
+
+        if self.every > 1:
+            self.seen += 1
+            if self.seen % self.every:
+                return False
+
+        if self.rate is not None:
+            now: float = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.refilled) * self.rate
+            )
+            self.refilled = now
+            if self.tokens < 1.0:
+                return False
+
+            self.tokens -= 1.0
+
+        return True
+
+
+_COMPONENTS: Dict[int, _Component] = {
+    key: _Component(name) for key, name in MAPPING.items()
+}
+# The logging state of each component.
 
 
 class Logger:
 
     """
-    This class will allow for a basic custom logging method. Later on, when this
-    package is more complete (i.e., able to run on the command-line), then this will be
-    filled in more.
+    This class is a thin, level-gated wrapper around the standard `logging` module.
+    Messages are `%`-style templates whose arguments are only formatted if the message
+    is actually going to be emitted, and logging starts out switched off.
+
+    Hot paths should check `Logger.enabled` before calling `info`, so that evaluating a
+    circuit with logging switched off costs a single attribute lookup per message:
+
+        if OUT.enabled:
+            INFO("Feeding information %s to the output device.", bit)
+
+    Each component in `MAPPING` logs through its own child logger (`Computer.Switch`,
+    `Computer.Connection`, ...), so it can be given its own level, be switched off on
+    its own, keep only one message in N, or be rate limited. For example, to see every
+    switch decision but only a trickle of connection messages:
+
+        OUT.configure()
+        OUT.sample("Connection", every=1000)
+        OUT.rate_limit("Connection", per_second=10)
+
+    `Logger.enabled` only follows levels set through this class (`configure`,
+    `configure_async` and `set_level`). After configuring the `Computer` loggers
+    through `logging` itself (say, with `logging.basicConfig`), call `OUT.refresh()`
+    so the messages are actually emitted.
+
+    Attributes:
+        enabled:    whether any component's `info` messages are currently being emitted
     """
 
+    enabled: bool = False
+    # Kept in sync with the levels of the underlying loggers by `_refresh`, since a
+    # class attribute is much cheaper to check than `logging.Logger.isEnabledFor`.
+
+    _handler: Optional[logging.Handler] = None
+    # The handler installed by `configure`, if any.
+
+    _off: bool = False
+    # The master switch flipped by `disable()`: while it is set, no component is
+    # enabled, whatever its own level.
+
     @staticmethod
-    def info(message: str, level: Optional[int] = None) -> None:
+    def _install(handler: logging.Handler, level: int) -> None:
         """
-        This method will forward the message and the level to [`info()`][logging.info].
-        This will format the message based on where the message originated from.
+        This replaces the handler the messages are sent to, closing the previous one.
 
-        TODO: actually do this when we are ready to do so...
+        This is a private method.
+
+        Args:
+            handler:
+                ...
+            level:
+                The lowest `logging` level that will be emitted.
+        """
+
+        handler.setFormatter(logging.Formatter(FORMAT, DATE_FORMAT))
+
+        if Logger._handler is not None:
+            _LOGGER.removeHandler(Logger._handler)
+            Logger._handler.close()
+
+        Logger._handler = handler
+        _LOGGER.addHandler(handler)
+        _LOGGER.propagate = False
+        Logger.set_level(level)
+
+    @staticmethod
+    def _uninstall(handler: logging.Handler) -> None:
+        """
+        This removes the handler the messages are sent to, if it is `handler` (an
+        `AsyncSink` calls this when it is closed), and switches logging off like
+        [`disable`][Computer.Logger.Logger], since there is nowhere left to send the
+        messages to.
+
+        This is a private method.
+
+        Args:
+            handler:
+                ...
+        """
+
+        if Logger._handler is not handler:
+            return
+
+        _LOGGER.removeHandler(handler)
+        Logger._handler = None
+        Logger._off = True
+        Logger._refresh()
+
+    @staticmethod
+    def _component(component: COMPONENT) -> _Component:
+        """
+        This looks up the logging state of a component, by id or by name.
+
+        This is a private method.
+
+        Args:
+            component:
+                ...
+
+        Returns:
+            state:
+                ...
+
+        Raises:
+            ValueError:
+                {component} is not a known component!
+        """
+
+        if isinstance(component, str):
+            for key, name in MAPPING.items():
+                if name == component:
+                    return _COMPONENTS[key]
+        elif component in _COMPONENTS:
+            return _COMPONENTS[component]
+
+        raise ValueError(f"{component} is not a known component!")
+
+    @staticmethod
+    def _refresh() -> None:
+        """
+        This recomputes whether each component (and so the logger as a whole) is
+        enabled, after a level or a component has been changed.
+
+        This is a private method.
+        """
+
+        on: bool = not Logger._off
+        for state in _COMPONENTS.values():
+            level_on: bool = state.logger.isEnabledFor(logging.INFO)
+            state.enabled = on and level_on and not state.muted
+
+        Logger.enabled = any(state.enabled for state in _COMPONENTS.values())
+
+    @staticmethod
+    def configure(level: int = logging.INFO, stream: Any = None) -> None:
+        """
+        This switches logging on, printing messages to `stream` (the standard output by
+        default) in the usual `[%H:%M:%S] Component :: message` layout. Calling this
+        again replaces the previous handler instead of adding a second one.
+
+        Args:
+            level:
+                The lowest `logging` level that will be emitted.
+            stream:
+                Where the messages are written to.
+        """
+
+        Logger._install(
+            logging.StreamHandler(sys.stdout if stream is None else stream), level
+        )
+
+    @staticmethod
+    def configure_async(
+        file: Union[PATH, TextIO],
+        level: int = logging.INFO,
+        *,
+        max_size: int = 10_000,
+        overflow: Overflow = Overflow.BLOCK,
+        batch_size: int = 1_024,
+    ) -> AsyncSink:
+        """
+        This switches logging on like [`configure`][Computer.Logger.Logger], but the
+        messages are written to `file` by a background thread (see
+        [`AsyncSink`][Computer.Logger.sink.AsyncSink]), so the circuit being evaluated
+        never waits on the file.
+
+        Args:
+            file:
+                A file name to append to, or an already open text stream.
+            level:
+                The lowest `logging` level that will be emitted.
+            max_size:
+                The most messages that can be waiting to be written.
+            overflow:
+                What to do when that many messages are waiting.
+            batch_size:
+                The most messages written in one go.
+
+        Returns:
+            sink:
+                The sink, which can be flushed while logging.
+        """
+
+        sink: AsyncSink = AsyncSink(
+            file, max_size=max_size, overflow=overflow, batch_size=batch_size
+        )
+        Logger._install(sink, level)
+        return sink
+
+    @staticmethod
+    def disable(component: Optional[COMPONENT] = None) -> None:
+        """
+        This switches logging off again, whatever the levels of the components (the
+        handler and the levels are kept around, and setting the overall level switches
+        logging back on), or only switches off one component's messages.
+
+        Args:
+            component:
+                The component to switch off, or `None` for all of them.
+        """
+
+        if component is None:
+            Logger._off = True
+            Logger._refresh()
+            return
+
+        Logger._component(component).muted = True
+        Logger._refresh()
+
+    @staticmethod
+    def enable(component: COMPONENT) -> None:
+        """
+        This switches a component's messages back on after
+        [`disable`][Computer.Logger.Logger] (they are still subject to the levels).
+
+        Args:
+            component:
+                ...
+        """
+
+        Logger._component(component).muted = False
+        Logger._refresh()
+
+    @staticmethod
+    def info(message: str, *args: Any, level: Optional[int] = None) -> None:
+        """
+        This method will forward the message to the standard library logger, tagged
+        with where it came from. The message is only formatted (`message % args`) if it
+        is going to be emitted.
 
         Args:
             message:
-                The message to display.
+                The message to display, as a `%`-style template.
+            args:
+                The values to fill the template with.
             level:
                 Where the message came from.
+
+        Raises:
+            ValueError:
+                You need to provide a valid logging level!
         """
+
         if level is None:
             raise ValueError("You need to provide a valid logging level!")
 
-        current_time: str = time.strftime("%H:%M:%S")
-        print(f"[{current_time}] {MAPPING[level]} :: {message}")
+        state: _Component = _COMPONENTS[level]
+        if not state.enabled or not state.admit():
+            return
+
+        # The record is built directly, skipping the stack walk `logging` does to find
+        # the calling file and line, which the format doesn't use.
+        record: logging.LogRecord = state.logger.makeRecord(
+            state.logger.name,
+            logging.INFO,
+            "",
+            0,
+            message,
+            args,
+            None,
+            extra={"component": MAPPING[level]},
+        )
+        state.logger.handle(record)
+
+    @staticmethod
+    def rate_limit(
+        component: COMPONENT, per_second: Optional[float], burst: Optional[int] = None
+    ) -> None:
+        """
+        This limits a component to `per_second` messages a second on average, with
+        bursts of up to `burst` messages (a token bucket). Messages over the limit are
+        dropped.
+
+        Args:
+            component:
+                ...
+            per_second:
+                The average number of messages let through a second, or `None` to
+                remove the limit.
+            burst:
+                The most messages let through at once. Defaults to `per_second` (but at
+                least one).
+        """
+
+        state: _Component = Logger._component(component)
+        state.rate = per_second
+        state.burst = float(max(per_second or 0, 1) if burst is None else burst)
+        state.tokens = state.burst
+        state.refilled = time.monotonic()
+
+    @staticmethod
+    def refresh() -> None:
+        """
+        This recomputes `Logger.enabled` from the current levels of the standard
+        library loggers, after they have been changed without going through this class.
+        Like setting the overall level, it also switches logging back on after
+        [`disable`][Computer.Logger.Logger].
+        """
+
+        Logger._off = False
+        Logger._refresh()
+
+    @staticmethod
+    def reset() -> None:
+        """
+        This puts every component back to its defaults: switched on, following the
+        overall level, and neither sampled nor rate limited.
+        """
+
+        for state in _COMPONENTS.values():
+            state.logger.setLevel(logging.NOTSET)
+            state.muted = False
+            state.every = 1
+            state.seen = 0
+            state.rate = None
+
+        Logger._refresh()
+
+    @staticmethod
+    def sample(component: COMPONENT, every: int) -> None:
+        """
+        This only lets one in every `every` messages from a component through.
+
+        Args:
+            component:
+                ...
+            every:
+                Keep one message in this many (`1` keeps them all).
+
+        Raises:
+            ValueError:
+                You can only keep one in every N messages for a positive N!
+        """
+
+        if every < 1:
+            raise ValueError(
+                "You can only keep one in every N messages for a positive N!"
+            )
+
+        state: _Component = Logger._component(component)
+        state.every = every
+        state.seen = 0
+
+    @staticmethod
+    def set_level(level: int, component: Optional[COMPONENT] = None) -> None:
+        """
+        This sets the lowest `logging` level that will be emitted, either overall or for
+        one component, and updates `Logger.enabled` to match. A component without a
+        level of its own follows the overall level. Setting the overall level also
+        switches logging back on after [`disable`][Computer.Logger.Logger].
+
+        Args:
+            level:
+                ...
+            component:
+                The component to set the level of, or `None` to set the overall level.
+        """
+
+        if component is None:
+            _LOGGER.setLevel(level)
+            Logger._off = False
+        else:
+            Logger._component(component).logger.setLevel(level)
+
+        Logger._refresh()
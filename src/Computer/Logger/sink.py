@@ -0,0 +1,425 @@
+import atexit
+import enum
+import logging
+import os
+import queue
+import threading
+import time
+from typing import List, Optional, TextIO, Union
+
+PATH = Union[str, os.PathLike]
+# This represents anything `open` accepts as a file name.
+
+
+class Overflow(enum.Enum):
+
+    """
+    This is what an `AsyncSink` does when its queue is full:
+        - BLOCK: wait for the background thread to make room (nothing is lost).
+        - DROP:  throw the record away.
+        - COUNT: throw the record away, but count it and write how many records were
+                 dropped into the log the next time there is room.
+    """
+
+    BLOCK = enum.auto()
+    DROP = enum.auto()
+    COUNT = enum.auto()
+
+
+class AsyncSink(logging.Handler):
+
+    """
+    This is a `logging.Handler` that takes the file I/O off the thread doing the work.
+    `emit` only puts the record on a bounded queue; a background thread takes records
+    off in batches, formats them, and writes each batch to the file with a single
+    buffered `write`. The file itself is only flushed every `FLUSH_INTERVAL` seconds
+    (and by `flush` and `close`), not after every batch. The queue is drained and the
+    file closed when the program exits, or earlier with `close`, which also removes the
+    sink from the logger it was installed on by `OUT.configure_async`.
+
+    Records are formatted on the background thread, so the arguments logged should not
+    be changed afterwards (everything logged by the circuits is immutable). A record
+    that can't be formatted is reported with `handleError` and skipped. Once the sink
+    is closed, records still handed to it are written straight away on the calling
+    thread instead (reopening the file for each one if the sink opened it itself).
+
+    Attributes:
+        queue:      the records waiting to be written (private)
+        max_size:   the most records that can be waiting on the queue (private)
+        overflow:   what to do when the queue is full (private)
+        batch_size: the most records written in one go (private)
+        file:       where the records are written to (private)
+        owns_file:  whether the file was opened by this sink (private)
+        path:       the name of the file, if the sink opened it (private)
+        dropped:    the number of records dropped since the last write (private)
+        closed:     whether the sink has stopped queueing records (private)
+        guard:      the lock protecting `dropped` and `closed` (private)
+        room:       signalled whenever the background thread takes a batch (private)
+        thread:     the background thread writing the records (private)
+    """
+
+    FLUSH_INTERVAL: float = 1.0
+    # The longest written records can sit in the file's buffer, in seconds.
+
+    _STOP = object()
+    # Put on the queue to tell the background thread to finish.
+
+    def __init__(
+        self,
+        file: Union[PATH, TextIO],
+        *,
+        max_size: int = 10_000,
+        overflow: Overflow = Overflow.BLOCK,
+        batch_size: int = 1_024,
+    ):
+        """
+        Constructor... starts the background thread.
+
+        Args:
+            file:
+                A file name to append to, or an already open text stream.
+            max_size:
+                The most records that can be waiting on the queue.
+            overflow:
+                What to do when the queue is full.
+            batch_size:
+                The most records written in one go.
+        """
+
+        super().__init__()
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        """
+        The records waiting to be written. A `SimpleQueue` is much cheaper to put on
+        than a `Queue`; its size is bounded by `emit` instead.
+
+        Type:
+            queue.SimpleQueue
+        """
+
+        self._max_size: int = max_size
+        """
+        The most records that can be waiting on the queue.
+
+        Type:
+            int
+        """
+
+        self._overflow: Overflow = overflow
+        """
+        What to do when the queue is full.
+
+        Type:
+            Overflow
+        """
+
+        self._batch_size: int = batch_size
+        """
+        The most records written in one go.
+
+        Type:
+            int
+        """
+
+        self._owns_file: bool = not hasattr(file, "write")
+        """
+        Whether the file was opened by this sink (and so needs closing by it).
+
+        Type:
+            bool
+        """
+
+        self._path: Optional[PATH] = file if self._owns_file else None
+        """
+        The name of the file, if the sink opened it (to reopen it after `close`).
+
+        Type:
+            Optional[PATH]
+        """
+
+        self._file: TextIO = (
+            open(file, "a", buffering=1 << 16) if self._owns_file else file
+        )
+        """
+        Where the records are written to.
+
+        Type:
+            TextIO
+        """
+
+        self._dropped: int = 0
+        """
+        The number of records dropped since the last write.
+
+        Type:
+            int
+        """
+
+        self._closed: bool = False
+        """
+        Whether the sink has stopped queueing records: `close` has been called, or the
+        background thread has stopped.
+
+        Type:
+            bool
+        """
+
+        self._guard: threading.Lock = threading.Lock()
+        """
+        The lock protecting `_dropped` and `_closed`, which both the threads logging
+        and the background thread change. The file is only ever written by the
+        background thread, or by `emit` once that thread has stopped.
+
+        Type:
+            threading.Lock
+        """
+
+        self._room: threading.Condition = threading.Condition()
+        """
+        Signalled whenever the background thread takes a batch off the queue, for
+        `emit` to wait on when the queue is full.
+
+        Type:
+            threading.Condition
+        """
+
+        self._thread: threading.Thread = threading.Thread(
+            target=self._drain, name="Computer-log-sink", daemon=True
+        )
+        """
+        The background thread writing the records.
+
+        Type:
+            threading.Thread
+        """
+
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of records dropped and not yet reported in the log."""
+
+        return self._dropped
+
+    def _drain(self) -> None:
+        """
+        This is the body of the background thread: it waits for a record, grabs
+        whatever else is already waiting (up to the batch size), and writes them all at
+        once. It stops when it finds `_STOP`.
+
+        This is a private method.
+        """
+
+        try:
+            self._write_batches()
+        finally:
+            with self._guard:
+                self._closed = True
+
+            # Nothing will be written any more: release anyone waiting on `flush`.
+            while True:
+                try:
+                    item: object = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if isinstance(item, threading.Event):
+                    item.set()
+
+            with self._room:
+                self._room.notify_all()
+
+    def _write(
+        self, lines: List[str], record: Optional[logging.LogRecord]
+    ) -> None:
+        """
+        This writes some formatted records to the file, reporting any failure.
+
+        This is a private method.
+
+        Args:
+            lines:
+                ...
+            record:
+                The record to blame if writing fails (if any).
+        """
+
+        try:
+            self._file.write("\n".join(lines) + "\n")
+        except Exception:
+            if record is not None:
+                self.handleError(record)
+
+    def _write_batches(self) -> None:
+        """
+        This is the loop `_drain` runs until it finds `_STOP`. An `Event` found on the
+        queue is set once everything before it has been written and flushed.
+
+        This is a private method.
+        """
+
+        flushed: float = time.monotonic()
+        dirty: bool = False
+        while True:
+            try:
+                batch: List[object] = [
+                    self._queue.get(timeout=self.FLUSH_INTERVAL if dirty else None)
+                ]
+            except queue.Empty:
+                # Nothing new for a while: push out what is sitting in the buffer.
+                self._flush_file()
+                flushed, dirty = time.monotonic(), False
+                continue
+
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            with self._room:
+                self._room.notify_all()
+
+            lines: List[str] = []
+            records: List[logging.LogRecord] = []
+            events: List[threading.Event] = []
+            for item in batch:
+                if isinstance(item, logging.LogRecord):
+                    records.append(item)
+                    try:
+                        lines.append(self.format(item))
+                    except Exception:
+                        self.handleError(item)
+                elif isinstance(item, threading.Event):
+                    events.append(item)
+
+            with self._guard:
+                dropped, self._dropped = self._dropped, 0
+
+            if dropped:
+                lines.append(f"... {dropped} log records were dropped ...")
+
+            if lines:
+                self._write(lines, records[0] if records else None)
+                dirty = True
+
+            stop: bool = self._STOP in batch
+            due: bool = time.monotonic() - flushed >= self.FLUSH_INTERVAL
+            if dirty and (events or stop or due):
+                self._flush_file()
+                flushed, dirty = time.monotonic(), False
+
+            for event in events:
+                event.set()
+
+            if stop:
+                return
+
+    def _flush_file(self) -> None:
+        """
+        This flushes the file's buffer, ignoring a file that is already closed.
+
+        This is a private method.
+        """
+
+        try:
+            if not self._file.closed:
+                self._file.flush()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """
+        This writes everything still on the queue, stops the background thread, closes
+        the file (if the sink opened it) and removes the sink from the logger (if it is
+        installed there). It is safe to call more than once.
+
+        This is a public method.
+        """
+
+        # Imported here: the logger module imports this one.
+        from .logger import Logger
+
+        atexit.unregister(self.close)
+        with self._guard:
+            stopping: bool = not self._closed
+            if stopping:
+                # Set under the same lock `flush` checks, so nothing can be queued
+                # behind `_STOP`.
+                self._closed = True
+                self._queue.put(self._STOP)
+
+        self._thread.join()
+        if stopping and self._owns_file:
+            self._file.close()
+
+        Logger._uninstall(self)
+        super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        This puts a record on the queue, following the overflow policy if it is full.
+        Once the sink is closed, the record is written straight away instead.
+
+        Args:
+            record:
+                ...
+        """
+
+        if self._queue.qsize() >= self._max_size:
+            if self._overflow is not Overflow.BLOCK:
+                if self._overflow is Overflow.COUNT:
+                    with self._guard:
+                        self._dropped += 1
+                return
+
+            with self._room:
+                while self._queue.qsize() >= self._max_size and not self._closed:
+                    self._room.wait(0.1)
+
+        with self._guard:
+            if not self._closed:
+                self._queue.put(record)
+                return
+
+        # Whatever was queued before goes first.
+        self._thread.join()
+        try:
+            line: str = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if self._owns_file and self._file.closed:
+            try:
+                with open(self._path, "a") as f:
+                    f.write(line + "\n")
+            except Exception:
+                self.handleError(record)
+            return
+
+        self._write([line], record)
+        self._flush_file()
+
+    def flush(self) -> None:
+        """
+        This waits until every record on the queue has been written to the file, and
+        flushes the file.
+
+        This is a public method.
+        """
+
+        done: threading.Event = threading.Event()
+        with self._guard:
+            closed: bool = self._closed
+            if not closed:
+                self._queue.put(done)
+
+        if closed:
+            # Everything queued is written by the time the background thread stops.
+            self._thread.join()
+            self._flush_file()
+            return
+
+        done.wait()
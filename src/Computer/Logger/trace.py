@@ -0,0 +1,462 @@
+from __future__ import annotations
+
+import contextlib
+import enum
+import json
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from .logger import MAPPING
+
+PATH = Union[str, os.PathLike]
+# This represents anything `open` accepts as a file name.
+
+EVENT = Tuple[int, int, "EventKind", int]
+# A decoded event: component, device id, kind and value.
+
+DEVICE = Tuple[str, Optional[str]]
+# A device in a dump: its class name and its name (if it has one).
+
+HEADER = struct.Struct("<4sBQI")
+# A dump starts with the magic bytes, the format version, the number of events and the
+# size of the device table in bytes. The device table (JSON, one `[class, name]` pair
+# per device id) comes next, then the events.
+
+MAGIC = b"CTRC"
+# This marks a file as a trace dump.
+
+VERSION = 2
+# The version of the dump format.
+
+
+class EventKind(enum.IntEnum):
+
+    """
+    This stores what happened in a recorded event.
+    """
+
+    OUTPUT = 0
+    """A logic gate computed its output."""
+
+    FEED = 1
+    """A connection passed a value on to its output device."""
+
+    LATCH = 2
+    """A loop stored the first value that came through it."""
+
+
+def _pack(component: int, device: int, kind: int, value: int) -> int:
+    """
+    This packs an event into a single 64-bit integer: the device id takes the top 48
+    bits, the component the next byte, and the kind and the value share the lowest
+    byte.
+
+    Args:
+        component:
+            Where the event came from (a key of `MAPPING`).
+        device:
+            ...
+        kind:
+            ...
+        value:
+            ...
+
+    Returns:
+        event:
+            ...
+    """
+
+    return (device << 16) | (component << 8) | (kind << 1) | value
+
+
+def _unpack(event: int) -> EVENT:
+    """
+    This undoes [`_pack`][Computer.Logger.trace].
+
+    Args:
+        event:
+            ...
+
+    Returns:
+        event:
+            ...
+    """
+
+    return (event >> 8) & 0xFF, event >> 16, EventKind((event & 0xFF) >> 1), event & 1
+
+
+class TraceRecorder:
+
+    """
+    This records evaluation events into a preallocated ring buffer of 64-bit integers,
+    so tracing a run costs one packed store per event instead of a formatted line. Once
+    the buffer is full, the oldest events are overwritten. The buffer can be dumped to
+    disk at any time (or automatically when an exception escapes, see
+    [`dump_on_exception`][Computer.Logger.trace.TraceRecorder]) and read back with
+    [`decode`][Computer.Logger.trace].
+
+    Only one recorder is active at a time; the circuits record into
+    `TraceRecorder.active` whenever it is set:
+
+        with TraceRecorder(capacity=1 << 16) as recorder:
+            gate.get_output_pin()
+
+        recorder.dump("trace.bin")
+
+    Devices are numbered in the order they are first seen by the recorder.
+
+    Attributes:
+        active:     the recorder the circuits currently record into
+        events:     the ring buffer of packed events (private)
+        capacity:   the number of events the buffer holds (private)
+        count:      the number of events recorded so far (private)
+        ids:        the device id given to each device, by `id()` (private)
+        devices:    the devices seen so far, kept alive so their ids aren't reused
+                    (private)
+    """
+
+    active: Optional[TraceRecorder] = None
+    # The recorder the circuits currently record into (if any).
+
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Constructor...
+
+        Args:
+            capacity:
+                The number of events the buffer holds before the oldest ones are
+                overwritten.
+        """
+
+        if capacity < 1:
+            raise ValueError("The trace buffer needs room for at least one event!")
+
+        self._events: array = array("Q", bytes(8 * capacity))
+        """
+        The ring buffer of packed events.
+
+        Type:
+            array
+        """
+
+        self._capacity: int = capacity
+        """
+        The number of events the buffer holds.
+
+        Type:
+            int
+        """
+
+        self._count: int = 0
+        """
+        The number of events recorded so far (including the overwritten ones).
+
+        Type:
+            int
+        """
+
+        self._ids: Dict[int, int] = {}
+        """
+        The device id given to each device, keyed by `id()`.
+
+        Type:
+            Dict[int, int]
+        """
+
+        self._devices: List[object] = []
+        """
+        The devices seen so far, in device id order.
+
+        Type:
+            List[object]
+        """
+
+    def __enter__(self) -> TraceRecorder:
+        """This starts recording when entering a `with` block."""
+
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """This stops recording when leaving the `with` block."""
+
+        self.stop()
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of events
+        currently held in the buffer.
+        """
+
+        return min(self._count, self._capacity)
+
+    @property
+    def devices(self) -> List[object]:
+        """Get the devices seen so far, indexed by device id."""
+
+        return self._devices
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of events that have been overwritten."""
+
+        return self._count - len(self)
+
+    def _ordered(self) -> array:
+        """
+        This returns the packed events held in the buffer, oldest first.
+
+        This is a private method.
+        """
+
+        if self._count <= self._capacity:
+            return self._events[: self._count]
+
+        head: int = self._count % self._capacity
+        return self._events[head:] + self._events[:head]
+
+    def clear(self) -> None:
+        """
+        This forgets every event recorded so far (but not the device ids).
+
+        This is a public method.
+        """
+
+        self._count = 0
+
+    def device_id(self, device: object) -> int:
+        """
+        This gets the id of a device, giving it the next free one if it hasn't been seen
+        before.
+
+        This is a public method.
+
+        Args:
+            device:
+                ...
+
+        Returns:
+            id:
+                ...
+        """
+
+        key: int = id(device)
+        ret: Optional[int] = self._ids.get(key)
+        if ret is None:
+            ret = self._ids[key] = len(self._devices)
+            self._devices.append(device)
+
+        return ret
+
+    def dump(self, path: PATH) -> None:
+        """
+        This writes the events held in the buffer to a file, oldest first, after a
+        table giving the class and name of every device id, so the dump can be read
+        without the devices.
+
+        This is a public method.
+
+        Args:
+            path:
+                ...
+        """
+
+        events: array = self._ordered()
+        if sys.byteorder == "big":
+            events.byteswap()
+
+        table: bytes = json.dumps(
+            [
+                [type(device).__name__, getattr(device, "name", None) or None]
+                for device in self._devices
+            ]
+        ).encode()
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(events), len(table)))
+            f.write(table)
+            events.tofile(f)
+
+    @contextlib.contextmanager
+    def dump_on_exception(self, path: PATH) -> Iterator[TraceRecorder]:
+        """
+        This records while inside a `with` block, and dumps the buffer to `path` if an
+        exception escapes it (the exception is still raised).
+
+        This is a public method.
+
+        Args:
+            path:
+                ...
+        """
+
+        self.start()
+        try:
+            yield self
+        except BaseException:
+            self.dump(path)
+            raise
+        finally:
+            self.stop()
+
+    def events(self) -> List[EVENT]:
+        """
+        This unpacks the events held in the buffer, oldest first.
+
+        This is a public method.
+
+        Returns:
+            events:
+                A list of `(component, device id, kind, value)` tuples.
+        """
+
+        return [_unpack(event) for event in self._ordered()]
+
+    def record(
+        self, component: int, device: object, kind: EventKind, value: int
+    ) -> None:
+        """
+        This records one event, overwriting the oldest one if the buffer is full.
+
+        This is a public method.
+
+        Args:
+            component:
+                Where the event came from (a key of `MAPPING`).
+            device:
+                The gate or connection the event happened in.
+            kind:
+                ...
+            value:
+                The `0`/`1` value involved.
+        """
+
+        self._events[self._count % self._capacity] = _pack(
+            component, self.device_id(device), kind, value
+        )
+        self._count += 1
+
+    def start(self) -> None:
+        """
+        This makes this the recorder the circuits record into.
+
+        This is a public method.
+        """
+
+        TraceRecorder.active = self
+
+    def stop(self) -> None:
+        """
+        This stops the circuits recording into this recorder.
+
+        This is a public method.
+        """
+
+        if TraceRecorder.active is self:
+            TraceRecorder.active = None
+
+
+def _read(path: PATH) -> Tuple[List[DEVICE], List[EVENT]]:
+    """
+    This reads the device table and the events back from a dump written by
+    [`TraceRecorder.dump`][Computer.Logger.trace.TraceRecorder].
+
+    This is a private function.
+
+    Args:
+        path:
+            ...
+
+    Returns:
+        devices:
+            A `(class name, name)` pair per device id.
+        events:
+            A list of `(component, device id, kind, value)` tuples, oldest first.
+
+    Raises:
+        ValueError:
+            (1) {path} is not a trace dump!
+            (2) {path} is truncated!
+    """
+
+    with open(path, "rb") as f:
+        header: bytes = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is not a trace dump!")
+
+        magic, version, count, size = HEADER.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a trace dump!")
+
+        table: bytes = f.read(size)
+        events: array = array("Q")
+        try:
+            if len(table) < size:
+                raise EOFError()
+
+            events.fromfile(f, count)
+        except (EOFError, ValueError):
+            # A partial last event makes `fromfile` raise `ValueError` instead.
+            raise ValueError(f"{path} is truncated!") from None
+
+    if sys.byteorder == "big":
+        events.byteswap()
+
+    devices: List[DEVICE] = [(cls, name) for cls, name in json.loads(table)]
+    return devices, [_unpack(event) for event in events]
+
+
+def load(path: PATH) -> List[EVENT]:
+    """
+    This reads the events back from a dump written by
+    [`TraceRecorder.dump`][Computer.Logger.trace.TraceRecorder].
+
+    Args:
+        path:
+            ...
+
+    Returns:
+        events:
+            A list of `(component, device id, kind, value)` tuples, oldest first.
+
+    Raises:
+        ValueError:
+            (1) {path} is not a trace dump!
+            (2) {path} is truncated!
+    """
+
+    return _read(path)[1]
+
+
+def decode(path: PATH) -> List[str]:
+    """
+    This turns a dump back into readable text, one line per event, naming the device
+    from the dump's device table, such as `LogicGate #3 (LogicGate and_0) OUTPUT 1`.
+
+    Args:
+        path:
+            ...
+
+    Returns:
+        lines:
+            ...
+
+    Raises:
+        ValueError:
+            (1) {path} is not a trace dump!
+            (2) {path} is truncated!
+    """
+
+    devices, events = _read(path)
+    lines: List[str] = []
+    for component, device, kind, value in events:
+        cls, name = devices[device] if device < len(devices) else ("?", None)
+        label: str = f"{cls} {name}" if name else cls
+        lines.append(
+            f"{MAPPING.get(component, component)} #{device} ({label}) {kind.name} "
+            f"{value}"
+        )
+
+    return lines
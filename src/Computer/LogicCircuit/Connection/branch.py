@@ -1,10 +1,11 @@
 from typing import Dict, List
 
 from Computer.Bit import Bit
-from Computer.Logger import OUT
+from Computer.Logger import OUT, EventKind, TraceRecorder
 from Computer.LogicCircuit.abc import IBranch, IConnection
+from Computer.LogicCircuit.memo import Memo
 
-INFO = lambda msg: OUT.info(msg, level=4)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=4)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 
@@ -96,6 +97,40 @@ class Branch(IBranch):
 
         INFO("Mapping validated, applying the mapping.")
 
+    def _feed_value(self, *, index: int) -> int:
+        """
+        This does the actual work of [`feed`][Computer.LogicCircuit.Connection.Branch]
+        on plain `0`/`1` integers.
+
+        This is a private method.
+
+        Args:
+            index:
+                Who called this method.
+
+        Returns:
+            information:
+                The output of the device connected to this instance's input.
+        """
+
+        # For the love of god, don't shoot ourselves in the foot.
+        if not 0 <= index < len(self._output_connections):
+            raise BranchError(f"{index} doesn't correspond to any output connection!")
+
+        output: int = self._input_connections[self._mapping[index]]._feed_value()
+        if OUT.enabled:
+            INFO(
+                "Feeding information %s from input %d to the output %d.",
+                Bit.trusted(output),
+                self._mapping[index],
+                index,
+            )
+
+        if TraceRecorder.active is not None:
+            TraceRecorder.active.record(4, self, EventKind.FEED, output)
+
+        return output
+
     def feed(self, *, index: int) -> Bit:
         """
         This is the primary method of this class. It will check to see that a valid
@@ -118,16 +153,10 @@ class Branch(IBranch):
                 The output of the device connected to this instance's input.
         """
 
-        # For the love of god, don't shoot ourselves in the foot.
-        if index not in list(range(len(self._output_connections))):
-            raise BranchError(f"{index} doesn't correspond to any output connection!")
+        if Memo.enabled:
+            Memo.next_epoch()
 
-        output: Bit = self._input_connections[self._mapping[index]].feed()
-        INFO(
-            f"Feeding information {output} from input {self._mapping[index]} to the "
-            f"output {index}."
-        )
-        return output
+        return Bit.trusted(self._feed_value(index=index))
 
     def has_input_connection_set(self) -> bool:
         """
@@ -1,11 +1,12 @@
 from typing import Optional, Tuple
 
 from Computer.Bit import Bit
-from Computer.Logger import OUT
+from Computer.Logger import OUT, EventKind, TraceRecorder
 from Computer.LogicCircuit.abc import (IBranch, IConnection, ILogicGate, ILoop,
                                        ISwitch)
+from Computer.LogicCircuit.memo import Memo
 
-INFO = lambda msg: OUT.info(msg, level=3)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=3)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 DEVICE = (
@@ -56,16 +57,29 @@ class Connection(IConnection):
             Optional[LogicGate | Branch | Switch | Loop]
         """
 
-    def feed(self) -> Bit:
+        self._memo_epoch: int = -1
         """
-        This is the primary method of this class. It will check to see if the input has
-        been set, and will try to get information from it. If it is a `LogicGate`
-        instance, then it will try to call
-        [`get_output_pin()`][Computer.LogicCircuit.LogicGate.get_output_pin].
+        The evaluation epoch the cached value was computed in (see `Memo`).
 
-        NOTE:
-            This method is marked public and can be called by the user, though it is
-            more likely to be called by the output device instead.
+        Type:
+            int
+        """
+
+        self._memo_value: int = 0
+        """
+        The value computed in `_memo_epoch`.
+
+        Type:
+            int
+        """
+
+    def _feed_value(self) -> int:
+        """
+        This does the actual work of [`feed`][Computer.LogicCircuit.Connection] on
+        plain `0`/`1` integers, pulling from the input device's integer path instead
+        of its `Bit` path.
+
+        This is a private method.
 
         Returns:
             information:
@@ -76,18 +90,57 @@ class Connection(IConnection):
         if not self.has_input_connection_set():
             raise ConnectionError("The output connection has not been set yet!")
 
+        # Hand back this evaluation's value if it has already been fed once.
+        if Memo.enabled and self._memo_epoch == Memo.epoch:
+            Memo.saved += 1
+            return self._memo_value
+
         if isinstance(self._input_connection, ILogicGate):
-            output: Bit = self._input_connection.get_output_pin()
+            output: int = self._input_connection._get_output_value()
         elif isinstance(self._input_connection, tuple):
-            output: Bit = self._input_connection[0].feed(
+            output: int = self._input_connection[0]._feed_value(
                 index=self._input_connection[1]
             )
         elif isinstance(self._input_connection, ISwitch):
-            output: Bit = self._input_connection.feed()
+            output: int = self._input_connection._feed_value()
+
+        if OUT.enabled:
+            INFO("Feeding information %s to the output device.", Bit.trusted(output))
+
+        if TraceRecorder.active is not None:
+            TraceRecorder.active.record(3, self, EventKind.FEED, output)
+
+        if Memo.enabled:
+            self._memo_epoch = Memo.epoch
+            self._memo_value = output
 
-        INFO(f"Feeding information {output} to the output device.")
         return output
 
+    def feed(self) -> Bit:
+        """
+        This is the primary method of this class. It will check to see if the input has
+        been set, and will try to get information from it. If it is a `LogicGate`
+        instance, then it will try to call
+        [`get_output_pin()`][Computer.LogicCircuit.LogicGate.get_output_pin].
+
+        Internally, everything upstream is evaluated on plain integers (see
+        [`_feed_value`][Computer.LogicCircuit.Connection]); the result is only turned
+        back into a `Bit` here.
+
+        NOTE:
+            This method is marked public and can be called by the user, though it is
+            more likely to be called by the output device instead.
+
+        Returns:
+            information:
+                The output of the device connected to this instance's input.
+        """
+
+        if Memo.enabled:
+            Memo.next_epoch()
+
+        return Bit.trusted(self._feed_value())
+
     def has_input_connection_set(self) -> bool:
         """
         This method will check to see if there is a device connected to the input of
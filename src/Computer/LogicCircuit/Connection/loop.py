@@ -1,10 +1,11 @@
 from typing import List, Optional
 
 from Computer.Bit import Bit
-from Computer.Logger import OUT
+from Computer.Logger import OUT, EventKind, TraceRecorder
 from Computer.LogicCircuit.abc import IBit, IConnection, ILoop
+from Computer.LogicCircuit.memo import Memo
 
-INFO = lambda msg: OUT.info(msg, level=6)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=6)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 
@@ -56,22 +57,12 @@ class Loop(ILoop):
             Optional[Bit]
         """
 
-    def feed(self, *, index: int) -> Bit:
+    def _feed_value(self, *, index: int) -> int:
         """
-        This is the primary method of this class. It will check to see that a valid
-        output connection has been set. It will then invoke that input conneciton's
-        [`feed`][Computer.LogicCircuit.Connection.Connection] method. This will handle
-        the two outputs differently:
-            - Output 0: this is the output to the world, acts normally.
-            - Output 1: this is the "loop", it is will return whatever is stored in the
-                        memory.
+        This does the actual work of [`feed`][Computer.LogicCircuit.Connection.Loop]
+        on plain `0`/`1` integers. The memory itself still holds a `Bit`.
 
-        TODO: can this be implemented cleaner? Passing `index` seems like a work-around
-        since we need to know which output connection called this feed method.
-
-        NOTE:
-            This method is marked public and can be called by the user, though it is
-            more likely to be called by the output connection instead.
+        This is a private method.
 
         Args:
             index:
@@ -84,7 +75,7 @@ class Loop(ILoop):
         """
 
         # Let's behave ourselves and not shoot ourselves in the foot.
-        if index not in list(range(len(self._output_connections))):
+        if not 0 <= index < len(self._output_connections):
             raise LoopError(f"You entered an unknown connection: {index}!")
 
         # Connection to the outside world
@@ -93,17 +84,21 @@ class Loop(ILoop):
             if not self.has_input_connection_set():
                 raise LoopError("The input connection has not been set yet!")
 
-            output: IBit = self._input_connection.feed()
-            INFO(
-                f"Feeding inforation {output} from outside the loop to the output "
-                "connection."
-            )
+            output: int = self._input_connection._feed_value()
+            if OUT.enabled:
+                INFO(
+                    "Feeding inforation %s from outside the loop to the output "
+                    "connection.",
+                    Bit.trusted(output),
+                )
 
             # Save the memory, single went through and now should be circulated
             # indefinitly until the end of the program.
             if self._memory is None:
-                INFO(f"The loop wasn't energized yet and now holds {output}.")
-                self._memory = output
+                self._memory = Bit.trusted(output)
+                INFO("The loop wasn't energized yet and now holds %s.", self._memory)
+                if TraceRecorder.active is not None:
+                    TraceRecorder.active.record(6, self, EventKind.LATCH, output)
 
         # The "loop"
         elif index == 1:
@@ -111,14 +106,50 @@ class Loop(ILoop):
             if self._memory is None:
                 raise LoopError("Looks like no signal came through yet!")
 
-            output: IBit = self._memory
-            INFO(
-                f"Feeding infomation {output} held in the loop to the output "
-                "connection."
-            )
+            output: int = int(self._memory is Bit.ON)
+            if OUT.enabled:
+                INFO(
+                    "Feeding infomation %s held in the loop to the output connection.",
+                    self._memory,
+                )
+
+        if TraceRecorder.active is not None:
+            TraceRecorder.active.record(6, self, EventKind.FEED, output)
 
         return output
 
+    def feed(self, *, index: int) -> Bit:
+        """
+        This is the primary method of this class. It will check to see that a valid
+        output connection has been set. It will then invoke that input conneciton's
+        [`feed`][Computer.LogicCircuit.Connection.Connection] method. This will handle
+        the two outputs differently:
+            - Output 0: this is the output to the world, acts normally.
+            - Output 1: this is the "loop", it is will return whatever is stored in the
+                        memory.
+
+        TODO: can this be implemented cleaner? Passing `index` seems like a work-around
+        since we need to know which output connection called this feed method.
+
+        NOTE:
+            This method is marked public and can be called by the user, though it is
+            more likely to be called by the output connection instead.
+
+        Args:
+            index:
+                Who called this method.
+
+        Returns:
+            information:
+                The output of the device connected to this instance's input or from the
+                stored memory.
+        """
+
+        if Memo.enabled:
+            Memo.next_epoch()
+
+        return Bit.trusted(self._feed_value(index=index))
+
     def has_input_connection_set(self) -> bool:
         """
         This method will check to see if there is an input connection.
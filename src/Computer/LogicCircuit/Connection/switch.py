@@ -1,12 +1,13 @@
 from typing import List, Optional
 
 from Computer.Bit import Bit
-from Computer.Logger import OUT
+from Computer.Logger import OUT, EventKind, TraceRecorder
 from Computer.LogicCircuit.abc import IConnection, ISwitch
 from Computer.LogicCircuit.Connection import ConnectionError
 from Computer.LogicCircuit.LogicGate import LogicGateError
+from Computer.LogicCircuit.memo import Memo
 
-INFO = lambda msg: OUT.info(msg, level=5)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=5)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 ERROR = (ConnectionError, LogicGateError)
@@ -56,18 +57,12 @@ class Switch(ISwitch):
             Connection
         """
 
-    def feed(self) -> Bit:
+    def _feed_value(self) -> int:
         """
-        This is the primary method of this class. It will find the first input
-        connection that is set, and will try calling its
-        [`feed()`][Computer.LogicCircuit.Connection.Connection] method.
+        This does the actual work of [`feed`][Computer.LogicCircuit.Connection.Switch]
+        on plain `0`/`1` integers.
 
-        TODO: should we check to see if all the connections were set, and yell at the
-        user :/
-
-        NOTE:
-            This method is marked public and can be called by the user, though it is
-            more likely to be called by the output device instead.
+        This is a private method.
 
         Returns:
             information:
@@ -80,19 +75,50 @@ class Switch(ISwitch):
         ) and not self.has_input_connection_set(index=1):
             raise SwitchError("The input connections have not all been set!")
 
-        INFO("Attempting to feed information to the output connection.")
+        if OUT.enabled:
+            INFO("Attempting to feed information to the output connection.")
 
         for c, conn in enumerate(self._input_connections):
             try:
-                INFO(f"Attemping to feed from input connection {c}.")
-                output: Bit = conn.feed()
-                INFO(f"Feeding information {output} to the output.")
+                if OUT.enabled:
+                    INFO("Attemping to feed from input connection %d.", c)
+
+                output: int = conn._feed_value()
+                if OUT.enabled:
+                    INFO("Feeding information %s to the output.", Bit.trusted(output))
+
+                if TraceRecorder.active is not None:
+                    TraceRecorder.active.record(5, self, EventKind.FEED, output)
+
                 return output
             except ERROR:
                 continue
         else:
             raise SwitchError("It looks like nothing is connected!")
 
+    def feed(self) -> Bit:
+        """
+        This is the primary method of this class. It will find the first input
+        connection that is set, and will try calling its
+        [`feed()`][Computer.LogicCircuit.Connection.Connection] method.
+
+        TODO: should we check to see if all the connections were set, and yell at the
+        user :/
+
+        NOTE:
+            This method is marked public and can be called by the user, though it is
+            more likely to be called by the output device instead.
+
+        Returns:
+            information:
+                The output of the device connected to this instance's input.
+        """
+
+        if Memo.enabled:
+            Memo.next_epoch()
+
+        return Bit.trusted(self._feed_value())
+
     def has_input_connection_set(self, *, index: int) -> bool:
         """
         This method will check to see if there is a connection made to the input.
@@ -157,7 +183,7 @@ class Switch(ISwitch):
         if self.has_input_connection_set(index=index):
             raise SwitchError(f"Input connection {index} has already been connected!")
 
-        INFO(f"Adding a connection to input {index}.")
+        INFO("Adding a connection to input %d.", index)
         self._input_connections[index] = conn
 
     def set_output_connection(self, *, conn: IConnection) -> None:
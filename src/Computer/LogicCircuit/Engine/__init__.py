@@ -0,0 +1,17 @@
+from .program import Op, Program, ProgramError  # noqa: F401
+from .compiler import CompileError, compile_circuit  # noqa: F401
+from .check import disagreements  # noqa: F401
+from .codegen import compile_function, generate_source  # noqa: F401
+from .iterative import EvaluationError, evaluate_iterative  # noqa: F401
+from .parallel import (exhaustive_patterns, pack, run_exhaustive,  # noqa: F401
+                       run_parallel, unpack)
+from .batch import evaluate_many  # noqa: F401
+from .pool import ShardedRunner  # noqa: F401
+from .event import EventSimulator  # noqa: F401
+from .truth_table import truth_table  # noqa: F401
+
+try:
+    from .vectorized import run_vectorized  # noqa: F401
+except ImportError:
+    # NumPy is an optional dependency: only the vectorized engine needs it.
+    pass
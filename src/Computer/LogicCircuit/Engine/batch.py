@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Union
+
+from Computer.Bit import Bit
+from Computer.Bit.abc import IBit
+from Computer.LogicCircuit.circuit import Circuit, CircuitError
+from Computer.LogicCircuit.Engine.compiler import CompileError, compile_circuit
+from Computer.LogicCircuit.Engine.parallel import pack, run_parallel, unpack
+from Computer.LogicCircuit.Engine.program import Program
+
+try:
+    import numpy as np
+
+    from Computer.Bit import BitMatrix
+    from Computer.LogicCircuit.Engine.vectorized import run_vectorized
+except ImportError:
+    # NumPy is an optional dependency: only bit matrices and arrays need it.
+    np = None
+    BitMatrix = None
+
+VECTORS = Union[Iterable[Sequence[Union[IBit, int]]], "BitMatrix", "np.ndarray"]
+# A batch of input vectors: rows of bits (or `0`/`1`), a bit matrix or a 2D array.
+
+
+def _rows(
+    vectors: Iterable[Sequence[Union[IBit, int]]], width: int
+) -> Iterable[List[int]]:
+    """
+    This converts input vectors to lists of `0`/`1`, checking their length.
+
+    This is a private function.
+
+    Args:
+        vectors:
+            ...
+        width:
+            The number of primary inputs.
+
+    Returns:
+        rows:
+            ...
+
+    Raises:
+        CircuitError:
+            Vector {v} has {m} values, but the circuit has {n} inputs!
+    """
+
+    for v, vector in enumerate(vectors):
+        if len(vector) != width:
+            raise CircuitError(
+                f"Vector {v} has {len(vector)} values, but the circuit has {width} "
+                "inputs!"
+            )
+
+        yield [
+            value if isinstance(value, int) else int(value is Bit.ON)
+            for value in vector
+        ]
+
+
+def evaluate_many(target: Union[Circuit, Program], vectors: VECTORS) -> Union[
+    List[List[Bit]], "BitMatrix", "np.ndarray"
+]:
+    """
+    This evaluates a circuit on a whole batch of input vectors. The circuit is
+    compiled once, so nothing is rewired, validated or dispatched per vector; pass the
+    compiled program instead to skip compiling on every call as well. A bit matrix or
+    an array goes through the vectorized engine (see
+    [`run_vectorized`][Computer.LogicCircuit.Engine.vectorized.run_vectorized]): one
+    NumPy call per gate for the whole batch. Other vectors go through the bit-parallel
+    engine (see [`run_parallel`][Computer.LogicCircuit.Engine.parallel.run_parallel]),
+    which needs no NumPy: one Python `int` operation per gate for the whole batch. A
+    circuit that can't be compiled (it has a loop) is evaluated through its gates, one
+    vector at a time.
+
+        evaluate_many(adder, [(0, 1, 1), (1, 1, 1)])
+        evaluate_many(adder, BitMatrix.from_ints(range(8), 3))
+
+        program = compile_circuit(adder)
+        for batch in batches:
+            evaluate_many(program, batch)
+
+    The outputs come back in the same form as the inputs: a bit matrix for a bit
+    matrix, a 2D `uint8` array for a 2D array, and one list of bits per vector
+    otherwise.
+
+    This is a public function.
+
+    Args:
+        target:
+            The circuit (compiled first) or program to evaluate.
+        vectors:
+            One row per input vector, one column per primary input.
+
+    Returns:
+        outputs:
+            One row per input vector, one column per primary output.
+
+    Raises:
+        CircuitError:
+            (1) The batch has {m} columns, but the circuit has {n} inputs!
+            (2) Vector {v} has {m} values, but the circuit has {n} inputs!
+    """
+
+    program: Optional[Program] = target if isinstance(target, Program) else None
+    if program is None:
+        try:
+            program = compile_circuit(target)
+        except CompileError:
+            pass
+
+    width: int = (
+        len(target.input_names) if program is None else len(program.input_slots)
+    )
+    as_matrix: bool = BitMatrix is not None and isinstance(vectors, BitMatrix)
+    as_array: bool = np is not None and isinstance(vectors, np.ndarray)
+    if as_matrix or as_array:
+        array: np.ndarray = vectors.to_array() if as_matrix else np.asarray(vectors)
+        if array.ndim != 2 or array.shape[1] != width:
+            raise CircuitError(
+                f"The batch has {array.shape[-1]} columns, but the circuit has {width} "
+                "inputs!"
+            )
+
+        if program is not None:
+            result: np.ndarray = run_vectorized(program, array)
+        else:
+            result = np.array(
+                [
+                    [int(bit is Bit.ON) for bit in target.evaluate(row)]
+                    for row in array.astype(bool).astype(int).tolist()
+                ],
+                dtype=np.uint8,
+            ).reshape(len(array), len(target.output_names))
+
+        return BitMatrix.from_array(result) if as_matrix else result
+
+    rows: List[List[int]] = list(_rows(vectors, width))
+    if program is not None:
+        words: List[int] = run_parallel(program, pack(rows, width), len(rows))
+        outputs: List[Sequence[int]] = unpack(words, len(rows))
+    else:
+        outputs = [
+            [int(bit is Bit.ON) for bit in target.evaluate(row)] for row in rows
+        ]
+
+    return [[Bit.trusted(value) for value in output] for output in outputs]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit.circuit import Circuit
+
+ENGINE = Callable[[Sequence[int]], Sequence[int]]
+# Anything that maps one `0`/`1` per primary input to one `0`/`1` per primary output,
+# like `Program.run`.
+
+MISMATCH = Tuple[Tuple[int, ...], List[int], List[int]]
+# The input vector, the outputs of the circuit and the outputs of the engine.
+
+EXHAUSTIVE: int = 12
+# Circuits with at most this many inputs are checked on every input pattern.
+
+SAMPLES: int = 1_024
+# The number of random input patterns checked on bigger circuits.
+
+
+def disagreements(
+    circuit: Circuit,
+    engine: ENGINE,
+    vectors: Optional[Iterable[Sequence[int]]] = None,
+    *,
+    seed: int = 0,
+) -> List[MISMATCH]:
+    """
+    This runs a circuit through the gates themselves (`Circuit.evaluate`) and through
+    another engine on the same input vectors, and collects every vector where the two
+    disagree. An empty list means they agree.
+
+        program = compile_circuit(circuit)
+        assert not disagreements(circuit, program.run)
+
+    This is a public function.
+
+    Args:
+        circuit:
+            The reference circuit.
+        engine:
+            The engine checked against it.
+        vectors:
+            The input vectors to check. By default, every pattern if the circuit has at
+            most `EXHAUSTIVE` inputs, or `SAMPLES` random patterns otherwise.
+        seed:
+            The seed of the random patterns.
+
+    Returns:
+        mismatches:
+            One `(vector, expected, got)` triple per disagreement.
+    """
+
+    width: int = len(circuit.input_names)
+    if vectors is None:
+        if width <= EXHAUSTIVE:
+            vectors = itertools.product((0, 1), repeat=width)
+        else:
+            rng: random.Random = random.Random(seed)
+            vectors = (
+                [rng.getrandbits(1) for _ in range(width)] for _ in range(SAMPLES)
+            )
+
+    mismatches: List[MISMATCH] = []
+    for vector in vectors:
+        vector = tuple(vector)
+        expected: List[int] = [
+            int(bit is Bit.ON) for bit in circuit.evaluate(vector)
+        ]
+        got: List[int] = list(engine(vector))
+        if got != expected:
+            mismatches.append((vector, expected, got))
+
+    return mismatches
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import functools
+import keyword
+import re
+from typing import Callable, Dict, List, Tuple, Union
+
+from Computer.LogicCircuit.circuit import Circuit
+from Computer.LogicCircuit.Engine.compiler import compile_circuit
+from Computer.LogicCircuit.Engine.program import (ONE, ZERO, Op, Program,
+                                                  ProgramError)
+
+FUNCTION = Callable[..., Tuple[int, ...]]
+# A generated function: one `0`/`1` argument per primary input, and a tuple of one
+# `0`/`1` per primary output.
+
+OPERATORS: Dict[Op, str] = {Op.AND: "&", Op.OR: "|", Op.XOR: "^"}
+# The Python operator each operation is written as.
+
+CACHE_SIZE: int = 128
+# The most generated functions kept around (the least recently used go first).
+
+
+def _identifier(name: str) -> bool:
+    """
+    This checks whether a name can be written in the generated source as a name.
+
+    This is a private function.
+
+    Args:
+        name:
+            ...
+
+    Returns:
+        usable:
+            ...
+    """
+
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _usable(name: str) -> bool:
+    """
+    This checks whether an input name can be used as an argument name.
+
+    This is a private function.
+
+    Args:
+        name:
+            ...
+
+    Returns:
+        usable:
+            ...
+    """
+
+    return _identifier(name) and re.fullmatch(r"t\d+", name) is None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _build(program: Program, name: str) -> FUNCTION:
+    """
+    This generates and `exec`s the function running a program. Programs compare by
+    value, so recompiling the same circuit gets the cached function back without
+    generating or compiling any source.
+
+    This is a private function.
+
+    Args:
+        program:
+            ...
+        name:
+            The name of the generated function.
+
+    Returns:
+        function:
+            ...
+    """
+
+    source: str = generate_source(program, name=name)
+    namespace: Dict[str, FUNCTION] = {}
+    exec(compile(source, f"<circuit {name}>", "exec"), namespace)
+    function: FUNCTION = namespace[name]
+    function.source = source
+    return function
+
+
+def generate_source(program: Program, *, name: str = "circuit") -> str:
+    """
+    This writes the source of a straight-line Python function running a program: one
+    argument per primary input, one local variable per gate, and a tuple of the
+    primary outputs.
+
+        def circuit(a, b):
+            t4 = a & b
+            t5 = t4 ^ 1
+            return (t5,)
+
+    Arguments are named after the inputs when all the names are distinct identifiers
+    that can't clash with the local variables, and `i<n>` otherwise.
+
+    This is a public function.
+
+    Args:
+        program:
+            ...
+        name:
+            The name of the generated function.
+
+    Returns:
+        source:
+            ...
+
+    Raises:
+        ProgramError:
+            {name} is not a valid function name!
+    """
+
+    if not _identifier(name):
+        raise ProgramError(f"{name} is not a valid function name!")
+
+    # The input names are only used if every one of them is.
+    arguments: List[str] = list(program.input_names)
+    distinct: bool = len(set(arguments)) == len(arguments) == len(program.input_slots)
+    if not distinct or not all(_usable(argument) for argument in arguments):
+        arguments = [f"i{index}" for index in range(len(program.input_slots))]
+
+    names: Dict[int, str] = {ZERO: "0", ONE: "1"}
+    names.update(zip(program.input_slots, arguments))
+
+    lines: List[str] = [f"def {name}({', '.join(arguments)}):"]
+    for op, a, b, out in program.instructions:
+        names[out] = f"t{out}"
+        lines.append(f"    t{out} = {names[a]} {OPERATORS[op]} {names[b]}")
+
+    outputs: List[str] = [names[slot] for slot in program.output_slots]
+    lines.append(f"    return ({', '.join(outputs)}{',' if len(outputs) == 1 else ''})")
+    return "\n".join(lines) + "\n"
+
+
+def compile_function(
+    target: Union[Circuit, Program], *, name: str = "circuit"
+) -> FUNCTION:
+    """
+    This generates, `exec`s and caches the straight-line function running a circuit
+    (compiled first) or a program. The function's source is kept in its `source`
+    attribute. The last `CACHE_SIZE` functions are cached, keyed on the program and the
+    name.
+
+        adder = compile_function(circuit)
+        total, carry = adder(1, 0, 1)
+        print(adder.source)
+
+    This is a public function.
+
+    Args:
+        target:
+            ...
+        name:
+            The name of the generated function.
+
+    Returns:
+        function:
+            ...
+
+    Raises:
+        ProgramError:
+            {name} is not a valid function name!
+    """
+
+    program: Program = (
+        compile_circuit(target) if isinstance(target, Circuit) else target
+    )
+    return _build(program, name)
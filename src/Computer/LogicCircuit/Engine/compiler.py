@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from Computer.LogicCircuit.abc import IBranch, ILogicGate, ILoop
+from Computer.LogicCircuit.circuit import Circuit, Source, SourceKind
+from Computer.LogicCircuit.Engine.program import (INSTRUCTION, ONE, ZERO, Op,
+                                                  Program)
+from Computer.LogicCircuit.LogicGate import LogicType
+
+
+class CompileError(Exception):
+    """Handle any errors associated with compiling a circuit."""
+
+    ...
+
+
+OPS: Dict[LogicType, Op] = {
+    LogicType.AND: Op.AND,
+    LogicType.OR: Op.OR,
+    LogicType.NOT: Op.XOR,
+}
+# The operation each primitive gate is compiled to.
+
+
+def compile_circuit(circuit: Circuit) -> Program:
+    """
+    This compiles a circuit into a [`Program`][Computer.LogicCircuit.Engine.Program].
+    The circuit's devices are already in topological order, so they are walked once:
+    every primitive gate becomes one instruction writing its own slot, and every wire
+    becomes an alias for the slot it carries.
+
+    - A connection carries the slot of whatever feeds it.
+    - A branch output carries the slot of the input it is mapped to.
+    - A switch is resolved once, to its first connected input (the one a switch
+      evaluated through the gates reads).
+    - Loops hold state between evaluations, so circuits with loops can't be compiled.
+
+    This is a public function.
+
+    Args:
+        circuit:
+            ...
+
+    Returns:
+        program:
+            ...
+
+    Raises:
+        CompileError:
+            The circuit has a loop, and loops can't be compiled!
+    """
+
+    devices = circuit.devices
+    sources: List[Tuple[Source, ...]] = circuit.sources
+    num_inputs: int = len(circuit.input_names)
+
+    # The slot carried by each device; a branch carries one slot per input.
+    slots: List[object] = [None] * len(devices)
+    instructions: List[INSTRUCTION] = []
+    next_slot: int = 2 + num_inputs
+
+    def resolve(source: Source) -> int:
+        if source.kind is SourceKind.CONSTANT:
+            return ONE if source.index else ZERO
+
+        if source.kind is SourceKind.INPUT:
+            return 2 + source.index
+
+        if isinstance(devices[source.index], IBranch):
+            return slots[source.index][devices[source.index]._mapping[source.port]]
+
+        return slots[source.index]
+
+    for d, device in enumerate(devices):
+        if isinstance(device, ILoop):
+            raise CompileError("The circuit has a loop, and loops can't be compiled!")
+
+        if isinstance(device, ILogicGate):
+            pins: List[int] = [resolve(source) for source in sources[d]]
+            if device._type == LogicType.NOT:
+                pins.append(ONE)
+
+            instructions.append((OPS[device._type], pins[0], pins[1], next_slot))
+            slots[d] = next_slot
+            next_slot += 1
+        elif isinstance(device, IBranch):
+            slots[d] = [resolve(source) for source in sources[d]]
+        else:
+            # Connections, and switches resolved to their first connected input.
+            slots[d] = resolve(sources[d][0])
+
+    return Program(
+        num_slots=next_slot,
+        input_slots=range(2, 2 + num_inputs),
+        output_slots=[slots[d] for d in circuit.output_ids],
+        instructions=instructions,
+        input_names=circuit.input_names,
+        output_names=circuit.output_names,
+    )
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import heapq
+from typing import List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from Computer.LogicCircuit.circuit import Circuit
+from Computer.LogicCircuit.Engine.compiler import compile_circuit
+from Computer.LogicCircuit.Engine.program import (ONE, STEP, Program,
+                                                  ProgramError)
+
+
+class EventSimulator:
+
+    """
+    This implements an event-driven, incremental simulation of a compiled circuit. It
+    remembers the value of every slot, so when some inputs change, only the gates
+    reading a changed value are evaluated again. A gate whose output doesn't change
+    stops the propagation there.
+
+    Gates waiting to be evaluated are kept in a heap ordered by instruction index.
+    Instructions are in topological order, so each gate is evaluated at most once per
+    step, after everything it reads is final.
+
+        simulator = EventSimulator(circuit)
+        simulator.set({0: 1})
+        print(simulator.outputs, simulator.evaluations)
+
+    Attributes:
+        program:        the compiled circuit (read-only)
+        evaluations:    the number of gate evaluations so far (read-only)
+        inputs:         the current value of each primary input (read-only)
+        outputs:        the current value of each primary output (read-only)
+        slots:          the current value of every slot (private)
+        readers:        the instructions reading each slot (private)
+    """
+
+    def __init__(
+        self,
+        target: Union[Circuit, Program],
+        values: Optional[Sequence[int]] = None,
+    ):
+        """
+        Constructor... evaluates the whole circuit once.
+
+        Args:
+            target:
+                The circuit (compiled first) or program to simulate.
+            values:
+                The initial value of each primary input (all `0` by default).
+        """
+
+        self._program: Program = (
+            compile_circuit(target) if isinstance(target, Circuit) else target
+        )
+        """
+        The compiled circuit.
+
+        Type:
+            Program
+        """
+
+        self._readers: List[List[int]] = [[] for _ in range(self._program.num_slots)]
+        """
+        The indices of the instructions reading each slot.
+
+        Type:
+            List[List[int]]
+        """
+
+        for index, (_, a, b, _) in enumerate(self._program.instructions):
+            self._readers[a].append(index)
+            if b != a:
+                self._readers[b].append(index)
+
+        self._slots: List[int] = []
+        """
+        The current value of every slot.
+
+        Type:
+            List[int]
+        """
+
+        self._evaluations: int = 0
+        """
+        The number of gate evaluations so far.
+
+        Type:
+            int
+        """
+
+        self.reset(values)
+
+    @property
+    def evaluations(self) -> int:
+        """Get the number of gate evaluations so far."""
+
+        return self._evaluations
+
+    @property
+    def inputs(self) -> List[int]:
+        """Get the current value of each primary input."""
+
+        return [self._slots[slot] for slot in self._program.input_slots]
+
+    @property
+    def outputs(self) -> List[int]:
+        """Get the current value of each primary output."""
+
+        return [self._slots[slot] for slot in self._program.output_slots]
+
+    @property
+    def program(self) -> Program:
+        """Get the compiled circuit."""
+
+        return self._program
+
+    def _propagate(self, queue: List[int], queued: Set[int]) -> None:
+        """
+        This evaluates the queued gates in order until nothing changes any more.
+
+        This is a private method.
+
+        Args:
+            queue:
+                The heap of queued instruction indices.
+            queued:
+                The instruction indices queued so far in this step.
+        """
+
+        slots: List[int] = self._slots
+        steps: Tuple[STEP, ...] = self._program._steps
+        evaluations: int = 0
+        while queue:
+            function, a, b, out = steps[heapq.heappop(queue)]
+            evaluations += 1
+            output: int = function(slots[a], slots[b])
+            # An unchanged output stops the propagation here.
+            if output == slots[out]:
+                continue
+
+            slots[out] = output
+            self._schedule(out, queue, queued)
+
+        self._evaluations += evaluations
+
+    def _schedule(self, slot: int, queue: List[int], queued: Set[int]) -> None:
+        """
+        This queues every gate reading a slot that changed (once per step).
+
+        This is a private method.
+
+        Args:
+            slot:
+                ...
+            queue:
+                The heap of queued instruction indices.
+            queued:
+                The instruction indices queued so far in this step.
+        """
+
+        for reader in self._readers[slot]:
+            if reader not in queued:
+                queued.add(reader)
+                heapq.heappush(queue, reader)
+
+    def flip(self, index: int) -> None:
+        """
+        This flips one primary input and propagates the change, like `toggle`, but
+        without validating the index or reading the outputs back.
+
+        This is a public method.
+
+        Args:
+            index:
+                The index of the primary input.
+        """
+
+        slot: int = self._program.input_slots[index]
+        self._slots[slot] ^= 1
+        queue: List[int] = []
+        queued: Set[int] = set()
+        self._schedule(slot, queue, queued)
+        self._propagate(queue, queued)
+
+    def reset(self, values: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        This sets every primary input and evaluates the whole circuit from scratch.
+
+        This is a public method.
+
+        Args:
+            values:
+                The value of each primary input (all `0` by default).
+
+        Returns:
+            outputs:
+                ...
+
+        Raises:
+            ProgramError:
+                The program has {n} inputs, but {m} values were given!
+        """
+
+        if values is None:
+            values = [0] * len(self._program.input_slots)
+
+        if len(values) != len(self._program.input_slots):
+            raise ProgramError(
+                f"The program has {len(self._program.input_slots)} inputs, but "
+                f"{len(values)} values were given!"
+            )
+
+        slots: List[int] = [0] * self._program.num_slots
+        slots[ONE] = 1
+        for slot, value in zip(self._program.input_slots, values):
+            slots[slot] = int(value)
+
+        for function, a, b, out in self._program._steps:
+            slots[out] = function(slots[a], slots[b])
+
+        self._slots = slots
+        self._evaluations += len(self._program)
+        return self.outputs
+
+    def set(self, changes: Mapping[int, int]) -> List[int]:
+        """
+        This changes some primary inputs and propagates the change: only the gates
+        reading a value that changed are evaluated again.
+
+        This is a public method.
+
+        Args:
+            changes:
+                The new value of each primary input that changes, by input index.
+
+        Returns:
+            outputs:
+                ...
+
+        Raises:
+            ProgramError:
+                The program has no input {index}!
+        """
+
+        queue: List[int] = []
+        queued: Set[int] = set()
+        for index, value in changes.items():
+            if not 0 <= index < len(self._program.input_slots):
+                raise ProgramError(f"The program has no input {index}!")
+
+            slot: int = self._program.input_slots[index]
+            if self._slots[slot] != value:
+                self._slots[slot] = int(value)
+                self._schedule(slot, queue, queued)
+
+        self._propagate(queue, queued)
+        return self.outputs
+
+    def toggle(self, index: int) -> List[int]:
+        """
+        This flips one primary input and propagates the change (see `set`).
+
+        This is a public method.
+
+        Args:
+            index:
+                The index of the primary input.
+
+        Returns:
+            outputs:
+                ...
+
+        Raises:
+            ProgramError:
+                The program has no input {index}!
+        """
+
+        if not 0 <= index < len(self._program.input_slots):
+            raise ProgramError(f"The program has no input {index}!")
+
+        self.flip(index)
+        return self.outputs
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit.abc import (IBranch, IConnection, ILogicGate, ILoop,
+                                       ISwitch)
+from Computer.LogicCircuit.compound_gate import CompoundGate
+from Computer.LogicCircuit.Connection import ConnectionError, LoopError
+from Computer.LogicCircuit.Connection.branch import BranchError
+from Computer.LogicCircuit.Connection.switch import ERROR, SwitchError
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicGateError, LogicType
+
+NODE = Tuple[Union[LogicGate, IConnection], int]
+# A device and the port read from it (the output index of a branch or a loop, `0`
+# otherwise).
+
+KEY = Union[int, Tuple[int, int]]
+# The `id` of a node's device, paired with its port if it isn't `0`.
+
+FRAME = List
+# A node being evaluated: its key, device, port and kind, what it reads, how many of
+# those have been read so far, and their values.
+
+GATE, COMPOUND, WIRE, BRANCH, SWITCH, LOOP = range(6)
+# The kinds of device, so dispatch happens once per class instead of once per node.
+
+PENDING: int = -2
+# The value of a node whose frame is on the stack.
+
+_KINDS: Dict[type, int] = {}
+# The kind of each device class seen so far.
+
+
+class EvaluationError(Exception):
+    """Handle any errors associated with evaluating a circuit iteratively."""
+
+    ...
+
+
+def _kind(device: Union[LogicGate, IConnection]) -> int:
+    """
+    This finds the kind of a device, checking its interfaces only the first time its
+    class is seen.
+
+    This is a private function.
+
+    Args:
+        device:
+            ...
+
+    Returns:
+        kind:
+            ...
+    """
+
+    kind: Optional[int] = _KINDS.get(type(device))
+    if kind is None:
+        if isinstance(device, CompoundGate):
+            kind = COMPOUND
+        elif isinstance(device, ILogicGate):
+            kind = GATE
+        elif isinstance(device, IBranch):
+            kind = BRANCH
+        elif isinstance(device, ISwitch):
+            kind = SWITCH
+        elif isinstance(device, ILoop):
+            kind = LOOP
+        else:
+            kind = WIRE
+
+        _KINDS[type(device)] = kind
+
+    return kind
+
+
+def _resolve(conn: IConnection) -> Union[NODE, Exception]:
+    """
+    This follows plain connections and branches upstream from a connection, without
+    stacking anything, until it reaches the gate, switch or loop feeding it. Errors are
+    returned rather than raised, so they surface where the recursive evaluation would
+    raise them.
+
+    This is a private function.
+
+    Args:
+        conn:
+            ...
+
+    Returns:
+        node:
+            The node feeding the connection, or the error met on the way.
+    """
+
+    device = conn
+    while True:
+        source = device._input_connection
+        if source is None:
+            return ConnectionError("The output connection has not been set yet!")
+
+        if source.__class__ is not tuple:
+            if _kind(source) == COMPOUND:
+                return (source._output_gate, 0)
+
+            return (source, 0)
+
+        device, port = source
+        if _kind(device) != BRANCH:
+            return source
+
+        if not 0 <= port < len(device._output_connections):
+            return BranchError(f"{port} doesn't correspond to any output connection!")
+
+        device = device._input_connections[device._mapping[port]]
+
+
+def _frame(device: Union[LogicGate, IConnection], port: int, key: KEY) -> FRAME:
+    """
+    This starts evaluating a gate, switch or loop: it finds what the node reads, in the
+    order the recursive evaluation reads it. That is a bit for a gate pin holding one,
+    the node upstream of a wire, or the error met while looking for it.
+
+    This is a private function.
+
+    Args:
+        device:
+            ...
+        port:
+            ...
+        key:
+            ...
+
+    Returns:
+        frame:
+            ...
+
+    Raises:
+        LogicGateError:
+            Pin {p} has not been set yet!
+        SwitchError:
+            The input connections have not all been set!
+        LoopError:
+            (1) You entered an unknown connection: {index}!
+            (2) The input connection has not been set yet!
+    """
+
+    kind: int = _kind(device)
+    if kind == GATE:
+        inputs: List[Union[Bit, NODE, Exception]] = []
+        for p, pin in enumerate(device._input_pins):
+            if pin is None:
+                raise LogicGateError(f"Pin {p} has not been set yet!")
+
+            inputs.append(pin if pin.__class__ is Bit else _resolve(pin))
+    elif kind == SWITCH:
+        if not any(device._input_connections):
+            raise SwitchError("The input connections have not all been set!")
+
+        inputs = [_resolve(conn) for conn in device._input_connections if conn]
+    else:
+        if not 0 <= port < len(device._output_connections):
+            raise LoopError(f"You entered an unknown connection: {port}!")
+
+        if port == 1:
+            inputs = []
+        elif device._input_connection is None:
+            raise LoopError("The input connection has not been set yet!")
+        else:
+            inputs = [_resolve(device._input_connection)]
+
+    return [key, device, port, kind, inputs, 0, []]
+
+
+def _combine(frame: FRAME) -> int:
+    """
+    This computes the value of a switch or a loop once everything it reads is known
+    (gates are combined inline).
+
+    This is a private function.
+
+    Args:
+        frame:
+            ...
+
+    Returns:
+        value:
+            ...
+
+    Raises:
+        LoopError:
+            Looks like no signal came through yet!
+    """
+
+    _, device, port, kind, _, _, read = frame
+    if kind == LOOP:
+        if port == 0:
+            # The first signal through energizes the loop, as in `Loop.feed`.
+            if device._memory is None:
+                device._memory = Bit.trusted(read[0])
+
+            return read[0]
+
+        if device._memory is None:
+            raise LoopError("Looks like no signal came through yet!")
+
+        return int(device._memory is Bit.ON)
+
+    return read[0]
+
+
+def evaluate_value(gate: ILogicGate) -> int:
+    """
+    This does the actual work of
+    [`evaluate_iterative`][Computer.LogicCircuit.Engine.iterative.evaluate_iterative]
+    on plain `0`/`1` integers.
+
+    This is a public function.
+
+    Args:
+        gate:
+            ...
+
+    Returns:
+        result:
+            ...
+
+    Raises:
+        EvaluationError:
+            The circuit has a cycle that doesn't go through a loop!
+    """
+
+    root: LogicGate = gate._output_gate if isinstance(gate, CompoundGate) else gate
+    values: Dict[KEY, int] = {}
+    # Errors are kept like values, so a switch can fall back to its other input.
+    errors: Dict[KEY, Exception] = {}
+    # Frames on the stack (always a path from the root) are marked `PENDING`.
+    values[id(root)] = PENDING
+    stack: List[FRAME] = [_frame(root, 0, id(root))]
+    while stack:
+        frame: FRAME = stack[-1]
+        inputs: List[Union[Bit, NODE, Exception]] = frame[4]
+        read: List[int] = frame[6]
+        switch: bool = frame[3] == SWITCH
+        i: int = frame[5]
+        error: Optional[Exception] = None
+        waiting: Optional[NODE] = None
+        while i < len(inputs):
+            entry: Union[Bit, NODE, Exception] = inputs[i]
+            if entry.__class__ is not tuple:
+                if isinstance(entry, Exception):
+                    failed: Optional[Exception] = entry
+                else:
+                    read.append(1 if entry is Bit.ON else 0)
+                    i += 1
+                    continue
+            else:
+                child_key: KEY = (
+                    id(entry[0]) if entry[1] == 0 else (id(entry[0]), entry[1])
+                )
+                value: int = values.get(child_key, -1)
+                if value >= 0:
+                    read.append(value)
+                    # A switch feeds the first input that can be fed.
+                    i = len(inputs) if switch else i + 1
+                    continue
+
+                failed = errors.get(child_key)
+
+            if failed is not None:
+                # A switch moves on to its next input, like `Switch.feed`.
+                if switch and isinstance(failed, ERROR):
+                    i += 1
+                    continue
+
+                error = failed
+                break
+
+            waiting = entry
+            break
+
+        frame[5] = i
+        if waiting is not None:
+            if values.get(child_key) == PENDING:
+                raise EvaluationError(
+                    "The circuit has a cycle that doesn't go through a loop!"
+                )
+
+            try:
+                stack.append(_frame(waiting[0], waiting[1], child_key))
+                values[child_key] = PENDING
+            except Exception as e:
+                errors[child_key] = e
+
+            continue
+
+        stack.pop()
+        if error is None and switch and not read:
+            error = SwitchError("It looks like nothing is connected!")
+
+        if error is not None:
+            del values[frame[0]]
+            errors[frame[0]] = error
+        elif frame[3] == GATE:
+            # Gates are by far the most common, so they are combined inline.
+            op: LogicType = frame[1]._type
+            if op == LogicType.NOT:
+                values[frame[0]] = 1 ^ read[0]
+            elif op == LogicType.AND:
+                values[frame[0]] = read[0] & read[1]
+            else:
+                values[frame[0]] = read[0] | read[1]
+        else:
+            try:
+                values[frame[0]] = _combine(frame)
+            except Exception as e:
+                del values[frame[0]]
+                errors[frame[0]] = e
+
+    if id(root) in errors:
+        raise errors[id(root)]
+
+    return values[id(root)]
+
+
+def evaluate_iterative(gate: ILogicGate) -> Bit:
+    """
+    This evaluates a gate like `get_output_pin`, but walks the gates and wires upstream
+    of it with an explicit stack instead of recursing through `feed`. Arbitrarily deep
+    circuits don't hit Python's recursion limit, and each device is only evaluated
+    once, however many devices read it.
+
+    Errors are the ones `get_output_pin` raises, and a switch falls back to its second
+    input the same way. Logging, tracing and memoization are bypassed.
+
+    This is a public function.
+
+    Args:
+        gate:
+            ...
+
+    Returns:
+        result:
+            ...
+
+    Raises:
+        EvaluationError:
+            The circuit has a cycle that doesn't go through a loop!
+    """
+
+    return Bit.trusted(evaluate_value(gate))
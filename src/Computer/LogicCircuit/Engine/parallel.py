@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import itertools
+from typing import Iterable, List, Sequence
+
+from Computer.LogicCircuit.Engine.program import ONE, Program, ProgramError
+
+TO_DIGITS: bytes = bytes.maketrans(b"\x00\x01", b"01")
+# Turns bytes holding `0`/`1` into the digits of a binary string.
+
+FROM_DIGITS: bytes = bytes.maketrans(b"01", b"\x00\x01")
+# And back.
+
+
+def _pack_bytes(data: bytes, width: int) -> List[int]:
+    """
+    This packs input vectors laid out one after the other in a byte string (one byte
+    holding `0`/`1` per input) into one word per input. Each column is sliced out,
+    written as a binary string with the last vector first, and parsed, so no bit is
+    handled in Python.
+
+    This is a private function.
+
+    Args:
+        data:
+            ...
+        width:
+            The number of inputs.
+
+    Returns:
+        words:
+            ...
+    """
+
+    return [
+        int(data[i::width][::-1].translate(TO_DIGITS) or b"0", 2) for i in range(width)
+    ]
+
+
+def _unpack_bytes(words: Sequence[int], count: int) -> bytes:
+    """
+    This unpacks one word per output into the output vectors laid out one after the
+    other in a byte string (one byte holding `0`/`1` per output).
+
+    This is a private function.
+
+    Args:
+        words:
+            ...
+        count:
+            The number of vectors.
+
+    Returns:
+        data:
+            ...
+    """
+
+    data: bytearray = bytearray(count * len(words))
+    for o, word in enumerate(words):
+        # Reversed binary strings put bit `k` at index `k` (`0` still has one digit).
+        digits: str = format(word, f"0{count}b")[::-1][:count]
+        data[o :: len(words)] = digits.encode().translate(FROM_DIGITS)
+
+    return bytes(data)
+
+
+def pack(vectors: Iterable[Sequence[int]], width: int) -> List[int]:
+    """
+    This packs input vectors into one word per input: bit `k` of word `i` is input `i`
+    of vector `k`.
+
+    This is a public function.
+
+    Args:
+        vectors:
+            One `0`/`1` (or Boolean) per input, for each vector.
+        width:
+            The number of inputs.
+
+    Returns:
+        words:
+            ...
+
+    Raises:
+        ProgramError:
+            Vector {v} has {m} values, but the program has {n} inputs!
+    """
+
+    rows: List[Sequence[int]] = []
+    for k, vector in enumerate(vectors):
+        if len(vector) != width:
+            raise ProgramError(
+                f"Vector {k} has {len(vector)} values, but the program has {width} "
+                "inputs!"
+            )
+
+        rows.append(vector)
+
+    return _pack_bytes(bytes(itertools.chain.from_iterable(rows)), width)
+
+
+def unpack(words: Sequence[int], count: int) -> List[List[int]]:
+    """
+    This unpacks one word per output back into one list of `0`/`1` per vector.
+
+    This is a public function.
+
+    Args:
+        words:
+            ...
+        count:
+            The number of vectors.
+
+    Returns:
+        vectors:
+            ...
+    """
+
+    data: bytes = _unpack_bytes(words, count)
+    n: int = len(words)
+    return [list(data[k * n : (k + 1) * n]) for k in range(count)]
+
+
+def exhaustive_patterns(width: int) -> List[int]:
+    """
+    This builds the words holding every input pattern of `width` inputs, in counting
+    order (the same order as `itertools.product((0, 1), repeat=width)`): vector `k` is
+    `k` written in binary, input `0` being the most significant bit.
+
+    Each word is built by doubling a block of bits rather than bit by bit.
+
+    This is a public function.
+
+    Args:
+        width:
+            ...
+
+    Returns:
+        words:
+            ...
+    """
+
+    count: int = 1 << width
+    words: List[int] = []
+    for i in range(width):
+        # Input `i` is off for `period` vectors, then on for `period`, and so on.
+        period: int = 1 << (width - 1 - i)
+        word: int = ((1 << period) - 1) << period
+        # Doubling the pattern until it covers every vector takes a few linear steps.
+        size: int = 2 * period
+        while size < count:
+            word |= word << size
+            size *= 2
+
+        words.append(word)
+
+    return words
+
+
+def run_parallel(program: Program, words: Sequence[int], count: int) -> List[int]:
+    """
+    This runs a program on `count` vectors at once: every slot holds one Python int
+    whose bit `k` belongs to vector `k`, so `&`, `|` and `^` evaluate every vector in
+    one operation. `NOT` is an `XOR` with the slot holding `count` ones. Python ints
+    have no width limit, so `count` can be as large as memory allows.
+
+        words = pack(vectors, len(program.input_slots))
+        outputs = unpack(run_parallel(program, words, len(vectors)), len(vectors))
+
+    This is a public function.
+
+    Args:
+        program:
+            ...
+        words:
+            One word per primary input (see `pack`).
+        count:
+            The number of vectors.
+
+    Returns:
+        words:
+            One word per primary output.
+
+    Raises:
+        ProgramError:
+            The program has {n} inputs, but {m} words were given!
+    """
+
+    if len(words) != len(program.input_slots):
+        raise ProgramError(
+            f"The program has {len(program.input_slots)} inputs, but {len(words)} "
+            "words were given!"
+        )
+
+    slots: List[int] = [0] * program.num_slots
+    slots[ONE] = (1 << count) - 1
+    for slot, word in zip(program.input_slots, words):
+        slots[slot] = word
+
+    for function, a, b, out in program._steps:
+        slots[out] = function(slots[a], slots[b])
+
+    return [slots[slot] for slot in program.output_slots]
+
+
+def run_exhaustive(program: Program) -> List[int]:
+    """
+    This runs a program on every input pattern in a single pass (see
+    `exhaustive_patterns`): bit `k` of each output word is that output for the
+    pattern `k`.
+
+    This is a public function.
+
+    Args:
+        program:
+            ...
+
+    Returns:
+        words:
+            One word per primary output.
+    """
+
+    width: int = len(program.input_slots)
+    return run_parallel(program, exhaustive_patterns(width), 1 << width)
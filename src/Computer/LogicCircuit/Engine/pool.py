@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+
+from Computer.LogicCircuit.circuit import Circuit
+from Computer.LogicCircuit.Engine.compiler import compile_circuit
+from Computer.LogicCircuit.Engine.parallel import (_pack_bytes, _unpack_bytes,
+                                                   exhaustive_patterns,
+                                                   run_parallel)
+from Computer.LogicCircuit.Engine.program import Program, ProgramError
+
+_PROGRAM: Optional[Program] = None
+# The program a worker process runs, unpickled once when the worker starts.
+
+
+def _initialize(program: Program) -> None:
+    """
+    This stores the program in a new worker process.
+
+    This is a private function.
+
+    Args:
+        program:
+            ...
+    """
+
+    global _PROGRAM
+    _PROGRAM = program
+
+
+def _run_vectors(shard: Tuple[bytes, int]) -> bytes:
+    """
+    This runs one shard of input vectors in a worker, with the bit-parallel engine.
+    Vectors travel as one byte per value, laid out one after the other, which is far
+    cheaper to pickle than lists.
+
+    This is a private function.
+
+    Args:
+        shard:
+            The input vectors and how many there are.
+
+    Returns:
+        outputs:
+            The output vectors, laid out the same way.
+    """
+
+    data, count = shard
+    words: List[int] = _pack_bytes(data, len(_PROGRAM.input_slots))
+    return _unpack_bytes(run_parallel(_PROGRAM, words, count), count)
+
+
+def _run_patterns(shard: Tuple[int, int]) -> List[int]:
+    """
+    This runs one aligned block of the exhaustive input patterns in a worker: the
+    patterns `start` to `start + 2**bits - 1`. The leading inputs are the same for the
+    whole block, and the trailing `bits` inputs go through every pattern.
+
+    This is a private function.
+
+    Args:
+        shard:
+            The first pattern and the number of trailing inputs.
+
+    Returns:
+        words:
+            One word per primary output, bit `k` being pattern `start + k`.
+    """
+
+    start, bits = shard
+    width: int = len(_PROGRAM.input_slots)
+    count: int = 1 << bits
+    mask: int = (1 << count) - 1
+    words: List[int] = [
+        mask if start >> (width - 1 - i) & 1 else 0 for i in range(width - bits)
+    ]
+    words.extend(exhaustive_patterns(bits))
+    return run_parallel(_PROGRAM, words, count)
+
+
+class ShardedRunner:
+
+    """
+    This implements a batch runner spread over a pool of worker processes. The circuit
+    is compiled once, and the program is pickled once per worker, when the worker
+    starts. Batches are then cut into shards, each shard is run with the bit-parallel
+    engine (see [`run_parallel`][Computer.LogicCircuit.Engine.parallel.run_parallel])
+    in some worker, and the results are merged back in order.
+
+        with ShardedRunner(circuit, workers=8) as runner:
+            outputs = runner.run(vectors)
+            table = runner.run_exhaustive()
+
+    Attributes:
+        program:    the compiled circuit (read-only)
+        workers:    the number of worker processes (read-only)
+        shard_size: the number of vectors in each shard (read-only)
+        executor:   the pool of worker processes (private)
+    """
+
+    def __init__(
+        self,
+        target: Union[Circuit, Program],
+        *,
+        workers: Optional[int] = None,
+        shard_size: int = 4_096,
+    ):
+        """
+        Constructor...
+
+        Args:
+            target:
+                The circuit (compiled first) or program to run.
+            workers:
+                The number of worker processes. Defaults to the number of CPUs.
+            shard_size:
+                The number of vectors in each shard.
+
+        Raises:
+            ProgramError:
+                The shard size needs to be positive!
+        """
+
+        if shard_size < 1:
+            raise ProgramError("The shard size needs to be positive!")
+
+        self._program: Program = (
+            compile_circuit(target) if isinstance(target, Circuit) else target
+        )
+        """
+        The compiled circuit.
+
+        Type:
+            Program
+        """
+
+        self._workers: int = workers or os.cpu_count() or 1
+        """
+        The number of worker processes.
+
+        Type:
+            int
+        """
+
+        self._shard_size: int = shard_size
+        """
+        The number of vectors in each shard.
+
+        Type:
+            int
+        """
+
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_initialize,
+            initargs=(self._program,),
+        )
+        """
+        The pool of worker processes.
+
+        Type:
+            ProcessPoolExecutor
+        """
+
+    def __enter__(self) -> ShardedRunner:
+        """This allows the runner to be used as a context manager."""
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """This shuts the workers down when leaving the context."""
+
+        self.close()
+
+    @property
+    def program(self) -> Program:
+        """Get the compiled circuit."""
+
+        return self._program
+
+    @property
+    def shard_size(self) -> int:
+        """Get the number of vectors in each shard."""
+
+        return self._shard_size
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker processes."""
+
+        return self._workers
+
+    def close(self) -> None:
+        """
+        This shuts the worker processes down.
+
+        This is a public method.
+        """
+
+        self._executor.shutdown()
+
+    def run(self, vectors: Sequence[Sequence[int]]) -> List[List[int]]:
+        """
+        This runs a batch of input vectors across the workers.
+
+        This is a public method.
+
+        Args:
+            vectors:
+                One `0`/`1` (or Boolean) per primary input, for each vector.
+
+        Returns:
+            outputs:
+                One `0`/`1` per primary output, for each vector, in order.
+
+        Raises:
+            ProgramError:
+                Vector {v} has {m} values, but the program has {n} inputs!
+        """
+
+        width: int = len(self._program.input_slots)
+        for v, vector in enumerate(vectors):
+            if len(vector) != width:
+                raise ProgramError(
+                    f"Vector {v} has {len(vector)} values, but the program has "
+                    f"{width} inputs!"
+                )
+
+        shards: List[Tuple[bytes, int]] = [
+            (
+                bytes(itertools.chain.from_iterable(shard)),
+                len(shard),
+            )
+            for shard in (
+                vectors[start : start + self._shard_size]
+                for start in range(0, len(vectors), self._shard_size)
+            )
+        ]
+
+        n: int = len(self._program.output_slots)
+        outputs: List[List[int]] = []
+        for (_, count), data in zip(shards, self._executor.map(_run_vectors, shards)):
+            outputs.extend(list(data[k * n : (k + 1) * n]) for k in range(count))
+
+        return outputs
+
+    def run_exhaustive(self) -> List[int]:
+        """
+        This runs every input pattern across the workers, like
+        [`run_exhaustive`][Computer.LogicCircuit.Engine.parallel.run_exhaustive]. Each
+        shard is an aligned block of patterns (the shard size rounded down to a power
+        of two), which the worker builds itself, so no vectors are sent at all.
+
+        This is a public method.
+
+        Returns:
+            words:
+                One word per primary output, bit `k` being the output for pattern `k`.
+        """
+
+        width: int = len(self._program.input_slots)
+        bits: int = min(width, self._shard_size.bit_length() - 1)
+        shards: List[Tuple[int, int]] = [
+            (start, bits) for start in range(0, 1 << width, 1 << bits)
+        ]
+
+        results: List[List[int]] = list(self._executor.map(_run_patterns, shards))
+        count: int = 1 << bits
+        if count % 8:
+            # Tiny shards: shifting the words into place is cheap enough.
+            return [
+                sum(result[o] << start for (start, _), result in zip(shards, results))
+                for o in range(len(self._program.output_slots))
+            ]
+
+        # Joining the bytes of every shard avoids shifting ever longer integers.
+        return [
+            int.from_bytes(
+                b"".join(r[o].to_bytes(count // 8, "little") for r in results),
+                "little",
+            )
+            for o in range(len(self._program.output_slots))
+        ]
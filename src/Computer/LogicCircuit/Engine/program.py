@@ -0,0 +1,354 @@
+from __future__ import annotations
+
+import enum
+import operator
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from Computer.Bit import Bit
+from Computer.Bit.abc import IBit
+
+INSTRUCTION = Tuple["Op", int, int, int]
+# An instruction: the operation, the two slots read and the slot written.
+
+STEP = Tuple[Callable[[int, int], int], int, int, int]
+# An instruction with its operation resolved to a function.
+
+ZERO: int = 0
+# The slot always holding `0`.
+
+ONE: int = 1
+# The slot always holding `1` (`NOT` is compiled to `XOR` with this slot).
+
+
+class Op(enum.IntEnum):
+    """
+    This stores the operations a compiled program is made of.
+    """
+
+    AND = 0
+    """`values[out] = values[a] & values[b]`"""
+
+    OR = 1
+    """`values[out] = values[a] | values[b]`"""
+
+    XOR = 2
+    """`values[out] = values[a] ^ values[b]`"""
+
+
+FUNCTIONS: Dict[Op, Callable[[int, int], int]] = {
+    Op.AND: operator.and_,
+    Op.OR: operator.or_,
+    Op.XOR: operator.xor,
+}
+# The function carrying out each operation.
+
+
+class ProgramError(Exception):
+    """Handle any errors associated with running a `Program`."""
+
+    ...
+
+
+class Program:
+
+    """
+    This implements a compiled circuit: a flat list of instructions over an array of
+    value slots, in topological order. Slot `0` always holds `0`, slot `1` always holds
+    `1`, the primary inputs come next, and every gate output gets a slot after that.
+    Wires don't exist any more; each gate reads straight from the slot of the gate (or
+    input) driving it.
+
+    Running the program is one loop over the instructions, with no recursion, no type
+    checks and no validation.
+
+    Attributes:
+        num_slots:      the number of value slots (read-only)
+        input_slots:    the slot of each primary input (read-only)
+        output_slots:   the slot of each primary output (read-only)
+        instructions:   the `(op, a, b, out)` instructions, in order (read-only)
+        input_names:    the name of each primary input (read-only)
+        output_names:   the name of each primary output (read-only)
+        steps:          the instructions with the operation resolved to a function
+                        (private)
+        hash:           the cached hash of the program (private)
+    """
+
+    def __init__(
+        self,
+        *,
+        num_slots: int,
+        input_slots: Sequence[int],
+        output_slots: Sequence[int],
+        instructions: Sequence[INSTRUCTION],
+        input_names: Sequence[str] = (),
+        output_names: Sequence[str] = (),
+    ):
+        """
+        Constructor...
+
+        Args:
+            num_slots:
+                The number of value slots.
+            input_slots:
+                The slot of each primary input.
+            output_slots:
+                The slot of each primary output.
+            instructions:
+                The `(op, a, b, out)` instructions, in the order they are run.
+            input_names:
+                The name of each primary input.
+            output_names:
+                The name of each primary output.
+        """
+
+        self._num_slots: int = num_slots
+        """
+        The number of value slots.
+
+        Type:
+            int
+        """
+
+        self._input_slots: Tuple[int, ...] = tuple(input_slots)
+        """
+        The slot of each primary input.
+
+        Type:
+            Tuple[int, ...]
+        """
+
+        self._output_slots: Tuple[int, ...] = tuple(output_slots)
+        """
+        The slot of each primary output.
+
+        Type:
+            Tuple[int, ...]
+        """
+
+        self._instructions: Tuple[INSTRUCTION, ...] = tuple(
+            (Op(op), a, b, out) for op, a, b, out in instructions
+        )
+        """
+        The `(op, a, b, out)` instructions, in order.
+
+        Type:
+            Tuple[Tuple[Op, int, int, int], ...]
+        """
+
+        self._input_names: Tuple[str, ...] = tuple(input_names)
+        """
+        The name of each primary input.
+
+        Type:
+            Tuple[str, ...]
+        """
+
+        self._output_names: Tuple[str, ...] = tuple(output_names)
+        """
+        The name of each primary output.
+
+        Type:
+            Tuple[str, ...]
+        """
+
+        self._steps: Tuple[STEP, ...] = tuple(
+            (FUNCTIONS[op], a, b, out) for op, a, b, out in self._instructions
+        )
+        """
+        The instructions with the operation resolved to a function.
+
+        Type:
+            Tuple[Tuple[Callable[[int, int], int], int, int, int], ...]
+        """
+
+        self._hash: Optional[int] = None
+        """
+        The hash of the program, computed the first time it is needed.
+
+        Type:
+            Optional[int]
+        """
+
+    def __eq__(self, other: Program) -> bool:
+        """
+        Overrides Python's `'=='` operator: two programs are the same if they have the
+        same slots, instructions and names.
+        """
+
+        if not isinstance(other, Program):
+            return NotImplemented
+
+        return self is other or self._key() == other._key()
+
+    def __hash__(self) -> int:
+        """
+        Overrides Python's built-in `hash` function: equal programs hash equally, so a
+        program can key a cache.
+        """
+
+        if self._hash is None:
+            self._hash = hash(self._key())
+
+        return self._hash
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of
+        instructions.
+        """
+
+        return len(self._instructions)
+
+    def __reduce__(self):
+        """This allows programs to be pickled (the functions are rebuilt)."""
+
+        return (
+            _rebuild,
+            (
+                self._num_slots,
+                self._input_slots,
+                self._output_slots,
+                tuple((int(op), a, b, out) for op, a, b, out in self._instructions),
+                self._input_names,
+                self._output_names,
+            ),
+        )
+
+    def _key(self) -> Tuple[object, ...]:
+        """
+        This gathers everything that makes a program what it is, to compare and hash
+        programs by.
+
+        This is a private method.
+
+        Returns:
+            key:
+                ...
+        """
+
+        return (
+            self._num_slots,
+            self._input_slots,
+            self._output_slots,
+            self._instructions,
+            self._input_names,
+            self._output_names,
+        )
+
+    @property
+    def input_names(self) -> Tuple[str, ...]:
+        """Get the name of each primary input."""
+
+        return self._input_names
+
+    @property
+    def input_slots(self) -> Tuple[int, ...]:
+        """Get the slot of each primary input."""
+
+        return self._input_slots
+
+    @property
+    def instructions(self) -> Tuple[INSTRUCTION, ...]:
+        """Get the `(op, a, b, out)` instructions, in order."""
+
+        return self._instructions
+
+    @property
+    def num_slots(self) -> int:
+        """Get the number of value slots."""
+
+        return self._num_slots
+
+    @property
+    def output_names(self) -> Tuple[str, ...]:
+        """Get the name of each primary output."""
+
+        return self._output_names
+
+    @property
+    def output_slots(self) -> Tuple[int, ...]:
+        """Get the slot of each primary output."""
+
+        return self._output_slots
+
+    def evaluate(self, values: Sequence[Union[IBit, int]]) -> List[Bit]:
+        """
+        This runs the program on bits, like `Circuit.evaluate`.
+
+        This is a public method.
+
+        Args:
+            values:
+                One bit (or `0`/`1`) per primary input, in order.
+
+        Returns:
+            outputs:
+                One bit per primary output, in order.
+        """
+
+        inputs: List[int] = [
+            value if isinstance(value, int) else int(value is Bit.ON)
+            for value in values
+        ]
+        return [Bit.trusted(value) for value in self.run(inputs)]
+
+    def run(self, values: Sequence[int]) -> List[int]:
+        """
+        This runs the program once.
+
+        This is a public method.
+
+        Args:
+            values:
+                One `0`/`1` per primary input, in order.
+
+        Returns:
+            outputs:
+                One `0`/`1` per primary output, in order.
+
+        Raises:
+            ProgramError:
+                The program has {n} inputs, but {m} values were given!
+        """
+
+        if len(values) != len(self._input_slots):
+            raise ProgramError(
+                f"The program has {len(self._input_slots)} inputs, but {len(values)} "
+                "values were given!"
+            )
+
+        slots: List[int] = [0] * self._num_slots
+        slots[ONE] = 1
+        for slot, value in zip(self._input_slots, values):
+            slots[slot] = value
+
+        for function, a, b, out in self._steps:
+            slots[out] = function(slots[a], slots[b])
+
+        return [slots[slot] for slot in self._output_slots]
+
+
+def _rebuild(
+    num_slots: int,
+    input_slots: Tuple[int, ...],
+    output_slots: Tuple[int, ...],
+    instructions: Tuple[Tuple[int, int, int, int], ...],
+    input_names: Tuple[str, ...],
+    output_names: Tuple[str, ...],
+) -> Program:
+    """
+    This rebuilds a pickled program (see `Program.__reduce__`).
+
+    Returns:
+        program:
+            ...
+    """
+
+    return Program(
+        num_slots=num_slots,
+        input_slots=input_slots,
+        output_slots=output_slots,
+        instructions=instructions,
+        input_names=input_names,
+        output_names=output_names,
+    )
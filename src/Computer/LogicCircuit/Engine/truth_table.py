@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import List, Union
+
+from Computer.Bit import PackedBitString
+from Computer.LogicCircuit.circuit import Circuit
+from Computer.LogicCircuit.Engine.compiler import compile_circuit
+from Computer.LogicCircuit.Engine.event import EventSimulator
+from Computer.LogicCircuit.Engine.parallel import TO_DIGITS
+from Computer.LogicCircuit.Engine.program import Program
+
+
+def truth_table(target: Union[Circuit, Program]) -> List[PackedBitString]:
+    """
+    This builds the truth table of a circuit. The input patterns are walked in
+    Gray-code order, so each step flips exactly one input, and the
+    [`EventSimulator`][Computer.LogicCircuit.Engine.event.EventSimulator] only
+    re-evaluates the gates that flip affects.
+
+    The table is one packed bit string per primary output, holding one bit per input
+    pattern in counting order: bit `k` (from the left) is the output for the inputs
+    reading `k` in binary, input `0` being the most significant bit.
+
+        sum, carry = truth_table(full_adder)
+        sum.to_text()  # '01101001'
+
+    This is a public function.
+
+    Args:
+        target:
+            The circuit (compiled first) or program.
+
+    Returns:
+        table:
+            One packed bit string of `2**inputs` bits per primary output.
+    """
+
+    program: Program = (
+        compile_circuit(target) if isinstance(target, Circuit) else target
+    )
+    width: int = len(program.input_slots)
+    count: int = 1 << width
+    simulator: EventSimulator = EventSimulator(program)
+
+    # One byte per pattern while walking, packed into integers at the end.
+    columns: List[bytearray] = [bytearray(count) for _ in program.output_slots]
+    for column, value in zip(columns, simulator.outputs):
+        column[0] = value
+
+    pattern: int = 0
+    for step in range(1, count):
+        # Gray code: step `i` flips the bit of the lowest set bit of `i`.
+        bit: int = (step & -step).bit_length() - 1
+        pattern ^= 1 << bit
+        simulator.flip(width - 1 - bit)
+        for column, value in zip(columns, simulator.outputs):
+            column[pattern] = value
+
+    return [
+        PackedBitString.from_int(int(column.translate(TO_DIGITS), 2), count)
+        for column in columns
+    ]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Callable, Dict
+
+import numpy as np
+
+from Computer.LogicCircuit.Engine.program import ONE, ZERO, Op, Program, ProgramError
+
+UFUNCS: Dict[Op, Callable[..., np.ndarray]] = {
+    Op.AND: np.bitwise_and,
+    Op.OR: np.bitwise_or,
+    Op.XOR: np.bitwise_xor,
+}
+# The NumPy function carrying out each operation on whole words.
+
+
+def run_vectorized(program: Program, array: np.ndarray) -> np.ndarray:
+    """
+    This runs a program on a whole batch of input vectors at once. Each slot holds the
+    values of one signal for every vector, packed 64 to a `uint64` word, so every
+    instruction is a single NumPy call over the batch, however many vectors there are.
+
+    This is a public function.
+
+    Args:
+        program:
+            ...
+        array:
+            A 2D array of zeros and ones (or Booleans): one row per input vector, one
+            column per primary input.
+
+    Returns:
+        outputs:
+            A 2D `uint8` array of zeros and ones: one row per input vector, one column
+            per primary output.
+
+    Raises:
+        ProgramError:
+            The batch has {m} columns, but the program has {n} inputs!
+    """
+
+    array = np.asarray(array)
+    width: int = len(program.input_slots)
+    if array.ndim != 2 or array.shape[1] != width:
+        raise ProgramError(
+            f"The batch has {array.shape[-1]} columns, but the program has {width} "
+            "inputs!"
+        )
+
+    rows: int = array.shape[0]
+    # One row of packed bytes per input, padded to whole 64-bit words.
+    words: int = max(1, (rows + 63) // 64)
+    packed: np.ndarray = np.zeros((width, words * 8), dtype=np.uint8)
+    packed[:, : (rows + 7) // 8] = np.packbits(array.astype(bool), axis=0).T
+
+    slots: np.ndarray = np.empty((program.num_slots, words), dtype=np.uint64)
+    slots[ZERO] = 0
+    slots[ONE] = np.iinfo(np.uint64).max
+    slots[list(program.input_slots)] = packed.view(np.uint64)
+
+    for op, a, b, out in program.instructions:
+        UFUNCS[op](slots[a], slots[b], out=slots[out])
+
+    outputs: np.ndarray = slots[list(program.output_slots)].view(np.uint8)
+    return np.ascontiguousarray(np.unpackbits(outputs, axis=1, count=rows).T)
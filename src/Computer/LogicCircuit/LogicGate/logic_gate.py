@@ -2,10 +2,11 @@ import enum
 from typing import List, Optional, Union, cast
 
 from Computer.Bit import Bit
-from Computer.Logger import OUT
+from Computer.Logger import OUT, EventKind, TraceRecorder
 from Computer.LogicCircuit.abc import IConnection, ILogicGate
+from Computer.LogicCircuit.memo import Memo
 
-INFO = lambda msg: OUT.info(msg, level=0)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=0)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 PIN = Union[Bit, IConnection]
@@ -70,7 +71,7 @@ class LogicGate(ILogicGate):
         if not isinstance(type, LogicType):
             raise LogicGateError("You need to pass a valid logic gate type!")
 
-        INFO(f"Creating a new {type} logic gate with name {name}.")
+        INFO("Creating a new %s logic gate with name %s.", type, name)
 
         self._type: LogicType = type
         """
@@ -106,6 +107,22 @@ class LogicGate(ILogicGate):
             List[Optional[IConnection]]
         """
 
+        self._memo_epoch: int = -1
+        """
+        The evaluation epoch the cached value was computed in (see `Memo`).
+
+        Type:
+            int
+        """
+
+        self._memo_value: int = 0
+        """
+        The value computed in `_memo_epoch`.
+
+        Type:
+            int
+        """
+
     @property
     def name(self) -> str:
         """Read from the `name` attribute of the logic gate."""
@@ -124,47 +141,89 @@ class LogicGate(ILogicGate):
 
         return self._type
 
-    def get_output_pin(self) -> Bit:
+    def _get_output_value(self) -> int:
         """
-        This will be the primary method called by the user. It will first get all the
-        requisite inputs for the type of logic gate built sequentially. Then, depending
-        on the type of logic gate, it will perform whatever logically operation is
-        requested. It will then return the results.
+        This does the actual work of [`get_output_pin`][Computer.LogicCircuit.LogicGate]
+        on plain `0`/`1` integers: the inputs are pulled from upstream with
+        [`_feed_value`][Computer.LogicCircuit.Connection.Connection], so no `Bit` is
+        handled until the result leaves the circuit.
 
-        NOTE:
-            This method is marked public and can be called by the user, though it is
-            more likely to be called by other objects, such as `IConnection`.
+        This is a private method.
 
         Returns:
             result:
                 ...
         """
 
-        INFO(f"Getting the output of {self._name}.")
+        # Hand back this evaluation's output if it has already been computed.
+        if Memo.enabled and self._memo_epoch == Memo.epoch:
+            Memo.saved += 1
+            return self._memo_value
 
         # Get the input pin information
-        inputs: List[Bit] = [None] * self.mapping[self._type]
+        inputs: List[int] = [0] * self.mapping[self._type]
         for p, pin in enumerate(self._input_pins):
             if pin is None:
                 raise LogicGateError(f"Pin {p} has not been set yet!")
             elif isinstance(pin, IConnection):
-                inputs[p] = pin.feed()
+                inputs[p] = pin._feed_value()
             elif isinstance(pin, Bit):
-                inputs[p] = pin
+                inputs[p] = int(pin is Bit.ON)
 
-        INFO(f"The inputs have been set to: {[str(inp) for inp in inputs]}.")
+        if OUT.enabled:
+            INFO(
+                "The inputs have been set to: %s.",
+                [str(Bit.trusted(inp)) for inp in inputs],
+            )
 
         # Process the input pins
         if self._type == LogicType.NOT:
-            output: Bit = inputs[0].not_op()
+            output: int = 1 ^ inputs[0]
         elif self._type == LogicType.AND:
-            output: Bit = inputs[0].and_op(inputs[1])
+            output: int = inputs[0] & inputs[1]
         elif self._type == LogicType.OR:
-            output: Bit = inputs[0].or_op(inputs[1])
+            output: int = inputs[0] | inputs[1]
+
+        if OUT.enabled:
+            INFO("The resulting output is: %s.", Bit.trusted(output))
+
+        if TraceRecorder.active is not None:
+            TraceRecorder.active.record(0, self, EventKind.OUTPUT, output)
+
+        if Memo.enabled:
+            self._memo_epoch = Memo.epoch
+            self._memo_value = output
 
-        INFO(f"The resulting output is: {output}.")
         return output
 
+    def get_output_pin(self) -> Bit:
+        """
+        This will be the primary method called by the user. It will first get all the
+        requisite inputs for the type of logic gate built sequentially. Then, depending
+        on the type of logic gate, it will perform whatever logically operation is
+        requested. It will then return the results.
+
+        Internally, the whole upstream circuit is evaluated on plain integers (see
+        [`_get_output_value`][Computer.LogicCircuit.LogicGate]); the result is only
+        turned back into a `Bit` here.
+
+        NOTE:
+            This method is marked public and can be called by the user, though it is
+            more likely to be called by other objects, such as `IConnection`.
+
+        Returns:
+            result:
+                ...
+        """
+
+        if OUT.enabled:
+            INFO("Getting the output of %s.", self._name)
+
+        if Memo.enabled:
+            Memo.next_epoch()
+
+        return Bit.trusted(self._get_output_value())
+
     def has_input_pin_set(self, *, pin: int) -> bool:
         """
         This method will check to see if the input pin has been set yet.
@@ -220,13 +279,13 @@ class LogicGate(ILogicGate):
         """
 
         if which == "input":
-            INFO(f"Resetting the input pins of {self._name}.")
+            INFO("Resetting the input pins of %s.", self._name)
             self._input_pins = [None] * self.mapping[self._type]
         elif which == "output":
-            INFO(f"Resetting the output pins of {self._name}.")
+            INFO("Resetting the output pins of %s.", self._name)
             self._output_pin = None
         else:
-            INFO(f"Resetting the all of the pins of {self._name}.")
+            INFO("Resetting the all of the pins of %s.", self._name)
             self._input_pins = [None] * self.mapping[self._type]
             self._output_pin = None
 
@@ -252,9 +311,9 @@ class LogicGate(ILogicGate):
             raise LogicGateError(f"Input pin {pin} has already been set!")
 
         if isinstance(value, Bit):
-            INFO(f"Setting input pin {pin} of {self._name} to bit {str(value)}.")
+            INFO("Setting input pin %d of %s to bit %s.", pin, self._name, value)
         elif isinstance(value, IConnection):
-            INFO(f"Setting input pin {pin} of {self._name} to a connection.")
+            INFO("Setting input pin %d of %s to a connection.", pin, self._name)
 
         self._input_pins[pin] = value
 
@@ -277,5 +336,5 @@ class LogicGate(ILogicGate):
         if self.has_output_pin_set():
             raise LogicGateError("The output pin has already been set!")
 
-        INFO(f"Setting the output pin of {self._name} to a connection.")
+        INFO("Setting the output pin of %s to a connection.", self._name)
         self._output_pin = value
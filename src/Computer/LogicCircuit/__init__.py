@@ -1,3 +1,5 @@
 from .compound_factory import (CompoundFactory,  # noqa: F401
                                CompoundFactoryError)
 from .compound_gate import CompoundGate, CompoundType  # noqa: F401
+from .circuit import Circuit, CircuitError, Source, SourceKind  # noqa: F401
+from .memo import Memo  # noqa: F401
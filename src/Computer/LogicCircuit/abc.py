@@ -4,6 +4,7 @@ import abc
 import enum
 from typing import Dict, Optional, TypeVar
 
+from Computer.Bit import Bit
 from Computer.Bit.abc import IBit
 
 T = TypeVar("T")
@@ -46,6 +47,14 @@ class IConnection(metaclass=abc.ABCMeta):
 
         ...
 
+    def _feed_value(self) -> int:
+        """
+        This gets the information from the input as a plain `0`/`1` integer. The
+        built-in connections override this; others fall back to `feed`.
+        """
+
+        return int(self.feed() is Bit.ON)
+
     @abc.abstractclassmethod
     def has_input_connection_set(self) -> bool:
         """This will check if there is an input device."""
@@ -97,6 +106,14 @@ class IBranch(IConnection, metaclass=abc.ABCMeta):
 
         ...
 
+    def _feed_value(self, *, index: int) -> int:
+        """
+        This gets the information from the appropriate input as a plain `0`/`1`
+        integer. The built-in connections override this; others fall back to `feed`.
+        """
+
+        return int(self.feed(index=index) is Bit.ON)
+
     @abc.abstractclassmethod
     def has_mapping_set(self) -> bool:
         """This method will check to see if the mapping has been set yet."""
@@ -162,6 +179,14 @@ class ILoop(IConnection, metaclass=abc.ABCMeta):
 
         ...
 
+    def _feed_value(self, *, index: int) -> int:
+        """
+        This gets the information from the appropriate input as a plain `0`/`1`
+        integer. The built-in connections override this; others fall back to `feed`.
+        """
+
+        return int(self.feed(index=index) is Bit.ON)
+
     @abc.abstractclassmethod
     def has_output_connection_set(self, *, index: int) -> bool:
         """This will check if there is an output connection."""
@@ -200,6 +225,14 @@ class ILogicGate(metaclass=abc.ABCMeta):
 
         ...
 
+    def _get_output_value(self) -> int:
+        """
+        This gets the output as a plain `0`/`1` integer. The built-in gates override
+        this; others fall back to `get_output_pin`.
+        """
+
+        return int(self.get_output_pin() is Bit.ON)
+
     @abc.abstractclassmethod
     def has_input_pin_set(self, *, pin: int) -> bool:
         """This checks if the input pin has been set."""
@@ -0,0 +1,591 @@
+from __future__ import annotations
+
+import enum
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from Computer.Bit import Bit
+from Computer.Bit.abc import IBit
+from Computer.LogicCircuit.abc import (IBranch, IConnection, ILogicGate, ILoop,
+                                       ISwitch)
+from Computer.LogicCircuit.compound_gate import CompoundGate
+from Computer.LogicCircuit.LogicGate import LogicGate
+from Computer.LogicCircuit.memo import Memo
+
+DEVICE = Union[LogicGate, IConnection]
+# This represents everything a circuit registers: primitive logic gates and wires
+# (connections, branches, switches and loops).
+
+TARGET = Tuple[ILogicGate, int]
+# A gate (primitive or compound) and one of its input pins.
+
+
+class CircuitError(Exception):
+    """Handle any errors associated with the `Circuit` class."""
+
+    ...
+
+
+class SourceKind(enum.Enum):
+    """
+    This stores where the value read by a pin (or a wire) comes from.
+    """
+
+    DEVICE: str = "device"
+    """The output of another registered device."""
+
+    INPUT: str = "input"
+    """One of the circuit's primary inputs."""
+
+    CONSTANT: str = "constant"
+    """A bit fixed on the pin that isn't a primary input."""
+
+
+class Source(NamedTuple):
+    """
+    This is one entry of the netlist: where a pin or a wire reads its value from.
+
+    Attributes:
+        kind:   what `index` refers to
+        index:  the device id, the primary input index or the constant (`0`/`1`)
+        port:   which output of the device is read: the output index of a branch, or
+                `1` for the stored value of a loop (`0` otherwise)
+    """
+
+    kind: SourceKind
+    index: int
+    port: int = 0
+
+
+class Circuit:
+
+    """
+    This implements a registry for a whole circuit. Once the outputs have been added,
+    every device they depend on (logic gates and wires) is found by walking the graph
+    backwards, and given a dense integer id. Compound gates are flattened into the
+    primitive gates and wires making them up.
+
+    The ids are given in topological order: a device's id is always larger than the ids
+    of the devices it reads from, except for the stored value of a loop, which is what
+    breaks the cycle.
+
+    The netlist is exposed as plain lists indexed by device id:
+        - `sources`: where each input of a device reads from (see `Source`): the pins of
+                     a gate, the input of a connection or loop, or the inputs of a
+                     branch or switch.
+        - `fanin`:   the ids of the devices each device reads from.
+        - `fanout`:  the ids of the devices reading from each device.
+
+    Attributes:
+        input_names:    the name of each primary input (private)
+        input_targets:  the gate pins each primary input drives (private)
+        output_names:   the name of each primary output (private)
+        output_devices: the gate driving each primary output (private)
+        devices:        the registered devices, indexed by id (private)
+        ids:            the id of each registered device, keyed by `id()` (private)
+        sources:        where each device reads from, indexed by id (private)
+        fanin:          the devices each device reads from, indexed by id (private)
+        fanout:         the devices reading from each device, indexed by id (private)
+    """
+
+    def __init__(self):
+        """Constructor... builds an empty circuit."""
+
+        self._input_names: List[str] = []
+        """
+        The name of each primary input.
+
+        Type:
+            List[str]
+        """
+
+        self._input_targets: List[List[Tuple[LogicGate, int]]] = []
+        """
+        The (primitive) gate pins each primary input drives.
+
+        Type:
+            List[List[Tuple[LogicGate, int]]]
+        """
+
+        self._output_names: List[str] = []
+        """
+        The name of each primary output.
+
+        Type:
+            List[str]
+        """
+
+        self._output_devices: List[LogicGate] = []
+        """
+        The (primitive) gate driving each primary output.
+
+        Type:
+            List[LogicGate]
+        """
+
+        self._devices: Optional[List[DEVICE]] = None
+        """
+        The registered devices, indexed by id. This is `None` until the netlist is
+        (re)built.
+
+        Type:
+            Optional[List[DEVICE]]
+        """
+
+        self._ids: Dict[int, int] = {}
+        """
+        The id of each registered device, keyed by `id()`.
+
+        Type:
+            Dict[int, int]
+        """
+
+        self._sources: List[Tuple[Source, ...]] = []
+        """
+        Where each device reads from, indexed by id.
+
+        Type:
+            List[Tuple[Source, ...]]
+        """
+
+        self._fanin: List[Tuple[int, ...]] = []
+        """
+        The ids of the devices each device reads from, indexed by id.
+
+        Type:
+            List[Tuple[int, ...]]
+        """
+
+        self._fanout: List[Tuple[int, ...]] = []
+        """
+        The ids of the devices reading from each device, indexed by id.
+
+        Type:
+            List[Tuple[int, ...]]
+        """
+
+    def __len__(self) -> int:
+        """
+        This overrides Python's built-in `len` function: it returns the number of
+        registered devices.
+        """
+
+        return len(self.devices)
+
+    @property
+    def devices(self) -> List[DEVICE]:
+        """Get the registered devices, indexed by id."""
+
+        self._build()
+        return self._devices
+
+    @property
+    def fanin(self) -> List[Tuple[int, ...]]:
+        """Get the ids of the devices each device reads from, indexed by id."""
+
+        self._build()
+        return self._fanin
+
+    @property
+    def fanout(self) -> List[Tuple[int, ...]]:
+        """Get the ids of the devices reading from each device, indexed by id."""
+
+        self._build()
+        return self._fanout
+
+    @property
+    def input_names(self) -> List[str]:
+        """Get the name of each primary input."""
+
+        return list(self._input_names)
+
+    @property
+    def input_pins(self) -> List[List[Tuple[int, int]]]:
+        """Get the `(device id, pin)` pairs each primary input drives."""
+
+        return [
+            [(self.id_of(gate), pin) for gate, pin in targets]
+            for targets in self._input_targets
+        ]
+
+    @property
+    def output_ids(self) -> List[int]:
+        """Get the id of the gate driving each primary output."""
+
+        return [self.id_of(gate) for gate in self._output_devices]
+
+    @property
+    def output_names(self) -> List[str]:
+        """Get the name of each primary output."""
+
+        return list(self._output_names)
+
+    @property
+    def sources(self) -> List[Tuple[Source, ...]]:
+        """Get where each device reads from, indexed by id."""
+
+        self._build()
+        return self._sources
+
+    @staticmethod
+    def _flatten(gate: ILogicGate) -> LogicGate:
+        """
+        This finds the primitive gate whose output is the output of a gate.
+
+        This is a private method.
+
+        Args:
+            gate:
+                ...
+
+        Returns:
+            gate:
+                ...
+        """
+
+        while isinstance(gate, CompoundGate):
+            gate = gate._output_gate
+
+        return gate
+
+    @staticmethod
+    def _flatten_pin(gate: ILogicGate, pin: int) -> List[Tuple[LogicGate, int]]:
+        """
+        This finds the primitive gate pins driven by a pin of a gate (a compound gate
+        drives the same pin on each of its input gates).
+
+        This is a private method.
+
+        Args:
+            gate:
+                ...
+            pin:
+                ...
+
+        Returns:
+            targets:
+                ...
+        """
+
+        if not isinstance(gate, CompoundGate):
+            return [(gate, pin)]
+
+        return [
+            target
+            for inner in gate._input_gates
+            for target in Circuit._flatten_pin(inner, pin)
+        ]
+
+    @staticmethod
+    def _upstream(device: DEVICE) -> List[Optional[Union[IBit, Tuple[DEVICE, int]]]]:
+        """
+        This finds what a device reads from: a bit or a `(device, port)` pair for each
+        of its inputs, in order (or `None` for a gate pin that hasn't been set).
+
+        This is a private method.
+
+        Args:
+            device:
+                ...
+
+        Returns:
+            upstream:
+                ...
+
+        Raises:
+            CircuitError:
+                (1) A wire in the circuit has no input connection!
+                (2) A switch in the circuit has no input connections!
+        """
+
+        if isinstance(device, ILogicGate):
+            return [
+                pin if pin is None or isinstance(pin, IBit) else (pin, 0)
+                for pin in device._input_pins
+            ]
+
+        if isinstance(device, IBranch):
+            return [(conn, 0) for conn in device._input_connections]
+
+        if isinstance(device, ISwitch):
+            upstream = [(conn, 0) for conn in device._input_connections if conn]
+            if not upstream:
+                raise CircuitError("A switch in the circuit has no input connections!")
+
+            return upstream
+
+        # Connections and loops both have a single input connection.
+        source: Optional[Union[DEVICE, Tuple[DEVICE, int]]] = device._input_connection
+        if source is None:
+            raise CircuitError("A wire in the circuit has no input connection!")
+
+        if isinstance(source, tuple):
+            return [source]
+
+        if isinstance(source, ILogicGate):
+            return [(Circuit._flatten(source), 0)]
+
+        return [(source, 0)]
+
+    def _build(self) -> None:
+        """
+        This registers every device the outputs depend on, giving each an id, and builds
+        the netlist. It does nothing if the netlist is already up to date.
+
+        The graph is walked with an explicit stack, so arbitrarily deep circuits don't
+        hit Python's recursion limit.
+
+        This is a private method.
+
+        Raises:
+            CircuitError:
+                (1) Pin {pin} of {name} has not been set yet!
+                (2) Pin {pin} of {name} is connected to a wire, so it can't be a
+                    primary input!
+                (3) The circuit has a cycle that doesn't go through a loop!
+        """
+
+        if self._devices is not None:
+            return
+
+        devices: List[DEVICE] = []
+        ids: Dict[int, int] = {}
+        upstream: Dict[int, List[Optional[Union[IBit, Tuple[DEVICE, int]]]]] = {}
+        # Loops whose stored value is read are only needed after everything else.
+        deferred: List[DEVICE] = []
+
+        def visit(root: DEVICE) -> None:
+            stack: List[DEVICE] = [root]
+            while stack:
+                device: DEVICE = stack[-1]
+                key: int = id(device)
+                if key in ids:
+                    stack.pop()
+                    continue
+
+                if key not in upstream:
+                    upstream[key] = self._upstream(device)
+                    for entry in reversed(upstream[key]):
+                        if entry is None or isinstance(entry, IBit):
+                            continue
+
+                        source, port = entry
+                        if isinstance(source, ILoop) and port == 1:
+                            deferred.append(source)
+                        elif id(source) not in ids:
+                            if id(source) in upstream:
+                                raise CircuitError(
+                                    "The circuit has a cycle that doesn't go through "
+                                    "a loop!"
+                                )
+
+                            stack.append(source)
+
+                    continue
+
+                stack.pop()
+                ids[key] = len(devices)
+                devices.append(device)
+
+        for gate in self._output_devices:
+            visit(gate)
+
+        while deferred:
+            visit(deferred.pop())
+
+        inputs: Dict[Tuple[int, int], int] = {
+            (id(gate), pin): index
+            for index, targets in enumerate(self._input_targets)
+            for gate, pin in targets
+        }
+
+        sources: List[Tuple[Source, ...]] = []
+        for device in devices:
+            row: List[Source] = []
+            for p, entry in enumerate(upstream[id(device)]):
+                name: str = getattr(device, "name", "") or "a gate"
+                if (id(device), p) in inputs:
+                    if entry is not None and not isinstance(entry, IBit):
+                        raise CircuitError(
+                            f"Pin {p} of {name} is connected to a wire, so it can't be "
+                            "a primary input!"
+                        )
+
+                    row.append(Source(SourceKind.INPUT, inputs[(id(device), p)]))
+                elif entry is None:
+                    raise CircuitError(f"Pin {p} of {name} has not been set yet!")
+                elif isinstance(entry, IBit):
+                    row.append(Source(SourceKind.CONSTANT, int(entry is Bit.ON)))
+                else:
+                    row.append(Source(SourceKind.DEVICE, ids[id(entry[0])], entry[1]))
+
+            sources.append(tuple(row))
+
+        fanin: List[Tuple[int, ...]] = [
+            tuple(s.index for s in row if s.kind is SourceKind.DEVICE)
+            for row in sources
+        ]
+        fanout: List[List[int]] = [[] for _ in devices]
+        for d, row in enumerate(fanin):
+            for s in row:
+                fanout[s].append(d)
+
+        self._devices = devices
+        self._ids = ids
+        self._sources = sources
+        self._fanin = fanin
+        self._fanout = [tuple(row) for row in fanout]
+
+    @classmethod
+    def from_gate(cls, gate: ILogicGate, *, name: Optional[str] = None) -> Circuit:
+        """
+        This builds a circuit with `gate` as its only output, and every gate pin holding
+        a bit upstream of it as a primary input (in the order they are found), named
+        `"<gate name>.<pin>"` (or `"in<n>"` for unnamed gates).
+
+        Args:
+            gate:
+                ...
+            name:
+                The name of the output.
+
+        Returns:
+            circuit:
+                ...
+        """
+
+        circuit: Circuit = cls()
+        circuit.add_output(gate, name=name)
+        for device, row in zip(circuit.devices, circuit.sources):
+            for p, source in enumerate(row):
+                if source.kind is SourceKind.CONSTANT:
+                    circuit.add_input(
+                        (device, p),
+                        name=f"{device.name}.{p}" if device.name else None,
+                    )
+
+        return circuit
+
+    def add_input(self, *targets: TARGET, name: Optional[str] = None) -> int:
+        """
+        This adds a primary input driving one or more gate pins (a pin of a compound
+        gate drives that pin on each of its input gates). The pins need to hold a bit,
+        or nothing at all, not a wire.
+
+        This is a public method.
+
+        Args:
+            targets:
+                `(gate, pin)` pairs.
+            name:
+                The name of the input. Defaults to `"in<n>"`.
+
+        Returns:
+            index:
+                The index of the new input.
+
+        Raises:
+            CircuitError:
+                An input needs to drive at least one pin!
+        """
+
+        if not targets:
+            raise CircuitError("An input needs to drive at least one pin!")
+
+        index: int = len(self._input_names)
+        self._input_names.append(f"in{index}" if name is None else name)
+        self._input_targets.append(
+            [flat for gate, pin in targets for flat in self._flatten_pin(gate, pin)]
+        )
+        self._devices = None
+        return index
+
+    def add_output(self, gate: ILogicGate, *, name: Optional[str] = None) -> int:
+        """
+        This adds a primary output, read from a gate (primitive or compound).
+
+        This is a public method.
+
+        Args:
+            gate:
+                ...
+            name:
+                The name of the output. Defaults to `"out<n>"`.
+
+        Returns:
+            index:
+                The index of the new output.
+        """
+
+        index: int = len(self._output_names)
+        self._output_names.append(f"out{index}" if name is None else name)
+        self._output_devices.append(self._flatten(gate))
+        self._devices = None
+        return index
+
+    def evaluate(self, values: Sequence[Union[IBit, int]]) -> List[Bit]:
+        """
+        This sets the primary inputs and evaluates every output by pulling through the
+        gates and wires themselves. With [`Memo`][Computer.LogicCircuit.memo.Memo]
+        switched on, logic shared between outputs is only evaluated once.
+
+        This is a public method.
+
+        Args:
+            values:
+                One bit (or `0`/`1`) per primary input, in order.
+
+        Returns:
+            outputs:
+                One bit per primary output, in order.
+
+        Raises:
+            CircuitError:
+                The circuit has {n} inputs, but {m} values were given!
+        """
+
+        if len(values) != len(self._input_names):
+            raise CircuitError(
+                f"The circuit has {len(self._input_names)} inputs, but {len(values)} "
+                "values were given!"
+            )
+
+        self._build()
+        for value, targets in zip(values, self._input_targets):
+            bit: Bit = value if isinstance(value, Bit) else Bit(value)
+            for gate, pin in targets:
+                gate._input_pins[pin] = bit
+
+        # One epoch for the whole evaluation, so outputs sharing logic share the cache.
+        if Memo.enabled:
+            Memo.next_epoch()
+
+        return [Bit.trusted(gate._get_output_value()) for gate in self._output_devices]
+
+    def id_of(self, device: DEVICE) -> int:
+        """
+        This gets the id of a registered device (a compound gate is registered as its
+        output gate).
+
+        This is a public method.
+
+        Args:
+            device:
+                ...
+
+        Returns:
+            id:
+                ...
+
+        Raises:
+            CircuitError:
+                That device isn't part of this circuit!
+        """
+
+        self._build()
+        if isinstance(device, CompoundGate):
+            device = self._flatten(device)
+
+        try:
+            return self._ids[id(device)]
+        except KeyError:
+            raise CircuitError("That device isn't part of this circuit!") from None
@@ -5,7 +5,7 @@ from Computer.LogicCircuit.abc import ICompoundFactory, IConnection, ILogicGate
 from Computer.LogicCircuit.Connection import Connection
 from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
 
-INFO = lambda msg: OUT.info(msg, level=1)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=1)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 STUFF = Union[ILogicGate, IConnection]
@@ -210,7 +210,7 @@ class CompoundFactory(ICompoundFactory):
                 What type of compound gate is being requested.
         """
 
-        INFO(f"Creating a new {type} compound factory.")
+        INFO("Creating a new %s compound factory.", type)
 
         self._type: str = type
         """
@@ -234,5 +234,5 @@ class CompoundFactory(ICompoundFactory):
                 A dictionary of all the components needed to construct the gate.
         """
 
-        INFO(f"Building the manifest for a {self._type} compound logic gate.")
+        INFO("Building the manifest for a %s compound logic gate.", self._type)
         return self._factories[self._type]()
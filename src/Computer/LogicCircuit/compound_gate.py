@@ -6,7 +6,7 @@ from Computer.Logger import OUT
 from Computer.LogicCircuit.abc import ICompoundFactory, IConnection, ILogicGate
 from Computer.LogicCircuit.compound_factory import CompoundFactory
 
-INFO = lambda msg: OUT.info(msg, level=2)  # noqa: E731
+INFO = lambda msg, *args: OUT.info(msg, *args, level=2)  # noqa: E731
 # Short-cut so we don't have to keep writing the same stuff...
 
 PIN = Union[IBit, IConnection]
@@ -77,7 +77,7 @@ class CompoundGate(ILogicGate):
         if not isinstance(type, CompoundType):
             raise CompoundGateError("You need to enter a valid logic gate type!")
 
-        INFO(f"Creating a new {type} compound logic gate with name {name}.")
+        INFO("Creating a new %s compound logic gate with name %s.", type, name)
 
         self._type: CompoundType = type
         """
@@ -126,6 +126,20 @@ class CompoundGate(ILogicGate):
 
         return self._type
 
+    def _get_output_value(self) -> int:
+        """
+        This evaluates the compound gate on plain `0`/`1` integers by calling the
+        output gate's [`_get_output_value`][Computer.LogicCircuit.LogicGate].
+
+        This is a private method.
+
+        Returns:
+            result:
+                ...
+        """
+
+        return self._output_gate._get_output_value()
+
     def get_output_pin(self) -> IBit:
         """
         This will be the primary method called by the user. It will call the output
@@ -141,7 +155,9 @@ class CompoundGate(ILogicGate):
                 ...
         """
 
-        INFO(f"Getting the output of {self._name}.")
+        if OUT.enabled:
+            INFO("Getting the output of %s.", self._name)
+
         return self._output_gate.get_output_pin()
 
     def has_input_pin_set(self, *, pin: int) -> bool:
@@ -214,13 +230,13 @@ class CompoundGate(ILogicGate):
             self._output_gate.reset(which="output")
 
         if which == "input":
-            INFO(f"Resetting the input pins of {self._name}.")
+            INFO("Resetting the input pins of %s.", self._name)
             reset_inputs()
         elif which == "output":
-            INFO(f"Resetting the output pins of {self._name}.")
+            INFO("Resetting the output pins of %s.", self._name)
             reset_output()
         else:
-            INFO(f"Resetting the all of the pins of {self._name}.")
+            INFO("Resetting the all of the pins of %s.", self._name)
             reset_inputs()
             reset_output()
 
@@ -242,9 +258,9 @@ class CompoundGate(ILogicGate):
         """
 
         if isinstance(value, IBit):
-            INFO(f"Setting input pin {pin} of {self._name} to bit {str(value)}.")
+            INFO("Setting input pin %d of %s to bit %s.", pin, self._name, value)
         elif isinstance(value, IConnection):
-            INFO(f"Setting input pin {pin} of {self._name} to a connection.")
+            INFO("Setting input pin %d of %s to a connection.", pin, self._name)
 
         for gate in self._input_gates:
             gate.set_input_pin(value=value, pin=pin)
@@ -264,5 +280,5 @@ class CompoundGate(ILogicGate):
                 The `Connection` instance you want to associate to this instance.
         """
 
-        INFO(f"Setting the output pin of {self._name} to a connection.")
+        INFO("Setting the output pin of %s to a connection.", self._name)
         self._output_gate.set_output_pin(value=value)
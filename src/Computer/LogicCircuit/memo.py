@@ -0,0 +1,56 @@
+class Memo:
+
+    """
+    This implements an opt-in, per-evaluation cache for the pull-based evaluation of
+    logic gates and connections. Every top-level evaluation (a public `get_output_pin`
+    or `feed` call, or `Circuit.evaluate`) starts a new epoch. While memoization is on,
+    each gate and connection remembers the epoch it last computed its value in, and
+    hands back that value instead of pulling from upstream again. A signal shared by
+    many devices (through a `Branch`, say) is then computed once per evaluation instead
+    of once per reader.
+
+    It is off by default, since a value is only recomputed in a new epoch: bits set
+    directly on pins in the middle of an evaluation would not be seen.
+
+        Memo.enable()
+        gate.get_output_pin()
+        print(Memo.saved)
+
+    Attributes:
+        enabled:    whether values are being cached
+        epoch:      the current evaluation epoch
+        saved:      the number of recomputations saved by the cache so far
+    """
+
+    enabled: bool = False
+    # Checked on every evaluation, so it is a plain class attribute.
+
+    epoch: int = 0
+    # Devices store the epoch their cached value was computed in.
+
+    saved: int = 0
+    # Bumped on every cache hit.
+
+    @staticmethod
+    def disable() -> None:
+        """This switches memoization off."""
+
+        Memo.enabled = False
+
+    @staticmethod
+    def enable() -> None:
+        """This switches memoization on, and resets the counter of saved work."""
+
+        Memo.enabled = True
+        Memo.saved = 0
+        Memo.next_epoch()
+
+    @staticmethod
+    def next_epoch() -> None:
+        """
+        This starts a new evaluation: every cached value becomes stale. It is called
+        by the top-level entry points, and only needs to be called by hand when
+        evaluating through the private integer paths.
+        """
+
+        Memo.epoch += 1
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from Computer.Bit import Bit
@@ -56,3 +59,45 @@ def test_bit_op(bits, res):
     assert bits[0].and_op(bits[1]) == res[0]
     assert bits[0].not_op() == res[1]
     assert bits[0].or_op(bits[1]) == res[2]
+
+
+@pytest.mark.parametrize(
+    ("value", "canonical"),
+    [(0, Bit.OFF), (1, Bit.ON), ("0", Bit.OFF), ("1", Bit.ON), (True, Bit.ON)],
+)
+def test_bit_interned(value, canonical):
+    assert Bit(value) is canonical
+    assert Bit.trusted(int(value)) is canonical
+
+
+def test_bit_slots():
+    assert not hasattr(Bit.ON, "__dict__")
+
+
+@pytest.mark.parametrize("left", [Bit.OFF, Bit.ON])
+@pytest.mark.parametrize("right", [Bit.OFF, Bit.ON])
+def test_bit_op_canonical(left, right):
+    assert left.and_op(right) is Bit.trusted(int(left == Bit.ON and right == Bit.ON))
+    assert left.or_op(right) is Bit.trusted(int(left == Bit.ON or right == Bit.ON))
+    assert left.not_op() is Bit.trusted(int(left == Bit.OFF))
+
+
+def test_bit_hash():
+    assert hash(Bit(0)) == hash(Bit.OFF)
+    assert hash(Bit(1)) == hash(Bit.ON)
+    assert len({Bit(0), Bit(1), Bit(False), Bit("1")}) == 2
+    assert {Bit(1): "on"}[Bit.ON] == "on"
+
+
+def test_bit_immutable():
+    with pytest.raises(BitError) as exc:
+        Bit.ON._value = Bit.OFF._value
+
+    assert exc.value.args[0] == "Bits are immutable!"
+    assert Bit.ON == Bit(1)
+
+
+def test_bit_copy_pickle():
+    assert copy.copy(Bit.ON) is Bit.ON
+    assert copy.deepcopy(Bit.OFF) is Bit.OFF
+    assert pickle.loads(pickle.dumps(Bit.ON)) is Bit.ON
@@ -0,0 +1,89 @@
+import pytest
+
+from Computer.Bit import BitString, PackedBitString
+from Computer.Bit.bit import BitError
+
+np = pytest.importorskip("numpy")
+
+from Computer.Bit import BitMatrix  # noqa: E402
+
+
+@pytest.fixture
+def matrix():
+    return BitMatrix.from_ints([0b1010110001, 0b0110000011, 0b1111111111], 10)
+
+
+def test_bit_matrix_init():
+    matrix: BitMatrix = BitMatrix(3, 10)
+    assert matrix.shape == (3, 10)
+    assert matrix.width == 10
+    assert len(matrix) == 3
+    assert matrix._data.shape == (3, 2)
+    assert matrix._data.dtype == np.uint8
+    assert not matrix._data.any()
+
+
+def test_bit_matrix_data(matrix):
+    assert matrix.data.tolist() == [[0xAC, 0x40], [0x60, 0xC0], [0xFF, 0xC0]]
+    assert matrix._padding == 6
+
+
+def test_bit_matrix_rows(matrix):
+    assert isinstance(matrix[0], BitString)
+    assert matrix[0].to_text() == "1010110001"
+    assert matrix.row(1).to_text() == "0110000011"
+    assert [row.to_int() for row in matrix] == matrix.to_ints()
+    assert str(matrix).splitlines()[2] == "1111111111"
+
+    matrix.set_row(1, PackedBitString.from_text("0000011111"))
+    assert matrix.to_ints()[1] == 0b0000011111
+    with pytest.raises(BitError) as exc:
+        matrix.set_row(0, BitString.from_text("11"))
+
+    assert exc.value.args[0] == "The bit string has 2 bits, but the rows have 10!"
+    with pytest.raises(BitError) as exc:
+        matrix.row(3)
+
+    assert exc.value.args[0] == "Index 3 lies outside the bit matrix length!"
+
+
+def test_bit_matrix_columns(matrix):
+    assert matrix.column(0).tolist() == [1, 0, 1]
+    assert matrix.column(9).tolist() == [1, 1, 1]
+    matrix.set_column(9, [0, 1, 0])
+    matrix.set_column(1, [True, True, False])
+    assert matrix.to_ints() == [0b1110110000, 0b0110000011, 0b1011111110]
+    with pytest.raises(BitError) as exc:
+        matrix.column(10)
+
+    assert exc.value.args[0] == "Index 10 lies outside the bit matrix width!"
+
+
+def test_bit_matrix_ops(matrix):
+    other: BitMatrix = BitMatrix.from_ints([0b1111100000] * 3, 10)
+    assert matrix.and_op(other).to_ints() == [0b1010100000, 0b0110000000, 0b1111100000]
+    assert matrix.or_op(other).to_ints() == [0b1111110001, 0b1111100011, 0b1111111111]
+    assert matrix.xor_op(other).to_ints() == [0b0101010001, 0b1001100011, 0b0000011111]
+    assert matrix.not_op().to_ints() == [0b0101001110, 0b1001111100, 0]
+    assert matrix.not_op().data[:, -1].tolist() == [0x80, 0x00, 0x00]
+    with pytest.raises(BitError) as exc:
+        matrix.and_op(BitMatrix(3, 9))
+
+    assert exc.value.args[0] == "The bit matrices have different shapes!"
+
+
+def test_bit_matrix_conversions(matrix):
+    strings = matrix.to_bit_strings()
+    assert [bits.to_text() for bits in strings] == [
+        "1010110001",
+        "0110000011",
+        "1111111111",
+    ]
+    assert BitMatrix.from_bit_strings(strings) == matrix
+    assert BitMatrix.from_array(matrix.to_array()) == matrix
+    assert matrix.to_array().shape == (3, 10)
+    assert BitMatrix.from_bit_strings([], width=4).shape == (0, 4)
+    with pytest.raises(BitError) as exc:
+        BitMatrix.from_ints([16], 4)
+
+    assert exc.value.args[0] == "16 does not fit into 4 bits!"
@@ -1,6 +1,9 @@
+import copy
+import pickle
+
 import pytest
 
-from Computer.Bit import Bit, BitString
+from Computer.Bit import Bit, BitString, BitStringView, FrozenBitString
 from Computer.Bit.bit import BitError
 
 
@@ -19,6 +22,8 @@ def test_bit_string_init():
     assert empty._max_length == 10
     assert isinstance(empty._bits, list)
     assert empty._bits == []
+    assert empty._head == 0
+    assert empty._length == 0
 
 
 def test_bit_string_max_length(bits):
@@ -52,10 +57,10 @@ def test_bit_string_length(bits):
 
 def test_bit_string_extend_error_exceed_max_length():
     bits: BitString = BitString(max_length=1)
-    bits._bits = [Bit(0)]
+    bits.push_right(Bit(0))
 
     stuff: BitString = BitString(max_length=10)
-    stuff._bits = [Bit(1)]
+    stuff.push_right(Bit(1))
 
     with pytest.raises(BitError) as exc:
         bits.extend_left(stuff)
@@ -81,7 +86,8 @@ def test_bit_string_extend_error_exceed_max_length():
 )
 def test_bit_string_extend(bits, config):
     stuff: BitString = BitString(max_length=2)
-    stuff._bits = [Bit(val) for val in config["value"]]
+    for val in config["value"]:
+        stuff.push_right(Bit(val))
 
     if config["dir"] == "left":
         bits.extend_left(stuff)
@@ -113,7 +119,7 @@ def test_bit_string_pop_error_len_zero():
     ]
 )
 def test_bit_string_pop(bits, config):
-    while len(bits._bits) > 0:
+    while len(bits) > 0:
         if config["dir"] == "left":
             bit: Bit = bits.pop_left()
             res: Bit = Bit(config["res"].pop(0))
@@ -127,7 +133,7 @@ def test_bit_string_pop(bits, config):
 
 def test_bit_string_push_error_exceed_max_length():
     bits: BitString = BitString(max_length=1)
-    bits._bits = [Bit(0)]
+    bits.push_right(Bit(0))
 
     with pytest.raises(BitError) as exc:
         bits.push_left(Bit(0))
@@ -159,5 +165,234 @@ def test_bit_string_push(bits, config):
 
     assert len(bits) == 4
     assert len(bits) < bits.max_length
-    for bit0, bit1 in zip(bits._bits, config["res"]):
+    for bit0, bit1 in zip(bits, config["res"]):
         assert bit0 == Bit(bit1)
+
+
+def test_bit_string_extend_self(bits):
+    bits.extend_left(bits)
+    assert [bit for bit in bits] == [Bit(val) for val in [0, 1, 0, 0, 1, 0]]
+
+
+def test_bit_string_extend_own_view():
+    bits: BitString = BitString.from_text("0100", max_length=10)
+    bits.extend_left(bits[0:2])
+    assert bits.to_text() == "010100"
+    bits.extend_right(bits[1:4])
+    assert bits.to_text() == "010100101"
+
+
+def test_bit_string_wrap_around():
+    bits: BitString = BitString(max_length=4)
+    res = []
+    for i in range(50):
+        bits.push_right(Bit(i % 2))
+        res.append(Bit(i % 2))
+        if len(bits) == bits.max_length:
+            assert bits.pop_left() == res.pop(0)
+            bits.push_left(bits.pop_right())
+            res.insert(0, res.pop())
+
+        assert [bit for bit in bits] == res
+        assert all(bits[i] == res[i] for i in range(len(res)))
+
+    assert len(bits._bits) == 4
+
+
+def test_frozen_bit_string(bits):
+    frozen: FrozenBitString = bits.freeze()
+    assert len(frozen) == 3
+    assert frozen.max_length == 10
+    assert [bit for bit in frozen] == [Bit(0), Bit(1), Bit(0)]
+    assert frozen[1] == Bit(1)
+
+    bits.push_right(Bit(1))
+    assert len(frozen) == 3
+
+    with pytest.raises(BitError) as exc:
+        frozen._bits = ()
+
+    assert exc.value.args[0] == "Frozen bit strings are immutable!"
+
+
+def test_frozen_bit_string_hash(bits):
+    frozen: FrozenBitString = bits.freeze()
+    same: FrozenBitString = FrozenBitString([Bit(0), Bit(1), Bit(0)])
+    other: FrozenBitString = FrozenBitString([Bit(1), Bit(1), Bit(0)])
+    assert frozen == same
+    assert hash(frozen) == hash(same)
+    assert frozen != other
+    assert len({frozen, same, other}) == 2
+    assert {frozen: "cached"}[same] == "cached"
+
+
+@pytest.mark.parametrize(
+    "roundtrip", [copy.copy, copy.deepcopy, lambda f: pickle.loads(pickle.dumps(f))]
+)
+def test_frozen_bit_string_copy_pickle(bits, roundtrip):
+    frozen: FrozenBitString = FrozenBitString(bits, max_length=8)
+    restored: FrozenBitString = roundtrip(frozen)
+    assert restored == frozen
+    assert hash(restored) == hash(frozen)
+    assert restored.max_length == 8
+    assert roundtrip(FrozenBitString()) == FrozenBitString()
+
+
+def test_frozen_bit_string_error_exceed_max_length():
+    with pytest.raises(BitError) as exc:
+        FrozenBitString([Bit(0), Bit(1)], max_length=1)
+
+    assert exc.value.args[0] == "There are more bits than the max length allows!"
+
+
+def test_frozen_bit_string_converts_bits():
+    frozen: FrozenBitString = FrozenBitString([1, 0])
+    assert frozen == BitString.from_text("10").freeze()
+    assert hash(frozen) == hash(BitString.from_text("10").freeze())
+    assert all(isinstance(bit, Bit) for bit in frozen)
+
+    with pytest.raises(BitError) as exc:
+        FrozenBitString([1, 2])
+
+    assert exc.value.args[0] == "Entered an unknown value: 2!"
+
+
+def test_frozen_bit_string_thaw(bits):
+    thawed: BitString = bits.freeze().thaw()
+    assert thawed.max_length == 10
+    assert [bit for bit in thawed] == [bit for bit in bits]
+    thawed.push_left(Bit(1))
+    assert len(thawed) == 4
+    assert len(bits) == 3
+
+
+def test_bit_string_setitem(bits):
+    bits[0] = Bit(1)
+    assert [bit for bit in bits] == [Bit(1), Bit(1), Bit(0)]
+    with pytest.raises(BitError) as exc:
+        bits[3] = Bit(1)
+
+    assert exc.value.args[0] == "Index 3 lies outside the bit string length!"
+
+
+def test_bit_string_view(bits):
+    bits.push_right(Bit(1))
+    view: BitStringView = bits[1:3]
+    assert isinstance(view, BitStringView)
+    assert view.parent is bits
+    assert view.start == 1
+    assert len(view) == 2
+    assert [bit for bit in view] == [Bit(1), Bit(0)]
+    assert view[1] == Bit(0)
+    assert len(bits[2:]) == 2
+    assert len(bits[:-1]) == 3
+    assert len(bits[5:9]) == 0
+
+    nested: BitStringView = view[1:]
+    assert nested.parent is bits
+    assert nested.start == 2
+    assert [bit for bit in nested] == [Bit(0)]
+
+    with pytest.raises(BitError) as exc:
+        view[2]
+
+    assert exc.value.args[0] == "Index 2 lies outside the bit string length!"
+
+    with pytest.raises(BitError) as exc:
+        bits[::2]
+
+    assert exc.value.args[0] == "Only contiguous slices of a bit string can be taken!"
+
+
+def test_bit_string_view_write_through(bits):
+    view: BitStringView = bits[1:]
+    view[1] = Bit(1)
+    assert bits[2] == Bit(1)
+    bits[1] = Bit(0)
+    assert view[0] == Bit(0)
+    assert view.freeze() == FrozenBitString([Bit(0), Bit(1)])
+
+
+def test_bit_string_view_after_shrink(bits):
+    view: BitStringView = bits[1:]
+    bits.pop_right()
+    for read in (list, BitStringView.to_text):
+        with pytest.raises(BitError) as exc:
+            read(view)
+
+        assert exc.value.args[0] == "Index 2 lies outside the bit string length!"
+
+
+def test_frozen_bit_string_view(bits):
+    frozen: FrozenBitString = bits.freeze()
+    view: BitStringView = frozen[:2]
+    assert [bit for bit in view] == [Bit(0), Bit(1)]
+    with pytest.raises(BitError) as exc:
+        view[0] = Bit(1)
+
+    assert exc.value.args[0] == "Frozen bit strings are immutable!"
+
+
+@pytest.mark.parametrize("cls", [BitString, FrozenBitString])
+def test_bit_string_from_int(cls):
+    bits = cls.from_int(0b0110, 4)
+    assert [bit for bit in bits] == [Bit(0), Bit(1), Bit(1), Bit(0)]
+    assert bits.max_length == 4
+    assert bits.to_int() == 6
+    assert bits.to_text() == "0110"
+    assert bits.to_bytes() == b"\x06"
+    assert cls.from_int(0, 0).to_text() == ""
+    assert cls.from_int(1, 1, max_length=8).max_length == 8
+
+    with pytest.raises(BitError) as exc:
+        cls.from_int(16, 4)
+
+    assert exc.value.args[0] == "16 does not fit into 4 bits!"
+
+
+def test_bit_string_from_text_bytes():
+    bits: BitString = BitString.from_text("1011")
+    assert bits.to_int() == 0b1011
+    assert bits.max_length == 4
+
+    bits = BitString.from_bytes(b"\xa5\x0f", max_length=20)
+    assert len(bits) == 16
+    assert bits.max_length == 20
+    assert bits.to_text() == "1010010100001111"
+    assert bits.to_bytes() == b"\xa5\x0f"
+    assert bits[4:12].to_int() == 0x50
+
+    with pytest.raises(BitError) as exc:
+        BitString.from_text("10x1")
+
+    assert exc.value.args[0] == "10x1 is not made up of only 0s and 1s!"
+
+
+def test_bit_string_to_int_wrapped():
+    bits: BitString = BitString.from_text("0001")
+    bits.pop_left()
+    bits.push_right(Bit(1))
+    bits.pop_left()
+    bits.push_right(Bit(0))
+    assert bits._head == 2
+    assert bits.to_text() == "0110"
+    assert bits[1:].to_text() == "110"
+    assert BitString.from_text("101").to_bytes() == b"\x05"
+
+
+def test_bit_string_shift_register():
+    bits: BitString = BitString(max_length=3, shift_register=True)
+    assert bits.shift_register
+    assert bits.push_right(Bit(1)) is None
+    assert bits.push_right(Bit(0)) is None
+    assert bits.push_right(Bit(1)) is None
+    assert bits.push_right(Bit(1)) == Bit(1)
+    assert bits.to_text() == "011"
+    assert bits.push_right(Bit(0)) == Bit(0)
+    assert bits.to_text() == "110"
+    assert bits.push_left(Bit(0)) == Bit(0)
+    assert bits.to_text() == "011"
+    assert bits.push_left(Bit(0)) == Bit(1)
+    assert bits.to_text() == "001"
+    assert len(bits) == 3
+    assert len(bits._bits) == 3
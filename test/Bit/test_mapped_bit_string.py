@@ -0,0 +1,155 @@
+import pytest
+
+from Computer.Bit import Bit, BitString, MappedBitString
+from Computer.Bit.bit import BitError
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "image.bin"
+    path.write_bytes(b"\xa5\x0f")
+    return path
+
+
+def test_mapped_bit_string_init(image):
+    with MappedBitString(image) as bits:
+        assert bits.max_length == 16
+        assert len(bits) == 16
+        assert bits._head == 0
+        assert not bits._writable
+        assert bits.to_text() == "1010010100001111"
+        assert bits[0] == Bit(1)
+        assert bits[1] == Bit(0)
+        assert bits[15] == Bit(1)
+
+    assert bits._map.closed
+
+
+def test_mapped_bit_string_init_error_empty(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with pytest.raises(BitError) as exc:
+        MappedBitString(path)
+
+    assert exc.value.args[0] == f"Cannot map the empty file {path}!"
+
+
+def test_mapped_bit_string_read_only(image):
+    with MappedBitString(image) as bits:
+        with pytest.raises(BitError) as exc:
+            bits[0] = Bit(0)
+
+        assert exc.value.args[0] == "This bit string is read-only!"
+
+
+def test_mapped_bit_string_views(image):
+    with MappedBitString(image) as bits:
+        assert bits[4:12].to_int() == 0x50
+        assert [bit for bit in bits[:4]] == [Bit(1), Bit(0), Bit(1), Bit(0)]
+        assert bits.to_bytes() == b"\xa5\x0f"
+
+
+def test_mapped_bit_string_write_through(image):
+    with MappedBitString(image, writable=True) as bits:
+        bits[0] = Bit(0)
+        bits[4:8][3] = Bit(0)
+        bits[15] = Bit(1)
+
+    assert image.read_bytes() == b"\x24\x0f"
+
+
+def test_mapped_bit_string_stream(image):
+    with MappedBitString(image, writable=True) as bits:
+        assert bits.pop_left() == Bit(1)
+        assert bits.pop_left() == Bit(0)
+        bits.push_right(Bit(1))
+        bits.push_right(Bit(1))
+        assert len(bits) == 16
+        assert bits.to_text() == "1001010000111111"
+        assert bits[12:].to_text() == "1111"
+        with pytest.raises(BitError) as exc:
+            bits.push_left(Bit(0))
+
+        assert exc.value.args[0] == (
+            "This bit string has the maximum number of bits allowed!"
+        )
+
+        assert bits.pop_right() == Bit(1)
+        bits.push_left(Bit(0))
+        assert bits.to_text() == "0100101000011111"
+
+
+def test_mapped_bit_string_create(tmp_path):
+    path = tmp_path / "capture.bin"
+    with MappedBitString.create(path, max_length=12) as bits:
+        assert bits.max_length == 16
+        assert len(bits) == 0
+        bits.extend_right(BitString.from_text("1100"))
+        bits.extend_left(BitString.from_text("01"))
+        bits.push_right(Bit(1))
+        assert bits.to_text() == "0111001"
+        with pytest.raises(BitError) as exc:
+            bits.extend_right(BitString.from_text("1" * 10))
+
+        assert exc.value.args[0] == (
+            "Adding 10 more bits to the bit string will exceed the max length!"
+        )
+
+    assert path.stat().st_size == 2
+
+    with MappedBitString(path, length=4) as bits:
+        assert bits.to_text() == "1100"
+
+
+def test_mapped_bit_string_extend_wraps(image, monkeypatch):
+    monkeypatch.setattr(MappedBitString, "_CHUNK", 1)
+    with MappedBitString(image, writable=True, length=4) as bits:
+        for _ in range(3):
+            bits.pop_left()
+
+        bits.extend_left(BitString.from_text("0110011"))
+        assert bits.to_text() == "01100110"
+        bits.extend_right([Bit(1)] * 4 + [Bit(0)] * 4)
+        assert bits.to_text() == "0110011011110000"
+        assert bits._head == 12
+
+
+def test_mapped_bit_string_extend_self(tmp_path):
+    path = tmp_path / "capture.bin"
+    with MappedBitString.create(path, max_length=32) as bits:
+        bits.extend_right(BitString.from_text("0100"))
+        bits.extend_left(bits[0:2])
+        assert bits.to_text() == "010100"
+        bits.extend_right(bits[1:4])
+        assert bits.to_text() == "010100101"
+        bits.extend_left(bits)
+        assert bits.to_text() == "010100101010100101"
+
+
+def test_mapped_bit_string_extend_left_error_source(image, tmp_path):
+    source = MappedBitString(image)
+    source.close()
+    with MappedBitString.create(tmp_path / "capture.bin", max_length=32) as bits:
+        bits.extend_right(BitString.from_text("0100"))
+        with pytest.raises(ValueError):
+            bits.extend_left(source)
+
+        assert len(bits) == 4
+        assert bits._head == 0
+        assert bits.to_text() == "0100"
+
+
+def test_mapped_bit_string_extend_error_read_only(image):
+    with MappedBitString(image, length=8) as bits:
+        with pytest.raises(BitError) as exc:
+            bits.extend_left(BitString.from_text("1"))
+
+        assert exc.value.args[0] == "This bit string is read-only!"
+        assert bits.to_text() == "10100101"
+
+
+def test_mapped_bit_string_error_from_text():
+    with pytest.raises(BitError) as exc:
+        MappedBitString.from_text("1011")
+
+    assert exc.value.args[0] == "Mapped bit strings have to be opened from a file!"
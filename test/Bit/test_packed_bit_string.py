@@ -0,0 +1,207 @@
+import pytest
+
+from Computer.Bit import Bit, BitString, PackedBitString
+from Computer.Bit.bit import BitError
+
+
+def make(text: str, max_length: int = 10) -> PackedBitString:
+    bits: PackedBitString = PackedBitString(max_length=max_length)
+    for char in text:
+        bits.push_right(Bit(char))
+
+    return bits
+
+
+def text(bits) -> str:
+    return "".join("1" if bit == Bit.ON else "0" for bit in bits)
+
+
+@pytest.fixture
+def bits():
+    return make("010")
+
+
+def test_packed_bit_string_init():
+    empty: PackedBitString = PackedBitString(max_length=10)
+    assert empty._max_length == 10
+    assert empty._value == 0
+    assert empty._length == 0
+    assert len(empty) == 0
+    assert list(empty) == []
+
+
+def test_packed_bit_string_storage(bits):
+    assert bits._value == 0b010
+    assert bits.max_length == 10
+    assert bits.mask == 0b111
+
+
+def test_packed_bit_string_getitem(bits):
+    assert bits[0] == Bit(0)
+    assert bits[1] == Bit(1)
+    assert bits[2] == Bit(0)
+    with pytest.raises(BitError) as exc:
+        bits[3]
+
+    assert exc.value.args[0] == "Index 3 lies outside the bit string length!"
+
+
+def test_packed_bit_string_iter(bits):
+    assert all(isinstance(bit, Bit) for bit in bits)
+    assert text(bits) == "010"
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        dict(dir="left", value="01", res="01010"),
+        dict(dir="right", value="11", res="01011"),
+    ],
+)
+def test_packed_bit_string_extend(bits, config):
+    stuff: BitString = BitString(max_length=2)
+    for char in config["value"]:
+        stuff.push_right(Bit(char))
+
+    if config["dir"] == "left":
+        bits.extend_left(stuff)
+        bits.extend_left(make("1"))
+    elif config["dir"] == "right":
+        bits.extend_right(stuff)
+        bits.extend_right(make("1"))
+
+    res = "1" + config["res"] if config["dir"] == "left" else config["res"] + "1"
+    assert text(bits) == res
+    with pytest.raises(BitError) as exc:
+        bits.extend_right(make("00000"))
+
+    assert exc.value.args[0] == (
+        "Adding 5 more bits to the bit string will exceed the max length!"
+    )
+
+
+def test_packed_bit_string_push_pop():
+    bits: PackedBitString = PackedBitString(max_length=3)
+    bits.push_right(Bit(1))
+    bits.push_left(Bit(0))
+    bits.push_right(Bit(1))
+    assert text(bits) == "011"
+    with pytest.raises(BitError) as exc:
+        bits.push_left(Bit(1))
+
+    assert exc.value.args[0] == (
+        "This bit string has the maximum number of bits allowed!"
+    )
+    assert bits.pop_left() == Bit(0)
+    assert bits.pop_right() == Bit(1)
+    assert bits.pop_right() == Bit(1)
+    with pytest.raises(BitError) as exc:
+        bits.pop_left()
+
+    assert exc.value.args[0] == "This bit string is empty!"
+
+
+@pytest.mark.parametrize(
+    ("op", "res"),
+    [
+        ("and_op", "1000"),
+        ("or_op", "1110"),
+        ("xor_op", "0110"),
+    ],
+)
+def test_packed_bit_string_binary_ops(op, res):
+    left: PackedBitString = make("1100")
+    right: PackedBitString = make("1010")
+    assert text(getattr(left, op)(right)) == res
+    assert text(left) == "1100"
+    with pytest.raises(BitError) as exc:
+        getattr(left, op)(make("1"))
+
+    assert exc.value.args[0] == "The bit strings have different lengths!"
+
+
+@pytest.mark.parametrize(
+    ("op", "amount", "res"),
+    [
+        ("shift_left", 1, "01100"),
+        ("shift_left", 7, "00000"),
+        ("shift_right", 2, "00101"),
+        ("rotate_left", 1, "01101"),
+        ("rotate_left", 6, "01101"),
+        ("rotate_right", 2, "10101"),
+    ],
+)
+def test_packed_bit_string_shift_rotate(op, amount, res):
+    bits: PackedBitString = make("10110")
+    assert text(getattr(bits, op)(amount)) == res
+
+
+def test_packed_bit_string_not_popcount():
+    bits: PackedBitString = make("10110")
+    assert text(bits.not_op()) == "01001"
+    assert bits.popcount() == 3
+    assert bits.not_op().popcount() == 2
+
+
+def test_packed_bit_string_freeze(bits):
+    frozen = bits.freeze()
+    assert frozen == make("010", max_length=3).freeze()
+    assert frozen.max_length == 10
+
+
+def test_packed_bit_string_setitem(bits):
+    bits[0] = Bit(1)
+    bits[1] = Bit(0)
+    assert text(bits) == "100"
+    assert bits._value == 0b100
+
+
+def test_packed_bit_string_view():
+    bits: PackedBitString = make("1011001")
+    opcode = bits[:3]
+    imm = bits[3:]
+    assert text(opcode) == "101"
+    assert text(imm) == "1001"
+    assert text(imm[1:3]) == "00"
+
+    imm[1] = Bit(1)
+    assert text(bits) == "1011101"
+    assert text(bits[7:]) == ""
+
+
+def test_packed_bit_string_conversions():
+    bits: PackedBitString = PackedBitString.from_int(0xBEEF, 16)
+    assert bits._value == 0xBEEF
+    assert bits.to_int() == 0xBEEF
+    assert bits.to_bytes() == b"\xbe\xef"
+    assert bits.to_text() == "1011111011101111"
+    assert bits[:4].to_int() == 0xB
+    assert bits[4:12].to_text() == "11101110"
+
+    assert PackedBitString.from_text("0011").to_int() == 3
+    assert PackedBitString.from_bytes(b"\x80").to_text() == "10000000"
+    with pytest.raises(BitError) as exc:
+        PackedBitString.from_int(-1, 4)
+
+    assert exc.value.args[0] == "-1 does not fit into 4 bits!"
+
+
+def test_packed_bit_string_extend_view():
+    bits: PackedBitString = PackedBitString.from_text("0101", max_length=8)
+    bits.extend_right(BitString.from_text("110011")[1:4])
+    assert bits.to_text() == "0101100"
+
+
+def test_packed_bit_string_shift_register():
+    bits: PackedBitString = PackedBitString(max_length=3, shift_register=True)
+    assert bits.shift_register
+    assert bits.push_right(Bit(1)) is None
+    assert bits.push_right(Bit(0)) is None
+    assert bits.push_right(Bit(1)) is None
+    assert bits.push_right(Bit(1)) == Bit(1)
+    assert bits.to_text() == "011"
+    assert bits.push_left(Bit(1)) == Bit(1)
+    assert bits.to_text() == "101"
+    assert bits.push_left(Bit(0)) == Bit(1)
+    assert bits.to_text() == "010"
+    assert bits.not_op().shift_register
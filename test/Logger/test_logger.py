@@ -0,0 +1,176 @@
+import io
+import logging
+import re
+import time
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.Logger import OUT
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+class Loud:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "loud"
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    OUT.configure(stream=stream)
+    yield stream
+    OUT.reset()
+    OUT.disable()
+
+
+def test_logger_error_no_level():
+    with pytest.raises(ValueError) as exc:
+        OUT.info("blah")
+
+    assert exc.value.args[0] == "You need to provide a valid logging level!"
+
+
+def test_logger_disabled_by_default(capsys):
+    assert not OUT.enabled
+    loud = Loud()
+    OUT.info("%s", loud, level=0)
+    assert loud.calls == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_logger_configure(stream):
+    assert OUT.enabled
+    OUT.info("Feeding information %s to the %s.", Bit(1), "output", level=3)
+    assert re.fullmatch(
+        r"\[\d\d:\d\d:\d\d\] Connection :: "
+        r"Feeding information Bit\(ON\) to the output\.\n",
+        stream.getvalue(),
+    )
+
+
+def test_logger_configure_twice(stream):
+    OUT.configure(stream=stream)
+    OUT.info("blah", level=0)
+    assert stream.getvalue().count("blah") == 1
+
+
+def test_logger_set_level(stream):
+    OUT.set_level(logging.WARNING)
+    assert not OUT.enabled
+    OUT.info("blah", level=0)
+    assert stream.getvalue() == ""
+
+    OUT.set_level(logging.DEBUG)
+    assert OUT.enabled
+
+
+def test_logger_gate_messages(stream):
+    gate = LogicGate(type=LogicType.NOT, name="foo")
+    gate.set_input_pin(value=Bit(0), pin=0)
+    assert gate.get_output_pin() == Bit(1)
+    assert "LogicGate :: The resulting output is: Bit(ON)." in stream.getvalue()
+
+
+def test_logger_error_unknown_component():
+    with pytest.raises(ValueError) as exc:
+        OUT.disable("blah")
+
+    assert exc.value.args[0] == "blah is not a known component!"
+
+
+def test_logger_disable_component(stream):
+    OUT.disable("Connection")
+    assert OUT.enabled
+    OUT.info("muted", level=3)
+    OUT.info("kept", level=5)
+    assert "muted" not in stream.getvalue()
+    assert "Switch :: kept" in stream.getvalue()
+
+    OUT.enable(3)
+    OUT.info("back", level=3)
+    assert "Connection :: back" in stream.getvalue()
+
+
+def test_logger_refresh():
+    computer = logging.getLogger("Computer")
+    level = computer.level
+    computer.setLevel(logging.INFO)
+    try:
+        assert not OUT.enabled
+        OUT.refresh()
+        assert OUT.enabled
+    finally:
+        computer.setLevel(level)
+        OUT.disable()
+
+
+def test_logger_disable_every_component(stream):
+    for component in range(7):
+        OUT.disable(component)
+
+    assert not OUT.enabled
+
+
+def test_logger_component_level(stream):
+    OUT.set_level(logging.WARNING)
+    OUT.set_level(logging.INFO, component="Switch")
+    assert OUT.enabled
+    OUT.info("quiet", level=3)
+    OUT.info("loud", level=5)
+    assert "quiet" not in stream.getvalue()
+    assert "Switch :: loud" in stream.getvalue()
+
+
+def test_logger_disable_overrides_component_level(stream):
+    OUT.set_level(logging.INFO, "Switch")
+    OUT.disable()
+    assert not OUT.enabled
+    OUT.info("quiet", level=5)
+    assert stream.getvalue() == ""
+
+    OUT.set_level(logging.INFO)
+    assert OUT.enabled
+    OUT.info("loud", level=5)
+    assert "Switch :: loud" in stream.getvalue()
+
+
+def test_logger_sample(stream):
+    OUT.sample("Loop", every=3)
+    for i in range(9):
+        OUT.info("loop %d", i, level=6)
+
+    assert re.findall(r"loop (\d)", stream.getvalue()) == ["2", "5", "8"]
+
+
+def test_logger_sample_error_bad_every():
+    with pytest.raises(ValueError) as exc:
+        OUT.sample("Loop", every=0)
+
+    assert exc.value.args[0] == (
+        "You can only keep one in every N messages for a positive N!"
+    )
+
+
+def test_logger_rate_limit(stream, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    OUT.rate_limit("Branch", per_second=2, burst=3)
+    for i in range(5):
+        OUT.info("branch %d", i, level=4)
+
+    assert re.findall(r"branch (\d)", stream.getvalue()) == ["0", "1", "2"]
+
+    clock[0] += 1.0
+    for i in range(5, 10):
+        OUT.info("branch %d", i, level=4)
+
+    assert re.findall(r"branch (\d)", stream.getvalue()) == ["0", "1", "2", "5", "6"]
+
+    OUT.rate_limit("Branch", per_second=None)
+    OUT.info("branch %d", 9, level=4)
+    assert stream.getvalue().endswith("branch 9\n")
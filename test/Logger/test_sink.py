@@ -0,0 +1,175 @@
+import io
+import logging
+import threading
+import time
+
+import pytest
+
+from Computer.Logger import OUT, AsyncSink, Overflow
+
+
+def make_record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("Computer", logging.INFO, __file__, 0, message, (), None)
+
+
+class SlowStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+        self.writes = 0
+
+    def write(self, text):
+        self.entered.set()
+        self.gate.wait()
+        self.writes += 1
+        return super().write(text)
+
+
+def test_sink_writes_to_file(tmp_path):
+    path = tmp_path / "log.txt"
+    sink = AsyncSink(path)
+    for i in range(100):
+        sink.emit(make_record(f"message {i}"))
+
+    sink.close()
+    assert path.read_text().splitlines() == [f"message {i}" for i in range(100)]
+
+
+def test_sink_flush(tmp_path):
+    path = tmp_path / "log.txt"
+    sink = AsyncSink(path)
+    sink.emit(make_record("blah"))
+    sink.flush()
+    assert path.read_text() == "blah\n"
+    sink.close()
+
+
+def test_sink_close_twice():
+    stream = io.StringIO()
+    sink = AsyncSink(stream)
+    sink.close()
+    sink.close()
+    assert not stream.closed
+
+
+def test_sink_batches_writes():
+    stream = SlowStream()
+    sink = AsyncSink(stream)
+    sink.emit(make_record("first"))
+    stream.entered.wait()
+    for i in range(50):
+        sink.emit(make_record(f"message {i}"))
+
+    stream.gate.set()
+    sink.close()
+    assert len(stream.getvalue().splitlines()) == 51
+    assert stream.writes == 2
+
+
+@pytest.mark.parametrize("overflow", [Overflow.DROP, Overflow.COUNT])
+def test_sink_overflow_drops(overflow):
+    stream = SlowStream()
+    sink = AsyncSink(stream, max_size=4, overflow=overflow)
+    sink.emit(make_record("first"))
+    stream.entered.wait()
+    for i in range(20):
+        sink.emit(make_record(f"message {i}"))
+
+    assert sink.dropped == (16 if overflow is Overflow.COUNT else 0)
+    stream.gate.set()
+    sink.close()
+
+    lines = stream.getvalue().splitlines()
+    assert lines[:5] == ["first"] + [f"message {i}" for i in range(4)]
+    if overflow is Overflow.COUNT:
+        assert lines[5:] == ["... 16 log records were dropped ..."]
+    else:
+        assert lines[5:] == []
+
+
+def test_logger_configure_async(tmp_path):
+    path = tmp_path / "log.txt"
+    sink = OUT.configure_async(path)
+    assert OUT.enabled
+    OUT.info("blah %d", 1, level=4)
+    sink.flush()
+    assert path.read_text().endswith("Branch :: blah 1\n")
+
+    OUT.disable()
+    sink.close()
+
+
+def test_sink_survives_bad_record(monkeypatch):
+    monkeypatch.setattr(logging, "raiseExceptions", False)
+    stream = io.StringIO()
+    sink = OUT.configure_async(stream, max_size=4)
+    OUT.info("bad %d", "x", level=0)
+    for i in range(50):
+        OUT.info("good %d", i, level=0)
+
+    sink.flush()
+    OUT.disable()
+    sink.close()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 50
+    assert lines[-1].endswith("LogicGate :: good 49")
+
+
+def test_sink_writes_after_close():
+    stream = io.StringIO()
+    sink = AsyncSink(stream)
+    sink.close()
+    sink.emit(make_record("late"))
+    sink.flush()
+    assert stream.getvalue() == "late\n"
+
+
+def test_sink_flushes_on_timer(tmp_path):
+    path = tmp_path / "log.txt"
+    sink = AsyncSink(path)
+    sink.FLUSH_INTERVAL = 0.01
+    sink.emit(make_record("blah"))
+    for _ in range(200):
+        if path.read_text():
+            break
+
+        time.sleep(0.01)
+
+    assert path.read_text() == "blah\n"
+    sink.close()
+
+
+def test_sink_writes_to_own_file_after_close(tmp_path, capsys):
+    path = tmp_path / "log.txt"
+    sink = AsyncSink(path)
+    sink.emit(make_record("early"))
+    sink.close()
+    sink.emit(make_record("late"))
+    sink.flush()
+    assert path.read_text() == "early\nlate\n"
+    assert capsys.readouterr().err == ""
+
+
+def test_logger_configure_async_close(tmp_path, capsys):
+    path = tmp_path / "log.txt"
+    sink = OUT.configure_async(path)
+    OUT.info("kept", level=0)
+    sink.close()
+    assert not OUT.enabled
+    OUT.info("dropped", level=0)
+    assert path.read_text().endswith("LogicGate :: kept\n")
+    assert capsys.readouterr().err == ""
+
+
+def test_sink_flush_while_closing():
+    for _ in range(50):
+        stream = io.StringIO()
+        sink = AsyncSink(stream)
+        sink.emit(make_record("blah"))
+        flusher = threading.Thread(target=sink.flush)
+        flusher.start()
+        sink.close()
+        flusher.join(timeout=5)
+        assert not flusher.is_alive()
+        assert stream.getvalue() == "blah\n"
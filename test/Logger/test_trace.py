@@ -0,0 +1,115 @@
+import pytest
+
+from Computer.Bit import Bit
+from Computer.Logger import EventKind, TraceRecorder, decode, load
+from Computer.LogicCircuit.Connection import Connection
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+@pytest.fixture
+def chain():
+    gate_1 = LogicGate(type=LogicType.NOT)
+    gate_1.set_input_pin(value=Bit(0), pin=0)
+    conn = Connection()
+    conn.set_input_connection(device=gate_1)
+    gate_2 = LogicGate(type=LogicType.NOT, name="last")
+    conn.set_output_connection(device=gate_2, index=0)
+    return gate_1, conn, gate_2
+
+
+def test_trace_error_bad_capacity():
+    with pytest.raises(ValueError) as exc:
+        TraceRecorder(capacity=0)
+
+    assert exc.value.args[0] == "The trace buffer needs room for at least one event!"
+
+
+def test_trace_records_evaluation(chain):
+    gate_1, conn, gate_2 = chain
+    with TraceRecorder() as recorder:
+        assert TraceRecorder.active is recorder
+        gate_2.get_output_pin()
+
+    assert TraceRecorder.active is None
+    assert recorder.devices == [gate_1, conn, gate_2]
+    assert recorder.events() == [
+        (0, 0, EventKind.OUTPUT, 1),
+        (3, 1, EventKind.FEED, 1),
+        (0, 2, EventKind.OUTPUT, 0),
+    ]
+
+
+def test_trace_not_recording(chain):
+    recorder = TraceRecorder()
+    chain[2].get_output_pin()
+    assert len(recorder) == 0
+
+
+def test_trace_ring_overwrites_oldest():
+    recorder = TraceRecorder(capacity=3)
+    devices = [object() for _ in range(5)]
+    for device in devices:
+        recorder.record(0, device, EventKind.OUTPUT, 1)
+
+    assert len(recorder) == 3
+    assert recorder.dropped == 2
+    assert [event[1] for event in recorder.events()] == [2, 3, 4]
+
+    recorder.clear()
+    assert recorder.events() == []
+
+
+def test_trace_dump_and_decode(tmp_path, chain):
+    path = tmp_path / "trace.bin"
+    with TraceRecorder(capacity=2) as recorder:
+        chain[2].get_output_pin()
+
+    recorder.dump(path)
+    assert load(path) == recorder.events()
+    assert decode(path) == [
+        "Connection #1 (Connection) FEED 1",
+        "LogicGate #2 (LogicGate last) OUTPUT 0",
+    ]
+
+
+def test_trace_dump_on_exception(tmp_path, chain):
+    path = tmp_path / "trace.bin"
+    recorder = TraceRecorder()
+    with pytest.raises(RuntimeError):
+        with recorder.dump_on_exception(path):
+            chain[0].get_output_pin()
+            raise RuntimeError()
+
+    assert TraceRecorder.active is None
+    assert decode(path) == ["LogicGate #0 (LogicGate) OUTPUT 1"]
+
+
+def test_trace_no_dump_without_exception(tmp_path, chain):
+    path = tmp_path / "trace.bin"
+    with TraceRecorder().dump_on_exception(path):
+        chain[2].get_output_pin()
+
+    assert not path.exists()
+
+
+def test_trace_load_error_not_a_dump(tmp_path):
+    path = tmp_path / "trace.bin"
+    path.write_bytes(b"blah")
+    with pytest.raises(ValueError) as exc:
+        load(path)
+
+    assert exc.value.args[0] == f"{path} is not a trace dump!"
+
+
+def test_trace_load_error_truncated(tmp_path, chain):
+    path = tmp_path / "trace.bin"
+    with TraceRecorder() as recorder:
+        chain[2].get_output_pin()
+
+    recorder.dump(path)
+    for size in (len(path.read_bytes()) - 1, 30):
+        path.write_bytes(path.read_bytes()[:size])
+        with pytest.raises(ValueError) as exc:
+            load(path)
+
+        assert exc.value.args[0] == f"{path} is truncated!"
@@ -85,9 +85,9 @@ def test_branch_feed_error_bad_index(branch_mapping):
     assert exc.value.args[0] == "8 doesn't correspond to any output connection!"
 
 
-@mock.patch.object(Connection, "feed")
+@mock.patch.object(Connection, "_feed_value")
 def test_branch_feed(mock_feed, branch_mapping):
-    mock_feed.return_value = Bit(0)
+    mock_feed.return_value = 0
     ret = branch_mapping.feed(index=0)
     assert isinstance(ret, Bit)
     mock_feed.assert_called_once()
@@ -44,9 +44,9 @@ def test_connection_feed_error_no_ouput():
     assert exc.value.args[0] == "The output connection has not been set yet!"
 
 
-@mock.patch.object(LogicGate, "get_output_pin")
+@mock.patch.object(LogicGate, "_get_output_value")
 def test_connection_feed_gate(mock_get, gate):
-    mock_get.return_value = Bit(0)
+    mock_get.return_value = 0
     conn = Connection()
     conn._input_connection = gate
     ret: Bit = conn.feed()
@@ -54,9 +54,9 @@ def test_connection_feed_gate(mock_get, gate):
     mock_get.assert_called_once()
 
 
-@mock.patch.object(Branch, "feed")
+@mock.patch.object(Branch, "_feed_value")
 def test_connection_feed_branch(mock_feed, branch):
-    mock_feed.return_value = Bit(1)
+    mock_feed.return_value = 1
     conn = Connection()
     conn._input_connection = (branch, 2)
     ret: Bit = conn.feed()
@@ -64,9 +64,9 @@ def test_connection_feed_branch(mock_feed, branch):
     mock_feed.assert_called_once_with(index=2)
 
 
-@mock.patch.object(Switch, "feed")
+@mock.patch.object(Switch, "_feed_value")
 def test_connection_feed_switch(mock_feed, switch):
-    mock_feed.return_value = Bit(1)
+    mock_feed.return_value = 1
     conn = Connection()
     conn._input_connection = switch
     ret: Bit = conn.feed()
@@ -74,9 +74,9 @@ def test_connection_feed_switch(mock_feed, switch):
     mock_feed.assert_called_once()
 
 
-@mock.patch.object(Loop, "feed")
+@mock.patch.object(Loop, "_feed_value")
 def test_connection_feed_loop(mock_feed, loop):
-    mock_feed.return_value = Bit(0)
+    mock_feed.return_value = 0
     conn = Connection()
     conn._input_connection = (loop, 1)
     ret: Bit = conn.feed()
@@ -33,11 +33,11 @@ def test_feed_error_no_input():
     assert exc.value.args[0] == "The input connection has not been set yet!"
 
 
-@mock.patch.object(Connection, "feed")
+@mock.patch.object(Connection, "_feed_value")
 def test_feed_input_0(mock_feed):
     loop = Loop()
     loop._input_connection = Connection()
-    mock_feed.return_value = Bit(0)
+    mock_feed.return_value = 0
     ret: Bit = loop.feed(index=0)
     assert ret == Bit(0)
     assert loop._memory == Bit(0)
@@ -58,6 +58,14 @@ def test_feed_input_1():
     assert ret == Bit(1)
 
 
+def test_feed_value_input_1():
+    loop = Loop()
+    loop._memory = Bit(1)
+    ret = loop._feed_value(index=1)
+    assert type(ret) is int
+    assert ret == 1
+
+
 def test_loop_has_input_connection_set():
     loop = Loop()
     assert not loop.has_input_connection_set()
@@ -2,6 +2,7 @@ from unittest import mock
 
 import pytest
 
+from Computer.Bit import Bit
 from Computer.LogicCircuit.Connection import (Connection, ConnectionError,
                                               Switch, SwitchError)
 
@@ -29,7 +30,7 @@ def test_switch_feed_error_inputs_not_set():
     assert exc.value.args[0] == "The input connections have not all been set!"
 
 
-@mock.patch.object(Connection, "feed")
+@mock.patch.object(Connection, "_feed_value")
 def test_switch_feed_error_bad_connections(mock_feed, sample_switch):
     mock_feed.side_effect = ConnectionError()
     with pytest.raises(SwitchError) as exc:
@@ -38,16 +39,16 @@ def test_switch_feed_error_bad_connections(mock_feed, sample_switch):
     assert exc.value.args[0] == "It looks like nothing is connected!"
 
 
-@mock.patch.object(Connection, "feed")
+@mock.patch.object(Connection, "_feed_value")
 def test_switch_feed_get_first(mock_feed, sample_switch):
     mock_feed.side_effect = [0, ConnectionError()]
-    assert sample_switch.feed() == 0
+    assert sample_switch.feed() == Bit(0)
 
 
-@mock.patch.object(Connection, "feed")
+@mock.patch.object(Connection, "_feed_value")
 def test_switch_feed_get_second(mock_feed, sample_switch):
     mock_feed.side_effect = [ConnectionError(), 1]
-    assert sample_switch.feed() == 1
+    assert sample_switch.feed() == Bit(1)
 
 
 def test_switch_has_input_connection_set_error_bad_index(sample_switch):
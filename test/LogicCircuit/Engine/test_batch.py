@@ -0,0 +1,44 @@
+import itertools
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit import CircuitError
+from Computer.LogicCircuit.Connection import Loop
+from Computer.LogicCircuit.Engine import compile_circuit, evaluate_many
+
+PATTERNS = list(itertools.product((0, 1), repeat=3))
+
+
+def test_evaluate_many_vectors(full_adder):
+    expected = [full_adder.evaluate(bits) for bits in PATTERNS]
+    assert evaluate_many(full_adder, PATTERNS) == expected
+    assert evaluate_many(full_adder, [[Bit(1), Bit(1), 0]]) == [[Bit(0), Bit(1)]]
+    assert evaluate_many(full_adder, []) == []
+
+
+def test_evaluate_many_program(full_adder):
+    program = compile_circuit(full_adder)
+    assert evaluate_many(program, PATTERNS) == evaluate_many(full_adder, PATTERNS)
+
+    with pytest.raises(CircuitError) as e:
+        evaluate_many(program, [(0, 1)])
+
+    assert str(e.value) == "Vector 0 has 2 values, but the circuit has 3 inputs!"
+
+
+def test_evaluate_many_loop(looped):
+    loop = next(device for device in looped.devices if isinstance(device, Loop))
+    loop._memory = Bit(0)
+    assert evaluate_many(looped, [(1, 1), (0, 1), (1, 0)]) == [
+        [Bit(1)],
+        [Bit(0)],
+        [Bit(0)],
+    ]
+
+
+def test_evaluate_many_error_width(full_adder):
+    with pytest.raises(CircuitError) as e:
+        evaluate_many(full_adder, [(0, 1, 1), (0, 1)])
+
+    assert str(e.value) == "Vector 1 has 2 values, but the circuit has 3 inputs!"
@@ -0,0 +1,45 @@
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Computer.Bit import Bit, BitMatrix  # noqa: E402
+from Computer.LogicCircuit import CircuitError  # noqa: E402
+from Computer.LogicCircuit.Engine import compile_circuit, evaluate_many  # noqa: E402
+
+PATTERNS = list(itertools.product((0, 1), repeat=3))
+
+
+def test_evaluate_many_program_array(full_adder):
+    program = compile_circuit(full_adder)
+    assert evaluate_many(program, np.array(PATTERNS)).tolist() == [
+        [int(bit is Bit.ON) for bit in full_adder.evaluate(bits)]
+        for bits in PATTERNS
+    ]
+
+
+def test_evaluate_many_bit_matrix(full_adder):
+    matrix = BitMatrix.from_ints(range(8), 3)
+    outputs = evaluate_many(full_adder, matrix)
+    assert isinstance(outputs, BitMatrix)
+    assert outputs.shape == (8, 2)
+    # The sum (most significant) and carry bits of the number of ones in each row.
+    counts = [bin(i).count("1") for i in range(8)]
+    assert outputs.to_ints() == [(count & 1) << 1 | count >> 1 for count in counts]
+
+
+def test_evaluate_many_array(full_adder):
+    outputs = evaluate_many(full_adder, np.array(PATTERNS))
+    assert outputs.dtype == np.uint8
+    assert outputs.tolist() == [
+        [int(bit is Bit.ON) for bit in full_adder.evaluate(bits)]
+        for bits in PATTERNS
+    ]
+
+
+def test_evaluate_many_error_width_array(full_adder):
+    with pytest.raises(CircuitError) as e:
+        evaluate_many(full_adder, np.zeros((4, 2)))
+
+    assert str(e.value) == "The batch has 2 columns, but the circuit has 3 inputs!"
@@ -0,0 +1,57 @@
+import pytest
+
+from Computer.LogicCircuit import Circuit
+from Computer.LogicCircuit.Engine import (ProgramError, compile_circuit,
+                                          compile_function, disagreements,
+                                          generate_source)
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def test_generate_source():
+    gate = LogicGate(type=LogicType.NOT)
+    circuit = Circuit()
+    circuit.add_input((gate, 0), name="a")
+    circuit.add_output(gate, name="out")
+
+    assert generate_source(compile_circuit(circuit), name="f") == (
+        "def f(a):\n    t3 = a ^ 1\n    return (t3,)\n"
+    )
+
+
+def test_generate_source_unusable_names():
+    gate = LogicGate(type=LogicType.AND)
+    circuit = Circuit()
+    circuit.add_input((gate, 0), name="a")
+    circuit.add_input((gate, 1), name="t2")
+    circuit.add_output(gate)
+
+    source = generate_source(compile_circuit(circuit))
+    assert source.startswith("def circuit(i0, i1):\n")
+
+
+def test_compile_function(full_adder):
+    function = compile_function(full_adder)
+    assert function.source.startswith("def circuit(a, b, cin):\n")
+    assert function(1, 1, 1) == (1, 1)
+    assert not disagreements(full_adder, lambda vector: function(*vector))
+
+
+def test_compile_function_cached(full_adder, switched):
+    program = compile_circuit(full_adder)
+    assert compile_function(program) is compile_function(program)
+    assert compile_function(full_adder) is compile_function(program)
+    assert compile_function(program) is not compile_function(switched)
+    assert compile_function(program) is not compile_function(program, name="f")
+
+
+@pytest.mark.parametrize("name", ["my circuit", "class", "", "f(); import os; f"])
+def test_compile_function_error_bad_name(full_adder, name):
+    with pytest.raises(ProgramError) as e:
+        compile_function(full_adder, name=name)
+
+    assert str(e.value) == f"{name} is not a valid function name!"
+
+
+def test_compile_function_switch(switched):
+    function = compile_function(switched)
+    assert not disagreements(switched, lambda vector: function(*vector))
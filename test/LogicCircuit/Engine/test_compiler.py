@@ -0,0 +1,103 @@
+import pickle
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit import Circuit
+from Computer.LogicCircuit.Connection import Branch
+from Computer.LogicCircuit.Engine import (CompileError, Op, ProgramError,
+                                          compile_circuit, disagreements)
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def test_compile_full_adder(full_adder):
+    program = compile_circuit(full_adder)
+    assert program.input_names == ("a", "b", "cin")
+    assert program.output_names == ("sum", "cout")
+    # Only the primitive gates are left: two compound xors of four gates, and three.
+    assert len(program) == 11
+    assert program.num_slots == 2 + 3 + 11
+    assert not disagreements(full_adder, program.run)
+    assert program.run([1, 1, 1]) == [1, 1]
+    assert program.evaluate([Bit(1), Bit(0), 0]) == [Bit(1), Bit(0)]
+
+
+def test_compile_switch(switched):
+    program = compile_circuit(switched)
+    assert not disagreements(switched, program.run)
+
+
+def test_compile_not_constant(wire):
+    gate = LogicGate(type=LogicType.NOT)
+    and_0 = LogicGate(type=LogicType.AND)
+    wire(gate, and_0, pin=0)
+    and_0.set_input_pin(value=Bit(1), pin=1)
+    circuit = Circuit()
+    circuit.add_input((gate, 0))
+    circuit.add_output(and_0)
+
+    program = compile_circuit(circuit)
+    # NOT reads the constant-one slot; the constant pin reads it too.
+    assert program.instructions == ((Op.XOR, 2, 1, 3), (Op.AND, 3, 1, 4))
+    assert program.run([0]) == [1]
+    assert program.run([1]) == [0]
+
+
+def test_compile_branch_mapping(wire):
+    a = LogicGate(type=LogicType.NOT)
+    b = LogicGate(type=LogicType.NOT)
+    and_0 = LogicGate(type=LogicType.AND)
+    branch = Branch()
+    wire(a, branch)
+    wire(b, branch)
+    # The outputs are crossed over.
+    out_0 = LogicGate(type=LogicType.NOT)
+    out_1 = LogicGate(type=LogicType.NOT)
+    wire(branch, out_0)
+    wire(branch, out_1)
+    branch.set_mapping(mapping={0: 1, 1: 0})
+    wire(out_0, and_0, pin=0)
+    b.set_input_pin(value=Bit(0), pin=0)
+    circuit = Circuit()
+    circuit.add_input((a, 0), name="a")
+    circuit.add_input((and_0, 1), name="en")
+    circuit.add_output(out_1)
+    circuit.add_output(and_0)
+
+    assert not disagreements(circuit, compile_circuit(circuit).run)
+
+
+def test_compile_loop(looped):
+    with pytest.raises(CompileError) as e:
+        compile_circuit(looped)
+
+    assert str(e.value) == "The circuit has a loop, and loops can't be compiled!"
+
+
+def test_run_wrong_number_of_inputs(full_adder):
+    with pytest.raises(ProgramError) as e:
+        compile_circuit(full_adder).run([0, 1])
+
+    assert str(e.value) == "The program has 3 inputs, but 2 values were given!"
+
+
+def test_program_pickle(full_adder):
+    program = compile_circuit(full_adder)
+    copy = pickle.loads(pickle.dumps(program))
+    assert copy.instructions == program.instructions
+    assert not disagreements(full_adder, copy.run)
+    assert copy == program
+    assert hash(copy) == hash(program)
+
+
+def test_program_equality(full_adder, switched):
+    program = compile_circuit(full_adder)
+    assert compile_circuit(full_adder) == program
+    assert compile_circuit(switched) != program
+    assert len({program, compile_circuit(full_adder)}) == 1
+
+
+def test_disagreements(full_adder):
+    vectors = [(1, 0, 0), (0, 0, 0)]
+    mismatches = disagreements(full_adder, lambda vector: [0, 0], vectors)
+    assert mismatches == [((1, 0, 0), [1, 0], [0, 0])]
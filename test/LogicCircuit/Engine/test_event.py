@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from Computer.LogicCircuit import Circuit
+from Computer.LogicCircuit.Engine import (EventSimulator, ProgramError,
+                                          compile_circuit)
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def test_event_simulator_agrees(full_adder):
+    program = compile_circuit(full_adder)
+    simulator = EventSimulator(program)
+    assert simulator.outputs == program.run([0, 0, 0])
+    assert simulator.evaluations == len(program)
+
+    rng = random.Random(0)
+    for _ in range(200):
+        changes = {rng.randrange(3): rng.getrandbits(1) for _ in range(2)}
+        outputs = simulator.set(changes)
+        assert outputs == program.run(simulator.inputs)
+
+
+def test_event_simulator_stops_propagation(wire):
+    """a AND (a chain of 99 NOT gates reading b)."""
+
+    gate = LogicGate(type=LogicType.NOT)
+    first = gate
+    for _ in range(98):
+        upper = LogicGate(type=LogicType.NOT)
+        wire(gate, upper)
+        gate = upper
+
+    and_0 = LogicGate(type=LogicType.AND)
+    wire(gate, and_0, pin=1)
+    circuit = Circuit()
+    circuit.add_input((and_0, 0), name="a")
+    circuit.add_input((first, 0), name="b")
+    circuit.add_output(and_0)
+
+    simulator = EventSimulator(circuit, [0, 0])
+    assert simulator.evaluations == 100
+
+    # Toggling a only evaluates the AND gate.
+    assert simulator.toggle(0) == [1]
+    assert simulator.evaluations == 101
+
+    # Toggling b goes down the whole chain.
+    assert simulator.toggle(1) == [0]
+    assert simulator.evaluations == 201
+
+    # Setting an input to the value it already has evaluates nothing.
+    assert simulator.set({1: 1}) == [0]
+    assert simulator.evaluations == 201
+
+    assert simulator.reset([1, 0]) == [1]
+    assert simulator.evaluations == 301
+
+
+def test_event_simulator_errors(full_adder):
+    with pytest.raises(ProgramError) as e:
+        EventSimulator(full_adder, [0, 1])
+
+    assert str(e.value) == "The program has 3 inputs, but 2 values were given!"
+
+    simulator = EventSimulator(full_adder)
+    with pytest.raises(ProgramError) as e:
+        simulator.toggle(3)
+
+    assert str(e.value) == "The program has no input 3!"
+
+    with pytest.raises(ProgramError) as e:
+        simulator.set({-1: 1})
+
+    assert str(e.value) == "The program has no input -1!"
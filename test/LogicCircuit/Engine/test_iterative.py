@@ -0,0 +1,90 @@
+import itertools
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit import CompoundGate, CompoundType
+from Computer.LogicCircuit.Connection import (Branch, Connection, Loop, LoopError,
+                                              Switch)
+from Computer.LogicCircuit.Engine import EvaluationError, evaluate_iterative
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicGateError, LogicType
+
+
+def test_evaluate_iterative_deep_chain(wire):
+    first = LogicGate(type=LogicType.NOT)
+    first.set_input_pin(value=Bit(0), pin=0)
+    gate = first
+    for _ in range(9_999):
+        branch = Branch()
+        wire(gate, branch)
+        gate = LogicGate(type=LogicType.NOT)
+        wire(branch, gate)
+        branch.set_mapping(mapping={0: 0})
+
+    assert evaluate_iterative(gate) == Bit(0)
+    with pytest.raises(RecursionError):
+        gate.get_output_pin()
+
+
+def test_evaluate_iterative_full_adder(full_adder):
+    out = full_adder._output_devices
+    for bits in itertools.product((0, 1), repeat=3):
+        expected = full_adder.evaluate(bits)
+        assert [evaluate_iterative(gate) for gate in out] == expected
+
+
+def test_evaluate_iterative_compound():
+    gate = CompoundGate(type=CompoundType.XOR)
+    gate.set_input_pin(value=Bit(1), pin=0)
+    gate.set_input_pin(value=Bit(0), pin=1)
+    assert evaluate_iterative(gate) == gate.get_output_pin() == Bit(1)
+
+
+def test_evaluate_iterative_switch_fallback(wire):
+    unset = LogicGate(type=LogicType.NOT)
+    fallback = LogicGate(type=LogicType.NOT)
+    fallback.set_input_pin(value=Bit(1), pin=0)
+    out = LogicGate(type=LogicType.NOT)
+    switch = Switch()
+    wire(unset, switch, pin=0)
+    wire(fallback, switch, pin=1)
+    wire(switch, out)
+
+    assert evaluate_iterative(out) == out.get_output_pin() == Bit(1)
+
+
+def test_evaluate_iterative_loop(wire):
+    or_0 = LogicGate(type=LogicType.OR)
+    out = LogicGate(type=LogicType.NOT)
+    loop = Loop()
+    wire(or_0, loop)
+    wire(loop, out, port=0)
+    wire(loop, or_0, pin=1, port=1)
+    or_0.set_input_pin(value=Bit(1), pin=0)
+
+    # Nothing has gone through the loop yet, so there is nothing to feed back.
+    with pytest.raises(LoopError):
+        evaluate_iterative(out)
+
+    loop._memory = Bit(0)
+    assert evaluate_iterative(out) == out.get_output_pin() == Bit(0)
+
+
+def test_evaluate_iterative_error():
+    gate = LogicGate(type=LogicType.AND)
+    gate.set_input_pin(value=Bit(1), pin=0)
+    with pytest.raises(LogicGateError) as e:
+        evaluate_iterative(gate)
+
+    assert str(e.value) == "Pin 1 has not been set yet!"
+
+
+def test_evaluate_iterative_cycle():
+    gate = LogicGate(type=LogicType.NOT)
+    conn = Connection()
+    conn.set_input_connection(device=gate)
+    conn.set_output_connection(device=gate, index=0)
+    with pytest.raises(EvaluationError) as e:
+        evaluate_iterative(gate)
+
+    assert str(e.value) == "The circuit has a cycle that doesn't go through a loop!"
@@ -0,0 +1,67 @@
+import itertools
+import random
+
+import pytest
+
+from Computer.LogicCircuit import Circuit, CompoundGate, CompoundType
+from Computer.LogicCircuit.Engine import (ProgramError, compile_circuit,
+                                          exhaustive_patterns, pack, run_exhaustive,
+                                          run_parallel, unpack)
+
+
+def test_pack_unpack():
+    vectors = [[0, 1, 1], [1, 0, 1]]
+    assert pack(vectors, 3) == [0b10, 0b01, 0b11]
+    assert unpack(pack(vectors, 3), 2) == vectors
+    assert unpack([], 0) == []
+
+
+def test_pack_error_width():
+    with pytest.raises(ProgramError) as e:
+        pack([[0, 1], [1]], 2)
+
+    assert str(e.value) == "Vector 1 has 1 values, but the program has 2 inputs!"
+
+
+@pytest.mark.parametrize("width", [0, 1, 3, 5])
+def test_exhaustive_patterns(width):
+    patterns = list(itertools.product((0, 1), repeat=width))
+    assert exhaustive_patterns(width) == pack(patterns, width)
+
+
+def test_run_parallel(full_adder):
+    program = compile_circuit(full_adder)
+    rng = random.Random(0)
+    vectors = [[rng.getrandbits(1) for _ in range(3)] for _ in range(1_000)]
+    words = run_parallel(program, pack(vectors, 3), len(vectors))
+    assert unpack(words, len(vectors)) == [program.run(v) for v in vectors]
+
+
+def test_run_parallel_error_width(full_adder):
+    with pytest.raises(ProgramError) as e:
+        run_parallel(compile_circuit(full_adder), [0, 0], 1)
+
+    assert str(e.value) == "The program has 3 inputs, but 2 words were given!"
+
+
+def test_run_exhaustive_xor_tree(wire):
+    """A 16-input parity tree of compound xors, in a single pass."""
+
+    leaves = [CompoundGate(type=CompoundType.XOR) for _ in range(8)]
+    level = leaves
+    while len(level) > 1:
+        upper = [CompoundGate(type=CompoundType.XOR) for _ in range(len(level) // 2)]
+        for i, gate in enumerate(level):
+            wire(gate, upper[i // 2], pin=i % 2)
+
+        level = upper
+
+    circuit = Circuit()
+    for gate in leaves:
+        circuit.add_input((gate, 0))
+        circuit.add_input((gate, 1))
+
+    circuit.add_output(level[0])
+
+    (parity,) = run_exhaustive(compile_circuit(circuit))
+    assert parity == sum(bin(k).count("1") % 2 << k for k in range(1 << 16))
@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from Computer.LogicCircuit.Engine import (ProgramError, ShardedRunner,
+                                          compile_circuit, run_exhaustive)
+
+
+@pytest.fixture
+def vectors():
+    rng = random.Random(0)
+    return [[rng.getrandbits(1) for _ in range(3)] for _ in range(1_000)]
+
+
+def test_sharded_runner_run(full_adder, vectors):
+    program = compile_circuit(full_adder)
+    with ShardedRunner(full_adder, workers=2, shard_size=64) as runner:
+        assert runner.workers == 2
+        assert runner.shard_size == 64
+        assert runner.run(vectors) == [program.run(vector) for vector in vectors]
+        assert runner.run([]) == []
+
+
+@pytest.mark.parametrize("shard_size", [1, 2, 8, 1_000])
+def test_sharded_runner_run_exhaustive(full_adder, shard_size):
+    program = compile_circuit(full_adder)
+    with ShardedRunner(program, workers=2, shard_size=shard_size) as runner:
+        assert runner.run_exhaustive() == run_exhaustive(program)
+
+
+def test_sharded_runner_errors(full_adder):
+    with pytest.raises(ProgramError) as e:
+        ShardedRunner(full_adder, shard_size=0)
+
+    assert str(e.value) == "The shard size needs to be positive!"
+
+    with ShardedRunner(full_adder, workers=1) as runner:
+        with pytest.raises(ProgramError) as e:
+            runner.run([[0, 1, 1], [0, 1]])
+
+    assert str(e.value) == "Vector 1 has 2 values, but the program has 3 inputs!"
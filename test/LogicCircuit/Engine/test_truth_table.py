@@ -0,0 +1,43 @@
+import pytest
+
+from Computer.Bit import PackedBitString
+from Computer.LogicCircuit import Circuit, CompoundGate, CompoundType
+from Computer.LogicCircuit.Engine import (compile_circuit, run_exhaustive,
+                                          truth_table)
+
+
+def test_truth_table_full_adder(full_adder):
+    total, carry = truth_table(full_adder)
+    assert isinstance(total, PackedBitString)
+    assert total.to_text() == "01101001"
+    assert carry.to_text() == "00010111"
+
+
+@pytest.mark.parametrize(
+    "type, expected",
+    [
+        (CompoundType.NAND, "1110"),
+        (CompoundType.NOR, "1000"),
+        (CompoundType.XOR, "0110"),
+        (CompoundType.XNOR, "1001"),
+    ],
+)
+def test_truth_table_compound(type, expected):
+    gate = CompoundGate(type=type)
+    circuit = Circuit()
+    circuit.add_input((gate, 0))
+    circuit.add_input((gate, 1))
+    circuit.add_output(gate)
+    (table,) = truth_table(circuit)
+    assert table.to_text() == expected
+
+
+def test_truth_table_agrees(full_adder, switched):
+    for circuit in (full_adder, switched):
+        program = compile_circuit(circuit)
+        words = run_exhaustive(program)
+        count = 1 << len(program.input_slots)
+        # `run_exhaustive` puts pattern `k` in bit `k`, so it reads backwards.
+        assert [table.to_text() for table in truth_table(program)] == [
+            format(word, f"0{count}b")[::-1] for word in words
+        ]
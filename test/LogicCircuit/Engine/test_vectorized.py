@@ -0,0 +1,38 @@
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from Computer.LogicCircuit.Engine import (ProgramError,  # noqa: E402
+                                          compile_circuit, run_vectorized)
+
+
+def test_run_vectorized(full_adder):
+    program = compile_circuit(full_adder)
+    array = np.array(list(itertools.product((0, 1), repeat=3)))
+    outputs = run_vectorized(program, array)
+    assert outputs.dtype == np.uint8
+    assert outputs.tolist() == [program.run(row) for row in array.tolist()]
+
+
+@pytest.mark.parametrize("rows", [0, 1, 63, 64, 65, 1_000])
+def test_run_vectorized_rows(full_adder, rows):
+    program = compile_circuit(full_adder)
+    array = np.random.default_rng(rows).integers(0, 2, size=(rows, 3))
+    outputs = run_vectorized(program, array.astype(bool))
+    assert outputs.shape == (rows, 2)
+    assert outputs.tolist() == [program.run(row) for row in array.tolist()]
+
+
+def test_run_vectorized_switch(switched):
+    program = compile_circuit(switched)
+    array = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    assert run_vectorized(program, array).tolist() == [[0], [1], [0], [0]]
+
+
+def test_run_vectorized_error_width(full_adder):
+    with pytest.raises(ProgramError) as e:
+        run_vectorized(compile_circuit(full_adder), np.zeros((4, 2)))
+
+    assert str(e.value) == "The batch has 2 columns, but the program has 3 inputs!"
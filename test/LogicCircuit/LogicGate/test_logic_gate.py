@@ -4,11 +4,37 @@ from typing import List
 import pytest
 
 from Computer.Bit import Bit
+from Computer.LogicCircuit.abc import IConnection
 from Computer.LogicCircuit.Connection import Connection
 from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
 from Computer.LogicCircuit.LogicGate.logic_gate import LogicGateError
 
 
+class Wire(IConnection):
+    """A connection from outside the package that only implements `feed`."""
+
+    def __init__(self, bit):
+        self._bit = bit
+
+    def feed(self):
+        return self._bit
+
+    def has_input_connection_set(self):
+        return True
+
+    def has_output_connection_set(self):
+        return True
+
+    def reset(self):
+        pass
+
+    def set_input_connection(self, *, device, index=0):
+        pass
+
+    def set_output_connection(self, *, device, index):
+        pass
+
+
 class TestLogicGates:
     gate = collections.namedtuple("gate", ["gtype", "name", "num"])
 
@@ -102,6 +128,37 @@ class TestLogicGates:
             gates._input_pins = [None] * config.num
             gates._output_pin = None
 
+    def test_logic_gate_get_output_value_through_connections(self):
+        gate_1 = LogicGate(type=LogicType.AND)
+        gate_1._input_pins = [Bit(1), Bit(1)]
+        gate_2 = LogicGate(type=LogicType.NOT)
+        conn = Connection()
+        conn._input_connection = gate_1
+        gate_2._input_pins = [conn]
+
+        ret = gate_2._get_output_value()
+        assert type(ret) is int
+        assert ret == 0
+        assert gate_2.get_output_pin() is Bit.OFF
+
+    @pytest.mark.parametrize("config", [and_gate, or_gate])
+    def test_logic_gate_get_output_value_bits(self, config):
+        gate = LogicGate(type=config.gtype, name=config.name)
+        gate._input_pins = [Bit(1), Bit(1)]
+
+        ret = gate._get_output_value()
+        assert type(ret) is int
+        assert ret == 1
+
+    def test_logic_gate_get_output_value_foreign_connection(self):
+        gate = LogicGate(type=LogicType.OR)
+        gate._input_pins = [Wire(Bit(0)), Wire(Bit(1))]
+
+        ret = gate._get_output_value()
+        assert type(ret) is int
+        assert ret == 1
+        assert gate.get_output_pin() is Bit.ON
+
     def test_logic_gate_has_input_pin_set_error_bad_pin(self):
         gate = LogicGate(type=LogicType.AND)
         with pytest.raises(LogicGateError) as exc:
@@ -0,0 +1,83 @@
+import pytest
+
+from Computer.LogicCircuit import Circuit, CompoundGate, CompoundType
+from Computer.LogicCircuit.Connection import Branch, Connection, Loop, Switch
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def wire(source, target, pin=0, port=0):
+    conn = Connection()
+    conn.set_input_connection(device=source, index=port)
+    conn.set_output_connection(device=target, index=pin)
+    return conn
+
+
+@pytest.fixture(name="wire")
+def wire_fixture():
+    """Connects output `port` of one device to input `pin` of another."""
+
+    return wire
+
+
+@pytest.fixture
+def full_adder():
+    """a, b, carry-in -> sum, carry-out, built from compound and primitive gates."""
+
+    xor_0 = CompoundGate(type=CompoundType.XOR, name="xor_0")
+    xor_1 = CompoundGate(type=CompoundType.XOR, name="xor_1")
+    and_0 = LogicGate(type=LogicType.AND, name="and_0")
+    and_1 = LogicGate(type=LogicType.AND, name="and_1")
+    or_0 = LogicGate(type=LogicType.OR, name="or_0")
+
+    # The partial sum goes to both the second xor and the second and, via a branch.
+    branch = Branch()
+    wire(xor_0, branch)
+    wire(branch, xor_1, pin=0)
+    wire(branch, and_1, pin=0)
+    branch.set_mapping(mapping={0: 0, 1: 0})
+
+    wire(and_0, or_0, pin=0)
+    wire(and_1, or_0, pin=1)
+
+    circuit = Circuit()
+    circuit.add_input((xor_0, 0), (and_0, 0), name="a")
+    circuit.add_input((xor_0, 1), (and_0, 1), name="b")
+    circuit.add_input((xor_1, 1), (and_1, 1), name="cin")
+    circuit.add_output(xor_1, name="sum")
+    circuit.add_output(or_0, name="cout")
+    return circuit
+
+
+@pytest.fixture
+def switched():
+    """a, b -> not(a) through a switch whose second input is never connected."""
+
+    not_0 = LogicGate(type=LogicType.NOT, name="not_0")
+    and_0 = LogicGate(type=LogicType.AND, name="and_0")
+    switch = Switch()
+    wire(not_0, switch, pin=0)
+    wire(switch, and_0, pin=0)
+
+    circuit = Circuit()
+    circuit.add_input((not_0, 0), name="a")
+    circuit.add_input((and_0, 1), name="b")
+    circuit.add_output(and_0, name="out")
+    return circuit
+
+
+@pytest.fixture
+def looped():
+    """a, en -> a latch feeding back through a loop (its netlist only)."""
+
+    or_0 = LogicGate(type=LogicType.OR, name="or_0")
+    and_0 = LogicGate(type=LogicType.AND, name="and_0")
+    loop = Loop()
+    wire(or_0, loop)
+    wire(loop, and_0, pin=0, port=0)
+    wire(loop, or_0, pin=1, port=1)
+
+    circuit = Circuit()
+    circuit.add_input((or_0, 0), name="a")
+    circuit.add_input((and_0, 1), name="en")
+    circuit.add_output(and_0, name="out")
+    return circuit
@@ -0,0 +1,170 @@
+import itertools
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.LogicCircuit import (Circuit, CircuitError, CompoundGate,
+                                   CompoundType, Source, SourceKind)
+from Computer.LogicCircuit.Connection import Branch, Connection, Loop, Switch
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def all_patterns(width):
+    return [list(bits) for bits in itertools.product((0, 1), repeat=width)]
+
+
+def test_circuit_full_adder_evaluate(full_adder):
+    assert full_adder.input_names == ["a", "b", "cin"]
+    assert full_adder.output_names == ["sum", "cout"]
+    assert [len(pins) for pins in full_adder.input_pins] == [3, 3, 3]
+    for a, b, cin in all_patterns(3):
+        total = a + b + cin
+        assert full_adder.evaluate([a, b, cin]) == [Bit(total & 1), Bit(total >> 1)]
+
+
+def test_circuit_full_adder_netlist(full_adder):
+    devices = full_adder.devices
+    # Each xor is four gates and three wires inside.
+    assert len(full_adder) == len(devices) == 23
+    assert sum(isinstance(d, LogicGate) for d in devices) == 4 + 4 + 3
+    assert sum(type(d) is Connection for d in devices) == 3 + 3 + 5
+    assert sum(isinstance(d, Branch) for d in devices) == 1
+
+    # Ids are dense and topologically ordered.
+    assert [full_adder.id_of(d) for d in devices] == list(range(23))
+    for d, row in enumerate(full_adder.fanin):
+        assert all(s < d for s in row)
+        for s in row:
+            assert d in full_adder.fanout[s]
+
+    assert [devices[d].name for d in full_adder.output_ids] == ["and_1", "or_0"]
+
+
+def test_circuit_sources(full_adder):
+    kinds = {s.kind for row in full_adder.sources for s in row}
+    assert kinds == {SourceKind.DEVICE, SourceKind.INPUT}
+
+    inputs = sorted(
+        s.index for row in full_adder.sources for s in row if s.kind is SourceKind.INPUT
+    )
+    # The xor gates each use every input pin twice.
+    assert inputs == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+
+    branch = next(d for d in full_adder.devices if isinstance(d, Branch))
+    ports = [
+        s.port
+        for row in full_adder.sources
+        for s in row
+        if s.kind is SourceKind.DEVICE and s.index == full_adder.id_of(branch)
+    ]
+    assert sorted(ports) == [0, 1]
+
+
+def test_circuit_constant_pins():
+    gate = LogicGate(type=LogicType.AND)
+    gate.set_input_pin(value=Bit(1), pin=1)
+    circuit = Circuit()
+    circuit.add_input((gate, 0), name="a")
+    circuit.add_output(gate)
+    assert circuit.output_names == ["out0"]
+    assert circuit.sources == [
+        (Source(SourceKind.INPUT, 0), Source(SourceKind.CONSTANT, 1))
+    ]
+    assert circuit.evaluate([Bit(1)]) == [Bit(1)]
+    assert circuit.evaluate([0]) == [Bit(0)]
+
+
+def test_circuit_switch(switched):
+    assert any(isinstance(d, Switch) for d in switched.devices)
+    for a, b in all_patterns(2):
+        assert switched.evaluate([a, b]) == [Bit((1 - a) & b)]
+
+
+def test_circuit_loop(looped):
+    loop = next(d for d in looped.devices if isinstance(d, Loop))
+    loop_id = looped.id_of(loop)
+    readers = [
+        (d, s.port)
+        for d, row in enumerate(looped.sources)
+        for s in row
+        if s.kind is SourceKind.DEVICE and s.index == loop_id
+    ]
+    assert sorted(port for _, port in readers) == [0, 1]
+    for d, port in readers:
+        if port == 0:
+            assert d > loop_id
+        else:
+            assert d < loop_id
+
+
+def test_circuit_from_gate():
+    nand = CompoundGate(type=CompoundType.NAND, name="nand")
+    nand.set_input_pin(value=Bit(1), pin=0)
+    nand.set_input_pin(value=Bit(1), pin=1)
+    circuit = Circuit.from_gate(nand, name="q")
+    assert circuit.input_names == ["and_0.0", "and_0.1"]
+    assert circuit.output_names == ["q"]
+    for a, b in all_patterns(2):
+        assert circuit.evaluate([a, b]) == [Bit(1 - (a & b))]
+
+
+def test_circuit_error_unset_pin():
+    gate = LogicGate(type=LogicType.NOT, name="foo")
+    circuit = Circuit()
+    circuit.add_output(gate)
+    with pytest.raises(CircuitError) as exc:
+        circuit.devices
+
+    assert exc.value.args[0] == "Pin 0 of foo has not been set yet!"
+
+
+def test_circuit_error_input_on_wire(wire):
+    gate_0 = LogicGate(type=LogicType.NOT)
+    gate_1 = LogicGate(type=LogicType.NOT, name="bar")
+    gate_0.set_input_pin(value=Bit(0), pin=0)
+    wire(gate_0, gate_1)
+    circuit = Circuit()
+    circuit.add_input((gate_1, 0))
+    circuit.add_output(gate_1)
+    with pytest.raises(CircuitError) as exc:
+        circuit.devices
+
+    assert exc.value.args[0] == (
+        "Pin 0 of bar is connected to a wire, so it can't be a primary input!"
+    )
+
+
+def test_circuit_error_no_targets():
+    with pytest.raises(CircuitError) as exc:
+        Circuit().add_input()
+
+    assert exc.value.args[0] == "An input needs to drive at least one pin!"
+
+
+def test_circuit_error_wrong_number_of_values(full_adder):
+    with pytest.raises(CircuitError) as exc:
+        full_adder.evaluate([1, 0])
+
+    assert exc.value.args[0] == "The circuit has 3 inputs, but 2 values were given!"
+
+
+def test_circuit_error_unknown_device(full_adder):
+    with pytest.raises(CircuitError) as exc:
+        full_adder.id_of(LogicGate(type=LogicType.NOT))
+
+    assert exc.value.args[0] == "That device isn't part of this circuit!"
+
+
+def test_circuit_deep_chain(wire):
+    gate = LogicGate(type=LogicType.NOT)
+    first = gate
+    for _ in range(5_000):
+        nxt = LogicGate(type=LogicType.NOT)
+        wire(gate, nxt)
+        gate = nxt
+
+    circuit = Circuit()
+    circuit.add_input((first, 0))
+    circuit.add_output(gate)
+    assert len(circuit) == 10_001
+    assert circuit.id_of(first) == 0
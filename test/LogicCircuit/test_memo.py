@@ -0,0 +1,86 @@
+import itertools
+
+import pytest
+
+from Computer.Bit import Bit
+from Computer.Logger import EventKind, TraceRecorder
+from Computer.LogicCircuit import Memo
+from Computer.LogicCircuit.Connection import Branch
+from Computer.LogicCircuit.LogicGate import LogicGate, LogicType
+
+
+def diamonds(wire, stages):
+    """Each stage splits a signal in two and joins it back together."""
+
+    first = LogicGate(type=LogicType.NOT, name="first")
+    gate = first
+    for _ in range(stages):
+        left = LogicGate(type=LogicType.NOT)
+        right = LogicGate(type=LogicType.NOT)
+        join = LogicGate(type=LogicType.AND)
+        branch = Branch()
+        wire(gate, branch)
+        wire(branch, left)
+        wire(branch, right)
+        branch.set_mapping(mapping={0: 0, 1: 0})
+        wire(left, join, pin=0)
+        wire(right, join, pin=1)
+        gate = join
+
+    return first, gate
+
+
+def count_outputs(gate):
+    with TraceRecorder(capacity=1 << 16) as recorder:
+        ret = gate.get_output_pin()
+
+    return ret, sum(event[2] is EventKind.OUTPUT for event in recorder.events())
+
+
+@pytest.fixture(autouse=True)
+def memo_off():
+    yield
+    Memo.disable()
+
+
+def test_memo_off_by_default():
+    assert not Memo.enabled
+
+
+def test_memo_diamonds(wire):
+    first, last = diamonds(wire, 8)
+    first.set_input_pin(value=Bit(0), pin=0)
+
+    ret, evaluations = count_outputs(last)
+    assert ret == Bit(1)
+    # Each stage is evaluated twice as often as the one after it.
+    assert evaluations == 3 * (2**8 - 1) + 2**8
+
+    Memo.enable()
+    ret, evaluations = count_outputs(last)
+    assert ret == Bit(1)
+    assert evaluations == 1 + 3 * 8
+    # Every second read of a branch's input wire is served from the cache.
+    assert Memo.saved == 8
+
+
+def test_memo_new_epoch_per_evaluation(wire):
+    first, last = diamonds(wire, 2)
+    Memo.enable()
+    first.set_input_pin(value=Bit(0), pin=0)
+    assert last.get_output_pin() == Bit(1)
+
+    first.reset(which="input")
+    first.set_input_pin(value=Bit(1), pin=0)
+    assert last.get_output_pin() == Bit(0)
+
+
+def test_memo_circuit_agrees(full_adder):
+    expected = [
+        full_adder.evaluate(bits) for bits in itertools.product((0, 1), repeat=3)
+    ]
+    Memo.enable()
+    assert [
+        full_adder.evaluate(bits) for bits in itertools.product((0, 1), repeat=3)
+    ] == expected
+    assert Memo.saved > 0